@@ -0,0 +1,184 @@
+import numpy as np
+from TELEMETRY_PARSER import FLAG_LEFT_WHITE, FLAG_RIGHT_WHITE, LOSS_NONE, LOSS_LEFT, LOSS_RIGHT, LOSS_CHARS
+
+
+# ===== CONTROL STATES =====
+# The four cases of STEP 3 (bang-bang control) in FINALArduino.ino
+STATE_STRAIGHT = 0     # Both white:            forward / forward          (Out:0)
+STATE_TURN_LEFT = 1    # Left black, right white: turn speed on the left  (Out:-1)
+STATE_TURN_RIGHT = 2   # Left white, right black: turn speed on the right (Out:+1)
+STATE_SEARCH = 3       # Both black: line lost, searching
+STATE_NAMES = ('straight', 'turn_left', 'turn_right', 'search')
+
+EPISODE_DTYPE = np.dtype([
+    ('start', '<i8'),        # First sample with both sensors black
+    ('end', '<i8'),          # First sample after the episode (== len when not recovered)
+    ('t_start_ns', '<i8'),
+    ('recover_ns', '<i8'),   # Time until a sensor sees the line again, -1 if never
+    ('side', 'i1'),          # Sensor that went black first: LOSS_LEFT / LOSS_RIGHT / LOSS_NONE (both at once)
+    ('firmware_loss', 'i1'), # Loss code the firmware reported at the start (left/right_lost_first)
+])
+
+
+def control_states(columns):
+    """Per-sample control state (STATE_*) from the white/black flags"""
+    flags = columns['flags']
+    left_black = (flags & FLAG_LEFT_WHITE) == 0
+    right_black = (flags & FLAG_RIGHT_WHITE) == 0
+    states = (left_black & ~right_black) * STATE_TURN_LEFT \
+        + (~left_black & right_black) * STATE_TURN_RIGHT \
+        + (left_black & right_black) * STATE_SEARCH
+    return states.astype(np.int8)
+
+
+def sample_durations(t_ns):
+    """
+    Time each sample stands for (ns): gap to the next sample, the last one gets the median gap
+    Samples received in one serial chunk share a timestamp, so their gaps are spread
+    evenly over the chunk
+    """
+    t_ns = np.asarray(t_ns, dtype=np.int64)
+    if len(t_ns) < 2:
+        return np.zeros(len(t_ns))
+    # Index of the first sample of each run of equal timestamps, then even spacing inside runs
+    new_run = np.empty(len(t_ns), dtype=bool)
+    new_run[0] = True
+    np.not_equal(t_ns[1:], t_ns[:-1], out=new_run[1:])
+    run_starts = np.flatnonzero(new_run)
+    run_lengths = np.diff(np.append(run_starts, len(t_ns)))
+    run_gaps = np.diff(t_ns[run_starts]).astype(np.float64)
+    if len(run_gaps):
+        run_gaps = np.append(run_gaps, np.median(run_gaps))
+    else:
+        run_gaps = np.zeros(1)
+    return np.repeat(run_gaps / run_lengths, run_lengths)
+
+
+def time_in_state(columns, states=None, durations=None):
+    """Seconds spent in each control state: {'straight': s, 'turn_left': s, ...}"""
+    states = control_states(columns) if states is None else states
+    durations = sample_durations(columns['t_ns']) if durations is None else durations
+    seconds = np.bincount(states, weights=durations, minlength=len(STATE_NAMES)) / 1e9
+    return dict(zip(STATE_NAMES, seconds.tolist()))
+
+
+def line_loss_episodes(columns, states=None):
+    """
+    Every line-loss episode (run of samples with both sensors black) as an EPISODE_DTYPE array
+
+    side comes from the sample before the episode: if only the left sensor was black
+    (turning left) the left lost the line first, and so on; straight -> both at once.
+    """
+    states = control_states(columns) if states is None else states
+    t_ns = columns['t_ns']
+    search = (states == STATE_SEARCH).astype(np.int8)
+    edges = np.diff(search, prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    episodes = np.zeros(len(starts), dtype=EPISODE_DTYPE)
+    if len(starts) == 0:
+        return episodes
+    episodes['start'] = starts
+    episodes['end'] = ends
+    episodes['t_start_ns'] = t_ns[starts]
+
+    recovered = ends < len(t_ns)
+    episodes['recover_ns'] = -1
+    episodes['recover_ns'][recovered] = t_ns[ends[recovered]] - t_ns[starts[recovered]]
+
+    before = np.where(starts > 0, states[np.maximum(starts - 1, 0)], STATE_STRAIGHT)
+    side_of_state = np.array([LOSS_NONE, LOSS_LEFT, LOSS_RIGHT, LOSS_NONE], dtype=np.int8)
+    episodes['side'] = side_of_state[before]
+    episodes['firmware_loss'] = columns['loss'][starts]
+    return episodes
+
+
+def lap_summary(columns, lap_boundaries_ns, states=None, durations=None):
+    """
+    Per-lap totals for laps split at lap_boundaries_ns (e.g. stopwatch lap times)
+    Returns a dict of arrays (one entry per lap): duration_s, samples, episodes and
+    seconds in every state
+    """
+    states = control_states(columns) if states is None else states
+    durations = sample_durations(columns['t_ns']) if durations is None else durations
+    bounds = np.searchsorted(columns['t_ns'], np.asarray(lap_boundaries_ns, dtype=np.int64))
+    starts, ends = bounds[:-1], bounds[1:]
+    valid = ends > starts
+    starts, ends = starts[valid], ends[valid]
+    if len(starts) == 0:
+        return {'duration_s': np.empty(0), 'samples': np.empty(0, dtype=np.int64),
+                'episodes': np.empty(0, dtype=np.int64), **{name: np.empty(0) for name in STATE_NAMES}}
+
+    # One reduceat per quantity over the lap start indices
+    one_hot = np.zeros((len(states), len(STATE_NAMES)))
+    one_hot[np.arange(len(states)), states] = durations
+    per_lap = np.add.reduceat(one_hot[:ends[-1]], starts, axis=0) / 1e9
+    episode_starts = np.zeros(len(states), dtype=np.int64)
+    episode_starts[line_loss_episodes(columns, states)['start']] = 1
+    summary = {
+        'duration_s': np.add.reduceat(durations[:ends[-1]], starts) / 1e9,
+        'samples': ends - starts,
+        'episodes': np.add.reduceat(episode_starts[:ends[-1]], starts),
+    }
+    summary.update({name: per_lap[:, i] for i, name in enumerate(STATE_NAMES)})
+    return summary
+
+
+def summarize(columns):
+    """Whole-session report: time in state, episode counts by side, recovery percentiles"""
+    states = control_states(columns)
+    durations = sample_durations(columns['t_ns'])
+    episodes = line_loss_episodes(columns, states)
+    recovered = episodes['recover_ns'][episodes['recover_ns'] >= 0] / 1e6
+    side_counts = np.bincount(episodes['side'], minlength=len(LOSS_CHARS))
+    return {
+        'samples': len(states),
+        'duration_s': float(durations.sum() / 1e9),
+        'time_in_state_s': time_in_state(columns, states, durations),
+        'episodes': len(episodes),
+        'episodes_by_side': {'left': int(side_counts[LOSS_LEFT]), 'right': int(side_counts[LOSS_RIGHT]),
+                             'both': int(side_counts[LOSS_NONE])},
+        'unrecovered': int((episodes['recover_ns'] < 0).sum()),
+        'recover_ms': {p: float(np.percentile(recovered, p)) if len(recovered) else 0.0 for p in (50, 95, 100)},
+    }
+
+
+def load_columns(path):
+    """Sample columns from a session log (.mxlog) or an archive (.mxarc)"""
+    if path.endswith('.mxarc'):
+        from TELEMETRY_ARCHIVE import TelemetryArchive
+        with TelemetryArchive(path) as archive:
+            return archive.read_all()
+    from SESSION_LOG import SessionLogReader
+    return SessionLogReader(path).samples()
+
+
+# ===== SESSION REPORT =====
+if __name__ == '__main__':
+    """
+      python ANALYTICS.py                      # one simulated hour (FIRMWARE_SIM)
+      python ANALYTICS.py sessions/x.mxlog     # a recorded session or .mxarc archive
+    """
+    import os
+    import sys
+    import time
+    import tempfile
+
+    if len(sys.argv) > 1:
+        columns = load_columns(sys.argv[1])
+    else:
+        from SESSION_REPLAY import record_simulated_session
+        path = record_simulated_session(os.path.join(tempfile.mkdtemp(), 'hour.mxlog'), seconds=3600)
+        columns = load_columns(path)
+
+    start = time.perf_counter()
+    report = summarize(columns)
+    analyse_ms = (time.perf_counter() - start) * 1e3
+
+    print(f"{report['samples']:,} samples, {report['duration_s'] / 60:.1f} min analysed in {analyse_ms:.1f} ms")
+    for name, seconds in report['time_in_state_s'].items():
+        print(f"  {name:<11} {seconds:8.1f} s  ({100 * seconds / max(report['duration_s'], 1e-9):5.1f}%)")
+    print(f"line-loss episodes: {report['episodes']} {report['episodes_by_side']} "
+          f"unrecovered {report['unrecovered']}")
+    print("recovery ms: " + "  ".join(f"p{p} {v:.0f}" for p, v in report['recover_ms'].items()))
@@ -0,0 +1,436 @@
+import os
+import time
+import errno
+import asyncio
+import threading
+from PyQt5.QtCore import QObject, pyqtSignal
+from TELEMETRY_PARSER import FORMAT_TEXT
+from SERIAL_BUFFER import TelemetryIngestor
+from BAUD_NEGOTIATION import BaudNegotiator
+
+try:
+    import termios
+    import tty
+except ImportError:   # Windows: use the 'thread' or 'qt' backend instead
+    termios = None
+    tty = None
+
+
+def baud_constant(rate):
+    """termios speed constant (B<rate>) for a baud rate; ValueError if this system has none"""
+    speed = getattr(termios, f"B{rate}", None)
+    if speed is None:
+        raise ValueError(f"Baud rate {rate} is not supported by termios on this system")
+    return speed
+
+
+class AsyncSerialClient:
+    """
+    asyncio serial client for the Arduino (POSIX: /dev/ttyUSB*, /dev/ttyACM*, ptys)
+
+    - Read loop:   loop.add_reader() on the non-blocking fd, every chunk goes
+                   straight into TelemetryIngestor (ring buffer + single parse)
+    - Write queue: send() is non-blocking; a writer task drains the queue and
+                   waits for POLLOUT instead of blocking the loop
+    - Reconnect:   if the device disappears (unplug, Nano reset, pty closed) the
+                   client reopens it with exponential back-off
+    - Baud rate:   with target_baud set, every session opens at baud_rate (the Nano
+                   resets to it) and runs the U<baud>/P handshake (BaudNegotiator);
+                   queued writes are held until it finishes
+
+    on_sample / on_line / on_message / on_connection / on_baud are plain callables run
+    on the loop thread (on_message: see TelemetryIngestor).
+    Rates without a termios constant raise ValueError.
+    """
+
+    RECONNECT_DELAY_S = 0.25
+    MAX_RECONNECT_DELAY_S = 5.0
+    READ_CHUNK = 4096
+    NEGOTIATION_POLL_S = 0.01
+
+    def __init__(self, port_name, baud_rate=9600, on_sample=None, on_line=None,
+                 on_connection=None, telemetry_format=FORMAT_TEXT, target_baud=None, on_baud=None,
+                 on_message=None):
+        if termios is None:
+            raise RuntimeError("AsyncSerialClient needs a POSIX system (termios)")
+        baud_constant(baud_rate)
+        if target_baud:
+            baud_constant(target_baud)
+        self.port_name = port_name
+        self.baud_rate = baud_rate
+        self.target_baud = target_baud
+        self.link_baud = baud_rate   # Rate in use on the current session
+        self.on_line = on_line
+        self.on_connection = on_connection
+        self.on_baud = on_baud
+        # Lines only need decoding for the handshake if nobody else wants them
+        self.ingestor = TelemetryIngestor(on_sample or (lambda sample: None),
+                                          self._on_line if target_baud else on_line,
+                                          telemetry_format=telemetry_format, on_message=on_message)
+        self.is_connected = False
+        self.reconnects = 0
+
+        self._loop = None
+        self._fd = None
+        self._queue = None
+        self._writes_open = None   # Cleared while the baud handshake runs
+        self._negotiator = None
+        self._running = False
+        self._closed = None
+
+    # ----- Public API (loop thread) -----
+    async def run(self):
+        """Connect, read, write and reconnect until stop() is called"""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._writes_open = asyncio.Event()
+        self._running = True
+        delay = self.RECONNECT_DELAY_S
+
+        while self._running:
+            try:
+                self._fd = self._open()
+            except OSError as e:
+                print(f"[Async Serial] Cannot open {self.port_name}: {e} (retry in {delay:.2f}s)")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RECONNECT_DELAY_S)
+                continue
+
+            delay = self.RECONNECT_DELAY_S
+            await self._session()
+            if self._running:
+                self.reconnects += 1
+                await asyncio.sleep(delay)
+
+    def send(self, data):
+        """Queue bytes for the writer task (call on the loop thread)"""
+        if self._queue is not None:
+            self._queue.put_nowait(bytes(data))
+
+    def write(self, data):
+        """Thread-safe send() so the client can stand in for serial_port.write()"""
+        if self._loop is None:
+            return 0
+        self._loop.call_soon_threadsafe(self.send, data)
+        return len(data)
+
+    def stop(self):
+        """Stop run() (call on the loop thread)"""
+        self._running = False
+        if self._closed is not None and not self._closed.done():
+            self._closed.set_result(None)
+
+    # ----- Internals -----
+    def _open(self):
+        fd = os.open(self.port_name, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            tty.setraw(fd)
+            attrs = termios.tcgetattr(fd)
+            attrs[4] = attrs[5] = baud_constant(self.baud_rate)   # ispeed / ospeed
+            attrs[2] |= termios.CLOCAL | termios.CREAD
+            termios.tcsetattr(fd, termios.TCSANOW, attrs)
+        except termios.error:
+            pass   # ptys ignore the line settings
+        return fd
+
+    async def _session(self):
+        fd = self._fd
+        self._closed = self._loop.create_future()
+        self.ingestor.reset()
+        self.ingestor.stats.reset()
+        self.link_baud = self.baud_rate
+        self.is_connected = True
+        if self.on_connection:
+            self.on_connection(True)
+
+        negotiation = None
+        if self.target_baud and self.target_baud != self.baud_rate:
+            self._writes_open.clear()
+            self._negotiator = BaudNegotiator(self.target_baud, self.baud_rate)
+            negotiation = asyncio.ensure_future(self._negotiate(fd))
+        else:
+            self._writes_open.set()
+
+        self._loop.add_reader(fd, self._on_readable)
+        writer = asyncio.ensure_future(self._write_loop(fd))
+        try:
+            await self._closed
+        finally:
+            self._loop.remove_reader(fd)
+            writer.cancel()
+            if negotiation is not None:
+                negotiation.cancel()
+            self._negotiator = None
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+            self._fd = None
+            self.is_connected = False
+            if self.on_connection:
+                self.on_connection(False)
+
+    def _on_readable(self):
+        try:
+            data = os.read(self._fd, self.READ_CHUNK)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            # EIO = device (or pty master) gone
+            self._disconnected(e)
+            return
+        if not data:
+            self._disconnected(None)
+            return
+
+        self.ingestor.feed(data, time.perf_counter_ns())
+        command = self.ingestor.pending_format_command()
+        if command:
+            self.send(command)
+
+    def _on_line(self, line):
+        if self._negotiator is not None:
+            self._apply_negotiation(self._fd, self._negotiator.on_line(line, self._now_ms()))
+        if self.on_line is not None:
+            self.on_line(line)
+
+    # ----- Baud handshake -----
+    @staticmethod
+    def _now_ms():
+        return time.perf_counter_ns() // 1_000_000
+
+    async def _negotiate(self, fd):
+        """Drive the handshake timeouts; replies arrive through _on_line"""
+        self._apply_negotiation(fd, self._negotiator.start(self._now_ms()))
+        while self._negotiator is not None:
+            await asyncio.sleep(self.NEGOTIATION_POLL_S)
+            if self._negotiator is not None:
+                self._apply_negotiation(fd, self._negotiator.poll(self._now_ms()))
+
+    def _apply_negotiation(self, fd, actions):
+        for action in actions:
+            if action[0] == 'write':
+                try:
+                    os.write(fd, action[1])   # A few bytes; the queued writes are held meanwhile
+                except BlockingIOError:
+                    pass   # The negotiator retries
+            elif action[0] == 'set_baud':
+                try:
+                    termios.tcdrain(fd)
+                    attrs = termios.tcgetattr(fd)
+                    attrs[4] = attrs[5] = baud_constant(action[1])
+                    termios.tcsetattr(fd, termios.TCSANOW, attrs)
+                    termios.tcflush(fd, termios.TCIFLUSH)
+                except termios.error:
+                    pass
+                self.ingestor.reset()
+            elif action[0] == 'done':
+                self._negotiator = None
+                self.link_baud = action[1]
+                print(f"[Async Serial] Link at {action[1]} baud" + ("" if action[2] else f" ({self.target_baud} failed)"))
+                self._writes_open.set()
+                if self.on_baud:
+                    self.on_baud(action[1], action[2])
+
+    def _disconnected(self, error):
+        if error is not None and error.errno not in (errno.EIO, errno.ENXIO, errno.EBADF):
+            print(f"[Async Serial] Read error: {error}")
+        if self._closed is not None and not self._closed.done():
+            self._closed.set_result(error)
+
+    async def _write_loop(self, fd):
+        command = self.ingestor.pending_format_command()
+        if command:
+            self.send(command)
+        while True:
+            await self._writes_open.wait()
+            data = memoryview(await self._queue.get())
+            while data:
+                try:
+                    written = os.write(fd, data)
+                    data = data[written:]
+                except BlockingIOError:
+                    ready = self._loop.create_future()
+                    self._loop.add_writer(fd, ready.set_result, None)
+                    try:
+                        await ready
+                    finally:
+                        self._loop.remove_writer(fd)
+                except OSError as e:
+                    self._disconnected(e)
+                    return
+
+
+class AsyncSerialBridge(QObject):
+    """
+    Runs an AsyncSerialClient on its own asyncio loop thread and exposes it to the GUI
+
+    Same interface as the other serial managers (is_connected, serial_port,
+    sendSpeedCommand, sendRawCommand, disconnect) and the same fan-out signals as SerialReaderThread.
+    Signals are emitted on the loop thread; Qt queues them to the GUI thread.
+    """
+
+    sample_received = pyqtSignal(object)   # TelemetrySample for every sensor line
+    line_received = pyqtSignal(str)        # Every raw line (sensor lines included)
+    message_received = pyqtSignal(str, object)  # Non-sensor lines + receive t_ns (round-trip timing)
+    error_occurred = pyqtSignal(str)
+    connection_changed = pyqtSignal(bool)
+    baud_negotiated = pyqtSignal(int, bool)  # Rate in use, whether target_baud was reached
+
+    def __init__(self, parent=None, telemetry_format=FORMAT_TEXT, target_baud=None):
+        super().__init__(parent)
+        self.telemetry_format = telemetry_format
+        self.target_baud = target_baud
+        self.serial_port = None   # AsyncSerialClient (has a thread-safe write())
+        self._loop = None
+        self._thread = None
+
+    @property
+    def is_connected(self):
+        return self.serial_port is not None and self.serial_port.is_connected
+
+    @property
+    def stats(self):
+        return self.serial_port.ingestor.stats if self.serial_port else None
+
+    def connect(self, port_name, baud_rate=9600):
+        """Start the client on a background loop; returns (success, message)"""
+        self.disconnect()
+        try:
+            client = AsyncSerialClient(port_name, baud_rate,
+                                       on_sample=self.sample_received.emit,
+                                       on_line=self.line_received.emit,
+                                       on_message=self.message_received.emit,
+                                       on_connection=self.connection_changed.emit,
+                                       telemetry_format=self.telemetry_format,
+                                       target_baud=self.target_baud,
+                                       on_baud=self.baud_negotiated.emit)
+        except (RuntimeError, ValueError) as e:
+            self.error_occurred.emit(str(e))
+            return False, str(e)
+
+        self._loop = asyncio.new_event_loop()
+        self.serial_port = client
+        self._thread = threading.Thread(target=self._run_loop, args=(client,), name="AsyncSerial", daemon=True)
+        self._thread.start()
+        return True, f"Connecting to {port_name}"
+
+    def _run_loop(self, client):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(client.run())
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+        finally:
+            self._loop.close()
+
+    def set_telemetry_format(self, telemetry_format):
+        self.telemetry_format = telemetry_format
+        if self.serial_port and self._loop:
+            self._loop.call_soon_threadsafe(self.serial_port.ingestor.set_telemetry_format, telemetry_format)
+
+    def sendSpeedCommand(self, speed, motor='both'):
+        """Queue L<num>/R<num>/S<num>; returns (success, message)"""
+        if not self.is_connected:
+            return False, "Not connected"
+        if not 0 <= speed <= 100:
+            return False, "Speed must be 0-100%"
+        prefix = {'left': 'L', 'right': 'R'}.get(motor, 'S')
+        return self.sendRawCommand(f"{prefix}{int(speed)}\n")
+
+    def sendRawCommand(self, command):
+        """Queue a raw ASCII command for the loop thread's writer task; returns (success, message)"""
+        if not self.is_connected:
+            return False, "Not connected"
+        self.serial_port.write(command.encode('ascii'))
+        return True, f"Sent {command.strip()}"
+
+    def disconnect(self):
+        """Stop the client and its loop thread"""
+        if self.serial_port and self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.serial_port.stop)
+        if self._thread:
+            self._thread.join(1.0)
+        self.serial_port = None
+        self._loop = None
+        self._thread = None
+
+
+# ===== BENCHMARK AGAINST THE STAND-IN DEVICE =====
+if __name__ == '__main__':
+    """
+    Throughput and tail latency: AsyncSerialClient vs the old 50ms QTimer polling,
+    both reading the PTY_DEVICE stand-in (no robot needed)
+
+      python ASYNC_SERIAL.py            # 67Hz like the firmware, then burst
+    """
+    import sys
+    from PTY_DEVICE import PtyDevice
+    from SERIAL_BUFFER import LatencyMeter
+
+    SECONDS = 3.0
+
+    def report(label, meter, received, elapsed):
+        p = meter.percentiles_ms((50, 95, 99))
+        print(f"{label:<28} {received / elapsed:>9.0f} samples/s | p50 {p[50]:7.2f} ms | "
+              f"p95 {p[95]:7.2f} ms | p99 {p[99]:7.2f} ms | max {max(meter.samples_ns, default=0) / 1e6:7.2f} ms")
+
+    def bench_asyncio(label, interval_s):
+        device = PtyDevice(interval_s=interval_s, record_write_times=True).start()
+        meter = LatencyMeter(window=1_000_000)
+        received = [0]
+
+        def on_sample(sample):
+            received[0] += 1
+            if device.write_times:
+                meter.record(device.write_times.popleft(), sample.t_ns)
+
+        async def main():
+            client = AsyncSerialClient(device.port_name, on_sample=on_sample)
+            task = asyncio.ensure_future(client.run())
+            await asyncio.sleep(SECONDS)
+            client.stop()
+            await task
+
+        start = time.perf_counter()
+        asyncio.run(main())
+        elapsed = time.perf_counter() - start
+        device.stop()
+        report(label, meter, received[0], elapsed)
+
+    def bench_qtimer(label, interval_s):
+        import serial
+        from PyQt5.QtCore import QCoreApplication, QTimer
+        from TELEMETRY_PARSER import parse_line
+
+        app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+        device = PtyDevice(interval_s=interval_s, record_write_times=True).start()
+        port = serial.Serial(device.port_name, 9600, timeout=0.1)
+        meter = LatencyMeter(window=1_000_000)
+        received = [0]
+
+        def poll():
+            # Old IRSensorWidget.poll_sensors loop
+            while port.in_waiting > 0:
+                sample = parse_line(port.readline())
+                if sample is not None:
+                    received[0] += 1
+                    if device.write_times:
+                        meter.record(device.write_times.popleft(), sample.t_ns)
+
+        timer = QTimer()
+        timer.timeout.connect(poll)
+        timer.start(50)
+        QTimer.singleShot(int(SECONDS * 1000), app.quit)
+        start = time.perf_counter()
+        app.exec_()
+        elapsed = time.perf_counter() - start
+        timer.stop()
+        port.close()
+        device.stop()
+        report(label, meter, received[0], elapsed)
+
+    bench_qtimer("QTimer 50ms poll (67Hz)", PtyDevice.LOOP_INTERVAL_S)
+    bench_asyncio("asyncio client (67Hz)", PtyDevice.LOOP_INTERVAL_S)
+    bench_qtimer("QTimer 50ms poll (burst)", 0)
+    bench_asyncio("asyncio client (burst)", 0)
@@ -0,0 +1,244 @@
+import os
+import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ANALYTICS import load_columns, summarize, lap_summary
+
+
+SESSION_EXTENSIONS = ('.mxlog', '.mxarc')
+
+# Summary table: (row key, header, width, format spec)
+TABLE_COLUMNS = (
+    ('file', 'FILE', 24, ''),
+    ('mb', 'MB', 7, '.2f'),
+    ('duration_s', 'MIN', 6, '.1f'),
+    ('samples', 'SAMPLES', 10, ','),
+    ('straight_pct', 'STR%', 5, '.1f'),
+    ('search_pct', 'SRCH%', 5, '.1f'),
+    ('episodes', 'LOSS', 5, ''),
+    ('left_first', 'L1ST', 4, ''),
+    ('right_first', 'R1ST', 4, ''),
+    ('unrecovered', 'LOST', 4, ''),
+    ('recover_p50_ms', 'P50ms', 6, '.0f'),
+    ('recover_p95_ms', 'P95ms', 6, '.0f'),
+    ('laps', 'LAPS', 4, ''),
+    ('worst_lap_search_s', 'WORSTs', 6, '.1f'),
+    ('left_mean', 'L_AVG', 5, '.0f'),
+    ('left_std', 'L_SD', 5, '.0f'),
+    ('right_mean', 'R_AVG', 5, '.0f'),
+    ('right_std', 'R_SD', 5, '.0f'),
+)
+
+
+def find_sessions(directory):
+    """Every .mxlog / .mxarc under directory, sorted"""
+    paths = []
+    for root, _, names in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in names if name.endswith(SESSION_EXTENSIONS))
+    return sorted(paths)
+
+
+def analyse_file(path, lap_s=None):
+    """
+    One row of the summary table for one session file (runs in a worker process)
+
+    Recordings carry no lap markers, so laps are fixed lap_s windows when given
+    (worst_lap_search_s = most time lost searching in any one of them).
+    """
+    start = time.perf_counter()
+    columns = load_columns(path)
+    report = summarize(columns)
+    duration_s = max(report['duration_s'], 1e-9)
+    row = {
+        'file': os.path.basename(path),
+        'path': path,
+        'mb': os.path.getsize(path) / 1e6,
+        'duration_s': report['duration_s'] / 60,
+        'samples': report['samples'],
+        'straight_pct': 100 * report['time_in_state_s']['straight'] / duration_s,
+        'search_pct': 100 * report['time_in_state_s']['search'] / duration_s,
+        'episodes': report['episodes'],
+        'left_first': report['episodes_by_side']['left'],
+        'right_first': report['episodes_by_side']['right'],
+        'unrecovered': report['unrecovered'],
+        'recover_p50_ms': report['recover_ms'][50],
+        'recover_p95_ms': report['recover_ms'][95],
+        'laps': 0,
+        'worst_lap_search_s': 0.0,
+    }
+    for side in ('left', 'right'):
+        raw = columns[f'{side}_raw']
+        row[f'{side}_mean'] = float(raw.mean()) if len(raw) else 0.0
+        row[f'{side}_std'] = float(raw.std()) if len(raw) else 0.0
+
+    if lap_s and report['samples']:
+        t_ns = columns['t_ns']
+        boundaries = np.arange(t_ns[0], t_ns[-1] + 1, int(lap_s * 1e9), dtype=np.int64)
+        laps = lap_summary(columns, np.append(boundaries, t_ns[-1] + 1))
+        row['laps'] = len(laps['duration_s'])
+        row['worst_lap_search_s'] = float(laps['search'].max()) if row['laps'] else 0.0
+
+    row['analyse_s'] = time.perf_counter() - start
+    return row
+
+
+def run_batch(paths, workers=None, lap_s=None, progress=True):
+    """
+    Fan analyse_file out over a process pool; returns (rows in path order, throughput dict)
+    workers=1 runs in-process (the baseline for the scaling report)
+    """
+    workers = workers or os.cpu_count() or 1
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+    rows = {}
+    failed = []
+    start = time.perf_counter()
+
+    def note(done, path):
+        if progress:
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            done_bytes = sum(rows[p]['mb'] for p in rows) * 1e6
+            print(f"[Batch] {done}/{len(paths)} {os.path.basename(path):<24.24} "
+                  f"{done / elapsed:6.1f} files/s {done_bytes / elapsed / 1e6:7.1f} MB/s")
+
+    if workers == 1:
+        for done, path in enumerate(paths, 1):
+            try:
+                rows[path] = analyse_file(path, lap_s)
+            except Exception as e:
+                failed.append((path, str(e)))
+            note(done, path)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(analyse_file, path, lap_s): path for path in paths}
+            for done, future in enumerate(as_completed(futures), 1):
+                path = futures[future]
+                try:
+                    rows[path] = future.result()
+                except Exception as e:
+                    failed.append((path, str(e)))
+                note(done, path)
+
+    wall_s = max(time.perf_counter() - start, 1e-9)
+    for path, error in failed:
+        print(f"[Batch] Skipped {path}: {error}")
+    throughput = {
+        'workers': workers,
+        'files': len(rows),
+        'failed': len(failed),
+        'wall_s': wall_s,
+        'files_per_sec': len(rows) / wall_s,
+        'mb_per_sec': total_bytes / 1e6 / wall_s,
+        'cpu_s': sum(row['analyse_s'] for row in rows.values()),
+    }
+    return [rows[path] for path in paths if path in rows], throughput
+
+
+def merge_totals(rows):
+    """TOTAL row over all sessions (time-weighted percentages, summed counts)"""
+    if not rows:
+        return None
+    minutes = np.array([row['duration_s'] for row in rows])
+    weights = minutes / max(minutes.sum(), 1e-9)
+    samples = np.array([row['samples'] for row in rows], dtype=np.float64)
+    sample_weights = samples / max(samples.sum(), 1)
+    total = {'file': f'TOTAL ({len(rows)} files)', 'path': ''}
+    for key in ('mb', 'duration_s', 'samples', 'episodes', 'left_first', 'right_first', 'unrecovered', 'laps'):
+        total[key] = sum(row[key] for row in rows)
+    for key in ('straight_pct', 'search_pct', 'recover_p50_ms'):
+        total[key] = float(sum(row[key] * w for row, w in zip(rows, weights)))
+    for key in ('left_mean', 'right_mean', 'left_std', 'right_std'):
+        total[key] = float(sum(row[key] * w for row, w in zip(rows, sample_weights)))
+    total['recover_p95_ms'] = max(row['recover_p95_ms'] for row in rows)
+    total['worst_lap_search_s'] = max(row['worst_lap_search_s'] for row in rows)
+    return total
+
+
+def format_table(rows):
+    """Fixed-width summary table, one line per session plus the TOTAL row"""
+    def cell(value, width, spec):
+        if isinstance(value, str):
+            return f"{value[:width]:<{width}}"
+        return f"{value:>{width}{spec}}"
+
+    header = ' '.join(cell(title, width, '') if key == 'file' else f"{title:>{width}}"
+                      for key, title, width, _ in TABLE_COLUMNS)
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        lines.append(' '.join(cell(row[key], width, spec) for key, _, width, spec in TABLE_COLUMNS))
+    total = merge_totals(rows)
+    if total:
+        lines.append('-' * len(header))
+        lines.append(' '.join(cell(total[key], width, spec) for key, _, width, spec in TABLE_COLUMNS))
+    return '\n'.join(lines)
+
+
+def write_csv(rows, path):
+    import csv
+    keys = [key for key, _, _, _ in TABLE_COLUMNS] + ['path', 'analyse_s']
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=keys, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def make_demo_sessions(directory, count, seconds):
+    """Simulated test day: `count` sessions on different tracks (FIRMWARE_SIM)"""
+    from SESSION_REPLAY import record_simulated_session
+    os.makedirs(directory, exist_ok=True)
+    return [record_simulated_session(os.path.join(directory, f'sim_{seed:02d}.mxlog'), seconds=seconds, seed=seed)
+            for seed in range(1, count + 1)]
+
+
+# ===== BATCH REPORT =====
+if __name__ == '__main__':
+    """
+      python BATCH_ANALYSIS.py sessions/                 # every .mxlog / .mxarc below sessions/
+      python BATCH_ANALYSIS.py sessions/ --workers 4 --lap-s 30 --csv day.csv
+      python BATCH_ANALYSIS.py sessions/ --scaling       # 1, 2, 4 ... cpu_count workers
+      python BATCH_ANALYSIS.py --demo 16                 # 16 simulated 10-minute sessions
+    """
+    import tempfile
+
+    def option(name, cast, default=None):
+        return cast(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+    workers = option('--workers', int, os.cpu_count() or 1)
+    lap_s = option('--lap-s', float)
+    csv_path = option('--csv', str)
+    demo = option('--demo', int)
+    flags = {'--workers', '--lap-s', '--csv', '--demo', '--demo-s'}
+    positional = [arg for i, arg in enumerate(sys.argv[1:], 1)
+                  if not arg.startswith('--') and sys.argv[i - 1] not in flags]
+
+    if demo:
+        directory = tempfile.mkdtemp(prefix='mxen_batch_')
+        print(f"[Batch] Recording {demo} simulated sessions into {directory}")
+        make_demo_sessions(directory, demo, seconds=option('--demo-s', float, 600.0))
+    else:
+        directory = positional[0] if positional else 'sessions'
+    paths = find_sessions(directory)
+    if not paths:
+        print(f"[Batch] No {'/'.join(SESSION_EXTENSIONS)} files under {directory}")
+        sys.exit(1)
+
+    if '--scaling' in sys.argv:
+        counts = sorted({1, *[2 ** i for i in range(1, 8) if 2 ** i <= (os.cpu_count() or 1)], os.cpu_count() or 1})
+        baseline = None
+        for count in counts:
+            _, throughput = run_batch(paths, count, lap_s, progress=False)
+            baseline = baseline or throughput['wall_s']
+            print(f"[Batch] {count:>3} workers: {throughput['wall_s']:6.2f} s  "
+                  f"{throughput['files_per_sec']:6.1f} files/s  {throughput['mb_per_sec']:7.1f} MB/s  "
+                  f"speedup {baseline / throughput['wall_s']:.2f}x")
+        sys.exit(0)
+
+    rows, throughput = run_batch(paths, workers, lap_s)
+    print()
+    print(format_table(rows))
+    print(f"\n{throughput['files']} files in {throughput['wall_s']:.2f} s with {throughput['workers']} workers: "
+          f"{throughput['files_per_sec']:.1f} files/s, {throughput['mb_per_sec']:.1f} MB/s "
+          f"(analysis CPU {throughput['cpu_s']:.2f} s)")
+    if csv_path:
+        write_csv(rows, csv_path)
+        print(f"[Batch] Table written to {csv_path}")
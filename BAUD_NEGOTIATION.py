@@ -0,0 +1,196 @@
+import time
+
+
+DEFAULT_BAUD_RATE = 9600   # Serial.begin(DEFAULT_BAUD) in FINALArduino.ino
+SUPPORTED_BAUD_RATES = (9600, 19200, 38400, 57600, 115200, 500000, 1000000)   # isSupportedBaud()
+
+
+class BaudNegotiator:
+    """
+    Host side of the FINALArduino.ino baud handshake (transport independent)
+
+      1. At the current rate send U<target>; the firmware answers "BAUD: <target>"
+         at the old rate and switches (retried while the Nano is still booting)
+      2. Switch the port to <target> and ping ("P") until "PONG" comes back
+      3. No PONG: switch back; the firmware falls back on its own after
+         BAUD_CONFIRM_MS and announces "BAUD: <old>"
+
+    The negotiator never touches the port. start(), on_line() and poll() return
+    a list of actions for the transport to carry out in order:
+      ('write', bytes)          - send bytes
+      ('set_baud', rate)        - flush output, change the port rate, drop input
+      ('done', rate, success)   - finished; rate is what both sides now use
+    """
+
+    REQUEST_TIMEOUT_MS = 500   # Wait for "BAUD: <target>"
+    REQUEST_ATTEMPTS = 6       # ~3s: covers the bootloader after the port opens
+    SETTLE_MS = 20             # Let the firmware finish Serial.begin()
+    PING_TIMEOUT_MS = 200
+    PING_ATTEMPTS = 3          # Must finish inside the firmware's BAUD_CONFIRM_MS (1000)
+    FALLBACK_TIMEOUT_MS = 1500
+
+    def __init__(self, target_baud, current_baud=DEFAULT_BAUD_RATE):
+        if target_baud not in SUPPORTED_BAUD_RATES:
+            raise ValueError(f"Unsupported baud rate: {target_baud} (use one of {SUPPORTED_BAUD_RATES})")
+        self.target_baud = target_baud
+        self.original_baud = current_baud
+        self.state = 'idle'
+        self.result = None
+        self._attempts = 0
+        self._deadline_ms = 0
+
+    @property
+    def done(self):
+        return self.state == 'done'
+
+    def start(self, now_ms):
+        if self.target_baud == self.original_baud:
+            return self._finish(self.original_baud, True)
+        self.state = 'request'
+        self._attempts = 0
+        return self._send_request(now_ms)
+
+    def on_line(self, line, now_ms):
+        """Feed every text line received during the handshake"""
+        line = line.strip()
+        if self.state == 'request':
+            if line == f"BAUD: {self.target_baud}":
+                self.state = 'ping'
+                self._attempts = 0
+                self._deadline_ms = now_ms + self.SETTLE_MS
+                return [('set_baud', self.target_baud)]
+            if line.startswith("ERROR: Unsupported baud"):
+                return self._finish(self.original_baud, False)
+        elif self.state == 'ping':
+            if line == "PONG":
+                return self._finish(self.target_baud, True)
+        elif self.state == 'fallback':
+            if line == f"BAUD: {self.original_baud}":
+                return self._finish(self.original_baud, False)
+        return []
+
+    def poll(self, now_ms):
+        """Call regularly (every few ms) to drive the timeouts"""
+        if now_ms < self._deadline_ms:
+            return []
+        if self.state == 'request':
+            if self._attempts < self.REQUEST_ATTEMPTS:
+                return self._send_request(now_ms)
+            # Firmware without the U command (or not answering)
+            return self._finish(self.original_baud, False)
+        if self.state == 'ping':
+            if self._attempts < self.PING_ATTEMPTS:
+                self._attempts += 1
+                self._deadline_ms = now_ms + self.PING_TIMEOUT_MS
+                return [('write', b'P\n')]
+            self.state = 'fallback'
+            self._deadline_ms = now_ms + self.FALLBACK_TIMEOUT_MS
+            return [('set_baud', self.original_baud)]
+        if self.state == 'fallback':
+            return self._finish(self.original_baud, False)
+        return []
+
+    def _send_request(self, now_ms):
+        self._attempts += 1
+        self._deadline_ms = now_ms + self.REQUEST_TIMEOUT_MS
+        return [('write', f"U{self.target_baud}\n".encode('ascii'))]
+
+    def _finish(self, rate, success):
+        self.state = 'done'
+        self.result = (rate, success)
+        return [('done', rate, success)]
+
+
+def negotiate_baud(port, target_baud, on_line=None, poll_s=0.002):
+    """
+    Run the handshake on an open pyserial port (blocking, ~50ms when it works)
+
+    Lines received meanwhile are passed to on_line. Returns (baud_rate, success);
+    the port is left at baud_rate either way.
+    """
+    negotiator = BaudNegotiator(target_baud, port.baudrate)
+    buffer = bytearray()
+    actions = negotiator.start(_now_ms())
+
+    while True:
+        for action in actions:
+            if action[0] == 'write':
+                port.write(action[1])
+            elif action[0] == 'set_baud':
+                port.flush()
+                port.baudrate = action[1]
+                port.reset_input_buffer()
+                buffer.clear()
+            elif action[0] == 'done':
+                print(f"[Baud] Link at {action[1]} baud" + ("" if action[2] else f" ({target_baud} failed)"))
+                return action[1], action[2]
+
+        actions = []
+        waiting = port.in_waiting
+        if waiting:
+            buffer += port.read(waiting)
+            while b'\n' in buffer and not actions:
+                raw, _, rest = bytes(buffer).partition(b'\n')
+                buffer[:] = rest
+                line = raw.decode('ascii', 'ignore').strip()
+                if on_line is not None and line:
+                    on_line(line)
+                actions = negotiator.on_line(line, _now_ms())
+        else:
+            time.sleep(poll_s)
+        if not actions:
+            actions = negotiator.poll(_now_ms())
+
+
+def _now_ms():
+    return time.perf_counter_ns() // 1_000_000
+
+
+# ===== SUSTAINED TELEMETRY RATE PER BAUD RATE =====
+if __name__ == '__main__':
+    """
+    Negotiate each rate against the PTY_DEVICE stand-in (simulate_baud=True paces
+    the output like the Nano's UART and garbles bytes while the two sides disagree),
+    then measure sustained telemetry for text and binary frames.
+    Also shows the automatic fallback when the link cannot carry the new rate.
+    Requires Linux/macOS (pty) and pyserial.
+    """
+    import serial
+    from PTY_DEVICE import PtyDevice, StandInFirmware
+    from SERIAL_BUFFER import TelemetryIngestor
+    from TELEMETRY_PARSER import FORMAT_TEXT, FORMAT_BINARY
+
+    SECONDS = 2.0
+
+    def measure(target_baud, telemetry_format, firmware=None):
+        device = PtyDevice(firmware=firmware, simulate_baud=True).start()
+        port = serial.Serial(device.port_name, DEFAULT_BAUD_RATE, timeout=0.1)
+        try:
+            rate, ok = negotiate_baud(port, target_baud)
+            ingestor = TelemetryIngestor(lambda sample: None, telemetry_format=telemetry_format)
+            deadline = time.perf_counter() + 0.5   # Let the format switch settle
+            while time.perf_counter() < deadline:
+                command = ingestor.pending_format_command()
+                if command:
+                    port.write(command)
+                ingestor.feed(port.read(max(port.in_waiting, 1)))
+            ingestor.stats.reset()
+            deadline = time.perf_counter() + SECONDS
+            while time.perf_counter() < deadline:
+                ingestor.feed(port.read(max(port.in_waiting, 1)))
+            s = ingestor.stats.snapshot()
+            print(f"request {target_baud:>7} -> {rate:>7} ({'ok' if ok else 'fallback'}) | {telemetry_format:<6} | "
+                  f"{s['samples_per_sec']:6.1f} samples/s | {s['bytes_per_sec']:8.0f} B/s "
+                  f"({100 * s['bytes_per_sec'] * 10 / rate:5.1f}% of link)")
+        finally:
+            port.close()
+            device.stop()
+
+    for baud in (9600, 57600, 115200, 500000, 1000000):
+        for telemetry_format in (FORMAT_TEXT, FORMAT_BINARY):
+            measure(baud, telemetry_format)
+
+    # USB-serial bridge that cannot carry 500000: ping fails, both sides fall back
+    firmware = StandInFirmware()
+    firmware.max_link_baud = 115200
+    measure(500000, FORMAT_TEXT, firmware)
@@ -0,0 +1,308 @@
+import re
+import time
+import numpy as np
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+ADC_LEVELS = 1024   # 10-bit analogRead()
+THRESHOLD_REPLY = re.compile(r'THRESHOLD: L=(\d+) R=(\d+)')   # FINALArduino.ino W command
+
+
+class SensorHistogram:
+    """
+    Incremental 1024-bin histogram of one sensor's raw readings
+
+    add() takes a single reading or a whole column (one bincount per chunk),
+    so a sweep never keeps the readings themselves.
+    """
+
+    def __init__(self):
+        self.counts = np.zeros(ADC_LEVELS, dtype=np.int64)
+
+    def __len__(self):
+        return int(self.counts.sum())
+
+    def add(self, values):
+        if np.isscalar(values):
+            self.counts[min(max(int(values), 0), ADC_LEVELS - 1)] += 1
+        else:
+            values = np.clip(np.asarray(values, dtype=np.int64), 0, ADC_LEVELS - 1)
+            self.counts += np.bincount(values, minlength=ADC_LEVELS)
+
+    def clear(self):
+        self.counts[:] = 0
+
+
+def otsu_threshold(counts):
+    """
+    Otsu's method over a histogram: the level t that maximises the between-class
+    variance of {<= t} (white) and {> t} (black). Returns (t, white_mean, black_mean).
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    levels = np.arange(len(counts), dtype=np.float64)
+    weight_white = np.cumsum(counts)
+    weight_black = weight_white[-1] - weight_white
+    sum_white = np.cumsum(counts * levels)
+    sum_black = sum_white[-1] - sum_white
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_white = sum_white / weight_white
+        mean_black = sum_black / weight_black
+        between = weight_white * weight_black * (mean_white - mean_black) ** 2
+    between[~np.isfinite(between)] = -1
+    # Flat maximum (empty bins between the clusters): take the middle of the plateau
+    best = np.flatnonzero(between == between.max())
+    t = int(best[len(best) // 2])
+    return t, float(mean_white[t]), float(mean_black[t])
+
+
+def two_cluster_threshold(counts, iterations=50):
+    """
+    Two-cluster (1-D k-means) fit over a histogram: threshold = midpoint of the
+    cluster means, iterated until it stops moving. Returns (t, white_mean, black_mean).
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    levels = np.arange(len(counts), dtype=np.float64)
+    cumulative = np.cumsum(counts)
+    cumulative_sum = np.cumsum(counts * levels)
+    total, total_sum = cumulative[-1], cumulative_sum[-1]
+    t = otsu_threshold(counts)[0]
+    for _ in range(iterations):
+        white_n, black_n = cumulative[t], total - cumulative[t]
+        if white_n == 0 or black_n == 0:
+            break
+        white_mean = cumulative_sum[t] / white_n
+        black_mean = (total_sum - cumulative_sum[t]) / black_n
+        new_t = int((white_mean + black_mean) / 2)
+        if new_t == t:
+            break
+        t = new_t
+    white_n, black_n = cumulative[t], total - cumulative[t]
+    white_mean = cumulative_sum[t] / white_n if white_n else 0.0
+    black_mean = (total_sum - cumulative_sum[t]) / black_n if black_n else 0.0
+    return t, float(white_mean), float(black_mean)
+
+
+METHODS = {'otsu': otsu_threshold, 'two_cluster': two_cluster_threshold}
+
+
+def pick_threshold(counts, method='otsu', min_fraction=0.05, min_separation=100):
+    """
+    Threshold for one sensor, or (None, reason) when the sweep cannot be trusted:
+    both surfaces must make up at least min_fraction of the readings and their
+    means must be min_separation ADC counts apart.
+    """
+    counts = np.asarray(counts)
+    total = counts.sum()
+    if total == 0:
+        return None, "no readings"
+    t, white_mean, black_mean = METHODS[method](counts)
+    white_fraction = counts[:t + 1].sum() / total
+    if min(white_fraction, 1 - white_fraction) < min_fraction:
+        return None, f"only {100 * min(white_fraction, 1 - white_fraction):.0f}% on one surface"
+    if black_mean - white_mean < min_separation:
+        return None, f"white/black only {black_mean - white_mean:.0f} apart"
+    return t, f"white {white_mean:.0f} / black {black_mean:.0f}"
+
+
+class ThresholdCalibrator(QObject):
+    """
+    Finds per-sensor WHITE_THRESHOLD values from a short sweep and pushes them to the robot
+
+    1. start(serial_manager): collect raw A6/A7 readings for SWEEP_S seconds
+       (robot searching over the line, or moved across it by hand)
+    2. Per-sensor threshold with Otsu (or the two-cluster fit) from the histograms
+    3. Write "W<left>,<right>" (FINALArduino.ino) and wait for its
+       "THRESHOLD: L=<left> R=<right>" reply on line_received
+
+    Connect sample_received -> on_sample and line_received -> on_line.
+    """
+
+    progress = pyqtSignal(float)              # Seconds of sweep left
+    finished = pyqtSignal(bool, int, int, str)   # success, left, right, message
+    confirmed = pyqtSignal(int, int)          # Thresholds the firmware reported back
+
+    SWEEP_S = 3.0
+    METHOD = 'otsu'
+    CONFIRM_TIMEOUT_MS = 1500
+
+    def __init__(self, parent=None, sweep_s=SWEEP_S, method=METHOD):
+        super().__init__(parent)
+        self.sweep_s = sweep_s
+        self.method = method
+        self.left = SensorHistogram()
+        self.right = SensorHistogram()
+        self.serial_manager = None
+        self.thresholds = None    # (left, right) last pushed
+        self._deadline_ns = 0
+        self._awaiting = None
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._tick)
+        self.confirm_timer = QTimer(self)
+        self.confirm_timer.setSingleShot(True)
+        self.confirm_timer.timeout.connect(self._confirm_timeout)
+
+    @property
+    def is_running(self):
+        return self.timer.isActive()
+
+    def start(self, serial_manager=None):
+        """Begin a sweep; the result goes to serial_manager if it is connected"""
+        self.serial_manager = serial_manager
+        self.left.clear()
+        self.right.clear()
+        self._deadline_ns = time.perf_counter_ns() + int(self.sweep_s * 1e9)
+        self.timer.start(100)
+        print(f"[Calibration] Sweeping for {self.sweep_s:.0f}s - move both sensors over the line")
+
+    def cancel(self):
+        self.timer.stop()
+
+    def on_sample(self, sample):
+        if self.is_running:
+            self.left.add(sample.left_raw)
+            self.right.add(sample.right_raw)
+
+    def add_columns(self, columns):
+        """Feed a batch (TelemetryStore.window() / parse_lines() columns)"""
+        self.left.add(columns['left_raw'])
+        self.right.add(columns['right_raw'])
+
+    def _tick(self):
+        remaining_s = (self._deadline_ns - time.perf_counter_ns()) / 1e9
+        if remaining_s > 0:
+            self.progress.emit(remaining_s)
+            return
+        self.timer.stop()
+        self.progress.emit(0.0)
+        self.finish()
+
+    def compute(self):
+        """(left, right, message); a threshold is None if that sensor's sweep is unusable"""
+        left, left_info = pick_threshold(self.left.counts, self.method)
+        right, right_info = pick_threshold(self.right.counts, self.method)
+        return left, right, f"L: {left_info} | R: {right_info} ({len(self.left)} readings)"
+
+    def finish(self):
+        left, right, message = self.compute()
+        if left is None or right is None:
+            print(f"[Calibration] Failed - {message}")
+            self.finished.emit(False, -1 if left is None else left, -1 if right is None else right, message)
+            return
+        print(f"[Calibration] Thresholds L={left} R={right} - {message}")
+        self.thresholds = (left, right)
+        self.push(left, right)
+        self.finished.emit(True, left, right, message)
+
+    def push(self, left, right):
+        """Send W<left>,<right>; confirmed fires when the firmware echoes it"""
+        manager = self.serial_manager
+        if manager is None or not manager.is_connected:
+            print("[Calibration] Not connected - thresholds not sent")
+            return False
+        try:
+            ok, message = manager.sendRawCommand(f"W{left},{right}\n")   # The backend's single port writer
+        except Exception as e:
+            ok, message = False, str(e)
+        if not ok:
+            print(f"[Calibration] Write failed: {message}")
+            return False
+        self._awaiting = (left, right)
+        self.confirm_timer.start(self.CONFIRM_TIMEOUT_MS)
+        return True
+
+    def on_line(self, line):
+        """Slot for line_received: catch the firmware's THRESHOLD reply"""
+        if self._awaiting is None:
+            return
+        match = THRESHOLD_REPLY.search(line)
+        if match:
+            values = (int(match.group(1)), int(match.group(2)))
+            self._awaiting = None
+            self.confirm_timer.stop()
+            print(f"[Calibration] Robot confirmed L={values[0]} R={values[1]}")
+            self.confirmed.emit(*values)
+
+    def _confirm_timeout(self):
+        if self._awaiting is not None:
+            print("[Calibration] No THRESHOLD reply - firmware without the W command?")
+            self._awaiting = None
+
+
+# ===== END-TO-END CHECK AGAINST THE FIRMWARE SIMULATOR =====
+if __name__ == '__main__':
+    """
+    Simulated Nano behind a pty with ambient light on the sensors (white reads ~110/160,
+    so the default WHITE_THRESHOLD = 30 sees black everywhere and the robot only searches).
+    Calibrate over the serial link, push W<l>,<r>, then compare line tracking before/after.
+    Requires Linux/macOS (pty), pyserial and PyQt5.
+    """
+    import sys
+    import serial
+    from PyQt5.QtCore import QCoreApplication
+    from FIRMWARE_SIM import FirmwareSimulator, LineTrack, SimulatedNano
+    from SERIAL_READER import SerialReaderThread
+    from ANALYTICS import control_states, STATE_NAMES
+    from TELEMETRY_STORE import TelemetryStore
+
+    SPEED = 4.0        # Simulated seconds per wall second
+    BEFORE_S = 2.0     # Wall seconds with the default threshold
+    AFTER_S = 8.0      # Wall seconds with the calibrated thresholds
+
+    app = QCoreApplication(sys.argv)
+    track = LineTrack(seed=3, white_raw=(110, 160), black_raw=(650, 720))
+    device = SimulatedNano(FirmwareSimulator(track), speed=SPEED, simulate_baud=False).start()
+
+    class PySerialManager:
+        # Minimal manager with the MOTOR_METER interface
+        def __init__(self, port_name):
+            self.serial_port = serial.Serial(port_name, 9600, timeout=0.1)
+            self.is_connected = True
+
+    manager = PySerialManager(device.port_name)
+    reader = SerialReaderThread(manager)
+    store = TelemetryStore()
+    calibrator = ThresholdCalibrator(sweep_s=3.0)
+    reader.sample_received.connect(store.append)
+    reader.sample_received.connect(calibrator.on_sample)
+    reader.line_received.connect(calibrator.on_line)
+    reader.start()
+
+    marks = {}
+
+    def report(label, start, end):
+        window = store.window()
+        t = window['t_ns']
+        columns = {name: values[(t >= start) & (t < end)] for name, values in window.items()}
+        states = control_states(columns)
+        shares = np.bincount(states, minlength=len(STATE_NAMES)) / max(len(states), 1)
+        print(f"{label:<20} " + "  ".join(f"{name} {100 * share:5.1f}%" for name, share in zip(STATE_NAMES, shares)))
+
+    def phase_before_done():
+        marks['before'] = time.perf_counter_ns()
+        marks['laps'] = device.firmware.track.laps
+        calibrator.start(manager)
+
+    def on_confirmed(left, right):
+        marks['after'] = time.perf_counter_ns()
+        marks['laps_at_confirm'] = device.firmware.track.laps
+        QTimer.singleShot(int(AFTER_S * 1000), finish)
+
+    def finish():
+        end = time.perf_counter_ns()
+        sim = device.firmware
+        report("before (threshold 30)", marks['start'], marks['before'])
+        report(f"after (L{sim.white_threshold_left}/R{sim.white_threshold_right})", marks['after'], end)
+        print(f"laps: {marks['laps']:.2f} in {BEFORE_S * SPEED:.0f} s before calibration, "
+              f"{sim.track.laps - marks['laps_at_confirm']:.2f} in {AFTER_S * SPEED:.0f} s after")
+        app.quit()
+
+    calibrator.confirmed.connect(on_confirmed)
+    calibrator.finished.connect(lambda ok, l, r, msg: None if ok else app.quit())
+    marks['start'] = time.perf_counter_ns()
+    QTimer.singleShot(int(BEFORE_S * 1000), phase_before_done)
+    QTimer.singleShot(int((BEFORE_S + AFTER_S + 10) * 1000), app.quit)   # Safety net
+    app.exec_()
+    reader.stop()
+    manager.serial_port.close()
+    device.stop()
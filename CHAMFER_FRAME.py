@@ -0,0 +1,152 @@
+from collections import OrderedDict
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter, QColor, QPen, QPainterPath, QPixmap
+from PyQt5.QtCore import Qt
+
+
+FRAME_BACKGROUND = QColor(18, 18, 18, 90)
+FRAME_RED = QColor(255, 30, 30)
+
+# Rendered frames shared by every panel, least recently used dropped first
+# (each panel keeps one per size, ModeDisplayWidget one per mode colour)
+FRAME_CACHE_SIZE = 32
+_frame_cache = OrderedDict()
+
+
+def chamfer_path(w, h, chamfer):
+    """Panel outline with the four corners cut at 45 degrees"""
+    path = QPainterPath()
+    path.moveTo(chamfer, 0)
+    path.lineTo(w - chamfer, 0)
+    path.lineTo(w, chamfer)
+    path.lineTo(w, h - chamfer)
+    path.lineTo(w - chamfer, h)
+    path.lineTo(chamfer, h)
+    path.lineTo(0, h - chamfer)
+    path.lineTo(0, chamfer)
+    path.lineTo(chamfer, 0)
+    return path
+
+
+def paint_frame(painter, w, h, color=FRAME_RED, chamfer=15, glow_alpha=25, cap=Qt.SquareCap):
+    """
+    Draw the panel frame (the motor gauge style) straight onto painter
+    - Translucent chamfered background
+    - Top-right and bottom-left outline segments in `color`
+    - 3 glow passes (alpha glow_alpha/i, width 2 + 1.5i) under a 2px line
+    """
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.fillPath(chamfer_path(w, h, chamfer), FRAME_BACKGROUND)
+
+    # Top-Right segment path
+    tr_path = QPainterPath()
+    tr_path.moveTo(w * 0.4, 0)
+    tr_path.lineTo(w - chamfer, 0)
+    tr_path.lineTo(w, chamfer)
+    tr_path.lineTo(w, h * 0.25)
+
+    # Bottom-Left segment path
+    bl_path = QPainterPath()
+    bl_path.moveTo(w * 0.6, h)
+    bl_path.lineTo(chamfer, h)
+    bl_path.lineTo(0, h - chamfer)
+    bl_path.lineTo(0, h * 0.75)
+
+    for i in range(3, 0, -1):
+        painter.setPen(QPen(QColor(color.red(), color.green(), color.blue(), int(glow_alpha / i)),
+                            2 + i * 1.5, Qt.SolidLine, cap))
+        painter.drawPath(tr_path)
+        painter.drawPath(bl_path)
+
+    painter.setPen(QPen(color, 2, Qt.SolidLine, cap))
+    painter.drawPath(tr_path)
+    painter.drawPath(bl_path)
+
+
+def frame_pixmap(w, h, color=FRAME_RED, chamfer=15, glow_alpha=25, cap=Qt.SquareCap, dpr=1.0):
+    """
+    The frame rendered once into a transparent QPixmap, cached per
+    (size, device pixel ratio, colour, style) - repaints only blit it
+    """
+    key = (w, h, dpr, color.rgba(), chamfer, glow_alpha, int(cap))
+    pixmap = _frame_cache.get(key)
+    if pixmap is not None:
+        _frame_cache.move_to_end(key)
+        return pixmap
+
+    pixmap = QPixmap(max(1, round(w * dpr)), max(1, round(h * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    paint_frame(painter, w, h, color, chamfer, glow_alpha, cap)
+    painter.end()
+
+    _frame_cache[key] = pixmap
+    while len(_frame_cache) > FRAME_CACHE_SIZE:
+        _frame_cache.popitem(last=False)
+    return pixmap
+
+
+class ChamferedFrameWidget(QWidget):
+    """
+    Base for the dashboard panels: paintEvent blits the cached chamfered frame
+
+    - FRAME_CHAMFER / FRAME_GLOW_ALPHA / FRAME_CAP: per-panel frame style
+    - frame_color(): outline colour; override for panels whose accent changes
+      (a new colour is just a new cache key, so update() is all it takes)
+    A resize or a new colour renders the frame once, every other repaint is one
+    drawPixmap. Subclasses drawing more on top call super().paintEvent(event) first.
+    """
+
+    FRAME_CHAMFER = 15
+    FRAME_GLOW_ALPHA = 25
+    FRAME_CAP = Qt.SquareCap
+
+    def frame_color(self):
+        return FRAME_RED
+
+    def paintEvent(self, event):
+        """Draw chamfered frame with glowing outline (one cached pixmap)"""
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, frame_pixmap(self.width(), self.height(), self.frame_color(),
+                                              self.FRAME_CHAMFER, self.FRAME_GLOW_ALPHA, self.FRAME_CAP,
+                                              self.devicePixelRatioF()))
+        painter.end()
+
+
+# ===== REPAINT COST =====
+if __name__ == '__main__':
+    """
+    Time one frame repaint of a 350x320 panel: paint_frame every time (the old
+    per-widget paintEvent) vs blitting the cached pixmap; QT_QPA_PLATFORM=offscreen works
+    """
+    import sys
+    import time
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QImage
+
+    app = QApplication(sys.argv)
+    w, h = 350, 320
+    target = QImage(w, h, QImage.Format_ARGB32_Premultiplied)
+    runs = 2000
+
+    def timed(draw):
+        painter = QPainter(target)
+        draw(painter)   # Warm-up (and cache fill)
+        start = time.perf_counter()
+        for _ in range(runs):
+            draw(painter)
+        elapsed = time.perf_counter() - start
+        painter.end()
+        return elapsed / runs * 1e6
+
+    def draw_paths(painter):
+        paint_frame(painter, w, h)
+
+    def draw_cached(painter):
+        painter.drawPixmap(0, 0, frame_pixmap(w, h))
+
+    paths = timed(draw_paths)
+    cached = timed(draw_cached)
+    print(f"frame repaint {w}x{h}: paths {paths:.1f} us, cached pixmap {cached:.1f} us "
+          f"({paths / max(cached, 1e-9):.0f}x)")
@@ -0,0 +1,363 @@
+import os
+import re
+import csv
+import sys
+import time
+from collections import deque
+from datetime import datetime
+import numpy as np
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QPainterPath
+from PyQt5.QtCore import Qt, QTimer, QObject, pyqtSignal
+from SERIAL_BUFFER import LatencyMeter
+
+
+class CommandRoundTripTracker(QObject):
+    """
+    Measures how long a speed change takes to land on the Arduino
+
+    - on_command_sent(command, t_ns): stamp every outgoing S/L/R/M command; connect
+                                SerialReaderThread.command_written where the reader
+                                writes the port (t_ns = the actual write), else
+                                SpeedCommandScheduler.command_sent (stamped in the slot)
+    - on_line(line, t_ns):      match the firmware's calculateSpeeds() echo
+                                "Speed Left (A6): 60% | Speed Right (A7): 40"
+                                (or "ERROR: Speed must be 0-100%") to the oldest
+                                outstanding command whose values it confirms;
+                                connect message_received so t_ns is the byte
+                                arrival, not the (queued) slot call
+    - meter:                    rolling p50/p95/p99 (LatencyMeter)
+    - export_csv():             every raw round trip (sent_ns, rtt_ms, command)
+                                to <directory>/command_rtt_<timestamp>.csv
+
+    The firmware handles commands in order and answers each one exactly once,
+    so matching is FIFO. Commands without an answer expire after TIMEOUT_MS.
+    """
+
+    round_trip = pyqtSignal(str, float)   # command, milliseconds
+
+    ECHO_PATTERN = re.compile(r'Speed Left \(A6\): (\d+)% \| Speed Right \(A7\): (\d+)')
+    TIMEOUT_MS = 2000
+    MAX_SAMPLES = 100000   # Raw samples kept for export
+
+    def __init__(self, parent=None, window=1024):
+        super().__init__(parent)
+        self.meter = LatencyMeter(window=window)
+        self.samples = deque(maxlen=self.MAX_SAMPLES)   # (sent_ns, rtt_ns, command)
+        self.outstanding = deque()                      # (sent_ns, command, left, right)
+        self.timeouts = 0
+        self.errors = 0
+
+    # ===== OUTGOING =====
+    def on_command_sent(self, command, t_ns=None):
+        """Slot for command_written / command_sent (may hold several lines)"""
+        t_ns = t_ns if t_ns is not None else time.perf_counter_ns()
+        self._expire(t_ns)
+        for part in command.split('\n'):
+            expected = self.expected_speeds(part)
+            if expected is not None:
+                self.outstanding.append((t_ns, part, *expected))
+
+    @staticmethod
+    def expected_speeds(command):
+        """Return the (left, right) a command should produce (None = unchanged)"""
+        if len(command) < 2 or command[0].upper() not in 'SLRM':
+            return None
+        try:
+            if command[0].upper() == 'M':
+                left, right = (int(v) for v in command[1:].split(','))
+                return left, right
+            value = int(command[1:])
+        except ValueError:
+            return None
+        prefix = command[0].upper()
+        return (value if prefix in 'SL' else None, value if prefix in 'SR' else None)
+
+    # ===== INCOMING =====
+    def on_line(self, line, t_ns=None):
+        """Slot for message_received (or line_received): complete the round trip the echo belongs to"""
+        if not self.outstanding:
+            return
+        t_ns = t_ns if t_ns is not None else time.perf_counter_ns()
+
+        match = self.ECHO_PATTERN.search(line)
+        if match:
+            left, right = int(match.group(1)), int(match.group(2))
+            for index, (sent_ns, command, exp_left, exp_right) in enumerate(self.outstanding):
+                if (exp_left is None or exp_left == left) and (exp_right is None or exp_right == right):
+                    # Everything older was answered by an echo we never saw
+                    for _ in range(index):
+                        self.outstanding.popleft()
+                        self.timeouts += 1
+                    self.outstanding.popleft()
+                    self._record(sent_ns, t_ns, command)
+                    return
+        elif line.startswith("ERROR: Speed"):
+            self.outstanding.popleft()
+            self.errors += 1
+        elif line.startswith("=== Dual Motor Line Follower Ready"):
+            # Arduino reset - pending commands are lost
+            self.timeouts += len(self.outstanding)
+            self.outstanding.clear()
+
+    def _record(self, sent_ns, t_ns, command):
+        rtt_ns = t_ns - sent_ns
+        self.meter.record(sent_ns, t_ns)
+        self.samples.append((sent_ns, rtt_ns, command))
+        self.round_trip.emit(command, rtt_ns / 1e6)
+
+    def _expire(self, now_ns):
+        limit = self.TIMEOUT_MS * 1_000_000
+        while self.outstanding and now_ns - self.outstanding[0][0] > limit:
+            self.outstanding.popleft()
+            self.timeouts += 1
+
+    # ===== RESULTS =====
+    def histogram(self, bins=24, max_ms=None):
+        """Return (counts, edges_ms) over the rolling window"""
+        values = np.fromiter(self.meter.samples_ns, dtype=np.int64) / 1e6
+        if max_ms is None:
+            max_ms = max(float(np.percentile(values, 99)) * 1.25, 1.0) if len(values) else 1.0
+        return np.histogram(np.clip(values, 0, max_ms), bins=bins, range=(0, max_ms))
+
+    def export_csv(self, path=None, directory='.'):
+        """Write every recorded round trip to CSV (path, or a timestamped file in directory); returns the path"""
+        if path is None:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"command_rtt_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['sent_ns', 'rtt_ms', 'command'])
+            for sent_ns, rtt_ns, command in self.samples:
+                writer.writerow([sent_ns, f"{rtt_ns / 1e6:.3f}", command])
+        print(f"[Command RTT] Exported {len(self.samples)} round trips to {path}")
+        return path
+
+    def reset(self):
+        self.meter.samples_ns.clear()
+        self.samples.clear()
+        self.outstanding.clear()
+        self.timeouts = 0
+        self.errors = 0
+
+
+class HistogramPlot(QWidget):
+    """Bar chart of the tracker's rolling window with p50/p95/p99 markers"""
+
+    BINS = 24
+    MARKERS = ((50, QColor(0, 255, 0)), (95, QColor(255, 215, 0)), (99, QColor(255, 30, 30)))
+
+    def __init__(self, tracker, parent=None):
+        super().__init__(parent)
+        self.tracker = tracker
+        self.setAttribute(Qt.WA_TranslucentBackground)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        w, h = self.width(), self.height()
+
+        # Axis
+        painter.setPen(QPen(QColor(80, 20, 20), 1))
+        painter.drawLine(0, h - 1, w, h - 1)
+
+        if not len(self.tracker.meter):
+            painter.setPen(QColor(100, 100, 100))
+            painter.setFont(QFont("Consolas", 8))
+            painter.drawText(self.rect(), Qt.AlignCenter, "NO ROUND TRIPS YET")
+            painter.end()
+            return
+
+        counts, edges = self.tracker.histogram(self.BINS)
+        peak = max(int(counts.max()), 1)
+        bar_w = w / self.BINS
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(255, 40, 40, 180))
+        for i, count in enumerate(counts):
+            bar_h = (h - 12) * count / peak
+            painter.drawRect(int(i * bar_w + 1), int(h - 1 - bar_h), max(int(bar_w) - 2, 1), int(bar_h))
+
+        # Percentile markers
+        max_ms = edges[-1]
+        percentiles = self.tracker.meter.percentiles_ms(tuple(p for p, _ in self.MARKERS))
+        painter.setFont(QFont("Consolas", 7, QFont.Bold))
+        for p, color in self.MARKERS:
+            x = int(w * min(percentiles[p] / max_ms, 1.0))
+            painter.setPen(QPen(color, 1, Qt.DashLine))
+            painter.drawLine(x, 0, x, h)
+            painter.drawText(min(x + 2, w - 24), 9, f"p{p}")
+
+        # Scale
+        painter.setPen(QColor(120, 120, 120))
+        painter.drawText(self.rect(), Qt.AlignRight | Qt.AlignBottom, f"{max_ms:.0f} ms ")
+        painter.end()
+
+
+class CommandLatencyWidget(QWidget):
+    """
+    Live command round-trip histogram
+
+    Features:
+    - Histogram of the last 1024 round trips with p50/p95/p99 markers
+    - p50/p95/p99, sample count and timeouts readout
+    - EXPORT button writes the raw samples to <export_dir>/command_rtt_<timestamp>.csv
+    """
+
+    REFRESH_MS = 500
+
+    def __init__(self, tracker=None, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setWindowFlags(Qt.FramelessWindowHint)
+        self.setWindowTitle("Command Round Trip")
+        self.setGeometry(100, 100, 610, 115)
+
+        self.tracker = tracker or CommandRoundTripTracker(self)
+        self.export_dir = '.'
+        self._drawn_samples = -1
+
+        self.setup_ui()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(self.REFRESH_MS)
+
+    def setup_ui(self):
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(15, 10, 15, 10)
+        layout.setSpacing(10)
+
+        info = QVBoxLayout()
+        info.setSpacing(2)
+        title = QLabel("CMD ROUND TRIP")
+        title.setStyleSheet("color: #FF3030; font-family: Consolas; font-size: 9pt; font-weight: bold; background: transparent;")
+        info.addWidget(title)
+
+        self.stats_label = QLabel()
+        self.stats_label.setStyleSheet("color: #CCCCCC; font-family: Consolas; font-size: 8pt; background: transparent;")
+        info.addWidget(self.stats_label)
+
+        self.export_btn = QPushButton("EXPORT CSV")
+        self.export_btn.setCursor(Qt.PointingHandCursor)
+        self.export_btn.setStyleSheet("""
+            QPushButton {
+                background-color: rgba(40, 40, 40, 180);
+                color: #FF3030;
+                border: 1px solid #FF3030;
+                border-radius: 3px;
+                font-family: Consolas;
+                font-size: 8pt;
+                font-weight: bold;
+                padding: 3px 8px;
+            }
+            QPushButton:hover {
+                background-color: rgba(255, 30, 30, 80);
+                color: white;
+            }
+        """)
+        self.export_btn.clicked.connect(self.export)
+        info.addWidget(self.export_btn)
+        info.addStretch()
+        layout.addLayout(info)
+
+        self.plot = HistogramPlot(self.tracker, self)
+        layout.addWidget(self.plot, stretch=1)
+
+        self.refresh()
+
+    def refresh(self):
+        """Redraw only when new round trips arrived"""
+        count = len(self.tracker.samples)
+        if count == self._drawn_samples:
+            return
+        self._drawn_samples = count
+        p = self.tracker.meter.percentiles_ms((50, 95, 99))
+        self.stats_label.setText(f"p50 {p[50]:6.1f} ms\np95 {p[95]:6.1f} ms\np99 {p[99]:6.1f} ms\n"
+                                 f"n {count}  lost {self.tracker.timeouts}")
+        self.plot.update()
+
+    def export(self):
+        if not self.tracker.samples:
+            print("[Command RTT] Nothing to export")
+            return None
+        return self.tracker.export_csv(directory=self.export_dir)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        chamfer = 10
+        w, h = self.width(), self.height()
+        path = QPainterPath()
+        path.moveTo(chamfer, 0)
+        path.lineTo(w - chamfer, 0)
+        path.lineTo(w, chamfer)
+        path.lineTo(w, h - chamfer)
+        path.lineTo(w - chamfer, h)
+        path.lineTo(chamfer, h)
+        path.lineTo(0, h - chamfer)
+        path.lineTo(0, chamfer)
+        path.lineTo(chamfer, 0)
+        painter.fillPath(path, QColor(18, 18, 18, 90))
+        painter.setPen(QPen(QColor(255, 30, 30, 160), 1.5))
+        painter.drawPath(path)
+        painter.end()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.drag_pos = event.globalPos() - self.frameGeometry().topLeft()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() == Qt.LeftButton and hasattr(self, 'drag_pos'):
+            self.move(event.globalPos() - self.drag_pos)
+
+
+# ===== STANDALONE ROUND-TRIP MEASUREMENT =====
+if __name__ == '__main__':
+    """
+    Measure round trips against the PTY_DEVICE stand-in (Linux/macOS):
+    a slow slider sweep through SpeedCommandScheduler, live histogram on screen,
+    raw samples exported when the window closes.
+    """
+    import serial
+    from PTY_DEVICE import PtyDevice
+    from SERIAL_READER import SerialReaderThread
+    from COMMAND_SCHEDULER import SpeedCommandScheduler
+
+    app = QApplication(sys.argv)
+    device = PtyDevice().start()
+
+    class PySerialManager:
+        # Minimal manager with the MOTOR_METER interface
+        def __init__(self, port_name):
+            self.serial_port = serial.Serial(port_name, 9600, timeout=0.1)
+            self.is_connected = True
+
+        def sendSpeedCommand(self, speed, motor='both'):
+            return True, "Sent"
+
+    manager = PySerialManager(device.port_name)
+    scheduler = SpeedCommandScheduler(manager)
+    reader = SerialReaderThread(manager)
+    window = CommandLatencyWidget()
+    reader.command_written.connect(window.tracker.on_command_sent)
+    reader.message_received.connect(window.tracker.on_line)
+    reader.start()
+
+    ticks = [0]
+
+    def sweep():
+        ticks[0] += 1
+        manager.sendSpeedCommand(ticks[0] % 101, motor='left')
+        manager.sendSpeedCommand((ticks[0] * 3) % 101, motor='right')
+
+    sweep_timer = QTimer()
+    sweep_timer.timeout.connect(sweep)
+    sweep_timer.start(20)
+
+    window.show()
+    exit_code = app.exec_()
+    reader.stop()
+    manager.serial_port.close()
+    device.stop()
+    window.export()
+    sys.exit(exit_code)
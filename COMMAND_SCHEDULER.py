@@ -0,0 +1,215 @@
+import time
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class SpeedCommandScheduler(QObject):
+    """
+    Outgoing speed-command scheduler shared by every widget that talks to the motors
+
+    Every L/R/S command costs FINALArduino.ino a delay(10) + parseInt() inside
+    handleSerialCommand(), so a slider drag (one valueChanged per tick) stalls the
+    robot's control loop. The scheduler:
+    - Coalesces per motor: only the latest requested value is sent (latest wins)
+    - Caps the command rate: at most one write every MIN_INTERVAL_MS
+    - Combines left + right into one "M<left>,<right>" command (one delay instead of two)
+    - Never skips a value because it was sent before: the Nano resets to its
+      default speed on every (re)connect, which the host can't always see
+
+    install(serial_manager) replaces the manager's sendSpeedCommand with request(),
+    so MOTOR_METER, MODE and STOPWATCH keep calling sendSpeedCommand() unchanged.
+    Writes are deferred to the event loop, so back-to-back calls in one handler
+    (e.g. OperationProfilesWidget.set_mode) always leave as a single command.
+    They go out through the manager's sendRawCommand() (the backend's single port
+    writer); hold(True) keeps them pending, e.g. during the reader's baud handshake.
+    """
+
+    command_sent = pyqtSignal(str)   # Exact command written (without newline)
+
+    MIN_INTERVAL_MS = 50     # 20 commands/s max (firmware loop is ~67Hz)
+    COMBINED_COMMAND = True  # False for firmware without the M command
+
+    def __init__(self, serial_manager=None, parent=None, min_interval_ms=MIN_INTERVAL_MS,
+                 combined=COMBINED_COMMAND):
+        super().__init__(parent)
+        self.min_interval_ms = min_interval_ms
+        self.combined = combined
+        self.serial_manager = None
+        self._original_send = None
+
+        self.pending = {}     # motor -> latest requested value ('left' / 'right')
+        self.sent = {}        # motor -> last value written (for inspection only)
+        self._last_write_ns = 0
+        self.held = False
+
+        # Counters
+        self.requests = 0
+        self.commands = 0
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush)
+
+        if serial_manager is not None:
+            self.install(serial_manager)
+
+    # ===== SERIAL MANAGER HOOK =====
+    def install(self, serial_manager):
+        """Route serial_manager.sendSpeedCommand() through the scheduler"""
+        self.uninstall()
+        self.serial_manager = serial_manager
+        self._original_send = vars(serial_manager).get('sendSpeedCommand')
+        serial_manager.sendSpeedCommand = self.request
+        self.pending.clear()
+        self.sent.clear()
+
+    def uninstall(self):
+        """Restore the manager's own sendSpeedCommand"""
+        if self.serial_manager is not None:
+            self.flush_timer.stop()
+            self.flush()
+            if self._original_send is not None:
+                self.serial_manager.sendSpeedCommand = self._original_send
+            else:
+                del self.serial_manager.sendSpeedCommand  # Back to the class method
+        self.serial_manager = None
+        self._original_send = None
+
+    # ===== REQUESTS =====
+    def request(self, speed, motor='both'):
+        """
+        Drop-in sendSpeedCommand(): queue a speed (0-100%) for 'left', 'right' or 'both'
+        Returns (success, message) immediately; the write happens on the next flush
+        """
+        if self.serial_manager is None or not self.serial_manager.is_connected:
+            return False, "Not connected"
+        if not 0 <= speed <= 100:
+            return False, "Speed must be 0-100%"
+
+        speed = int(speed)
+        self.requests += 1
+        if motor in ('left', 'both'):
+            self.pending['left'] = speed
+        if motor in ('right', 'both'):
+            self.pending['right'] = speed
+        self._schedule()
+        return True, f"Queued {motor} {speed}%"
+
+    def hold(self, held):
+        """Keep requests pending while held (slot for SerialReaderThread.negotiating)"""
+        self.held = held
+        if not held and self.pending:
+            self._schedule()
+
+    def _schedule(self):
+        if self.held or self.flush_timer.isActive():
+            return  # Already due - the newer value simply replaces the pending one
+        elapsed_ms = (time.perf_counter_ns() - self._last_write_ns) / 1e6
+        self.flush_timer.start(max(0, int(self.min_interval_ms - elapsed_ms)))
+
+    # ===== WRITES =====
+    def flush(self):
+        """Write the pending values as one command (called by the timer)"""
+        manager = self.serial_manager
+        if manager is None or not self.pending or self.held:
+            return
+        if not manager.is_connected:
+            self.pending.clear()
+            return
+
+        changed = dict(self.pending)
+        self.pending.clear()
+
+        left = changed.get('left')
+        right = changed.get('right')
+        if left is not None and right is not None:
+            if left == right:
+                command = f"S{left}"
+            elif self.combined:
+                command = f"M{left},{right}"
+            else:
+                command = f"L{left}\nR{right}"   # Firmware without M: still one write
+        elif left is not None:
+            command = f"L{left}"
+        else:
+            command = f"R{right}"
+
+        try:
+            ok, message = manager.sendRawCommand(f"{command}\n")
+        except Exception as e:
+            ok, message = False, str(e)
+        if not ok:
+            print(f"[Command Scheduler] Write failed: {message}")
+            return
+
+        self.sent.update(changed)
+        self.commands += 1
+        self._last_write_ns = time.perf_counter_ns()
+        self.command_sent.emit(command)
+
+    def stats(self):
+        """Return (requests, commands written)"""
+        return self.requests, self.commands
+
+
+# ===== SLIDER DRAG BENCHMARK =====
+if __name__ == '__main__':
+    """
+    Simulated slider drag against the PTY_DEVICE stand-in: every valueChanged tick
+    sent directly (old behaviour) vs through the scheduler. Firmware stall =
+    commands received x delay(10) in handleSerialCommand().
+    Requires Linux/macOS (pty) and pyserial.
+    """
+    import sys
+    import serial
+    from PyQt5.QtCore import QCoreApplication
+    from PTY_DEVICE import PtyDevice
+
+    app = QCoreApplication(sys.argv)
+    DRAG_SECONDS = 2.0
+    TICK_MS = 5   # Mouse drag: ~200 valueChanged per second, per slider
+
+    class PySerialManager:
+        # Minimal manager with the MOTOR_METER interface
+        def __init__(self, port_name):
+            self.serial_port = serial.Serial(port_name, 9600, timeout=0.1)
+            self.is_connected = True
+
+        def sendSpeedCommand(self, speed, motor='both'):
+            prefix = {'left': 'L', 'right': 'R'}.get(motor, 'S')
+            return self.sendRawCommand(f"{prefix}{int(speed)}\n")
+
+        def sendRawCommand(self, command):
+            self.serial_port.write(command.encode('ascii'))
+            return True, "Sent"
+
+    def run(label, use_scheduler):
+        device = PtyDevice().start()
+        manager = PySerialManager(device.port_name)
+        scheduler = SpeedCommandScheduler(manager) if use_scheduler else None
+        ticks = [0]
+
+        def drag():
+            # Both sliders dragged together, like a mode change every tick
+            ticks[0] += 1
+            value = ticks[0] % 101
+            manager.sendSpeedCommand(value, motor='left')
+            manager.sendSpeedCommand(100 - value, motor='right')
+
+        timer = QTimer()
+        timer.timeout.connect(drag)
+        timer.start(TICK_MS)
+        QTimer.singleShot(int(DRAG_SECONDS * 1000), timer.stop)
+        QTimer.singleShot(int(DRAG_SECONDS * 1000) + 300, app.quit)
+        app.exec_()
+
+        firmware = device.firmware
+        final = (firmware.speed_left, firmware.speed_right)
+        expected = (ticks[0] % 101, 100 - ticks[0] % 101)
+        manager.serial_port.close()
+        device.stop()
+        print(f"{label:<22} requests: {ticks[0] * 2:>5} | commands: {firmware.commands_received:>5} | "
+              f"firmware stall: {firmware.commands_received * 10 / DRAG_SECONDS:>6.0f} ms/s | "
+              f"final speeds {final} (expected {expected})")
+
+    run("direct (old)", False)
+    run("scheduler", True)
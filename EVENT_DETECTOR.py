@@ -0,0 +1,265 @@
+from collections import namedtuple, deque, Counter
+from PyQt5.QtCore import QObject, pyqtSignal
+from TELEMETRY_PARSER import TelemetrySample, FLAG_LEFT_WHITE, FLAG_RIGHT_WHITE, LOSS_CHARS
+
+
+# ===== EVENTS =====
+# One discrete robot state transition, derived from the telemetry stream
+RobotEvent = namedtuple('RobotEvent', [
+    't_ns',         # Receive time of the sample that triggered it (sample.t_ns)
+    'kind',         # EVENT_*
+    'side',         # "L", "R" or "-" (see below)
+    'duration_ns',  # Time since the line was lost (reacquired / search_flip), else 0
+    'value',        # Raw reading for sensor_stuck / sensor_ok, else 0
+])
+
+EVENT_LINE_LOST = 'line_lost'               # side: sensor that lost the line first ("-" = both at once)
+EVENT_LINE_REACQUIRED = 'line_reacquired'   # side: sensor that found white ("-" = both)
+EVENT_SEARCH_FLIP = 'search_flip'           # side: new Loss: value after SEARCH_TIMEOUT
+EVENT_WIGGLE_SEARCH = 'wiggle_search'       # Direction unknown (Loss:- Out:0) - wiggling
+EVENT_SENSOR_STUCK = 'sensor_stuck'         # side: sensor whose reading stopped moving
+EVENT_SENSOR_OK = 'sensor_ok'               # That sensor is moving again
+
+# 8-character labels for the session log (SESSION_LOG.KIND_EVENT records)
+EVENT_CODES = {
+    EVENT_LINE_LOST: 'lost',
+    EVENT_LINE_REACQUIRED: 'found',
+    EVENT_SEARCH_FLIP: 'flip',
+    EVENT_WIGGLE_SEARCH: 'wiggle',
+    EVENT_SENSOR_STUCK: 'stuck',
+    EVENT_SENSOR_OK: 'ok',
+}
+
+def event_text(event):
+    """Short form for logs and labels, e.g. "lost L", "found R", "wiggle" """
+    code = EVENT_CODES[event.kind]
+    return code if event.kind == EVENT_WIGGLE_SEARCH else f"{code} {event.side}"
+
+
+class FlatRun:
+    """
+    How long a reading has stayed within `tolerance` counts, by sample time
+
+    Monotonic min/max deques of (index, value, t_ns) over the current run, O(1)
+    amortised per push: when a reading widens the range past the tolerance, the
+    older extreme is dropped and the run restarts after it. duration_ns() is then
+    independent of the sample rate (31 Hz text at 9600 baud, 67 Hz, binary frames).
+    """
+
+    def __init__(self, tolerance):
+        self.tolerance = tolerance
+        self.start_ns = None   # Time of the last reading outside the run (or the first reading)
+        self.last_ns = 0
+        self._index = 0
+        self._min = deque()    # Increasing values: front is the run minimum
+        self._max = deque()    # Decreasing values: front is the run maximum
+
+    def push(self, value, t_ns):
+        if self.start_ns is None:
+            self.start_ns = t_ns
+        entry = (self._index, value, t_ns)
+        self._index += 1
+        self.last_ns = t_ns
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append(entry)
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append(entry)
+        while self._max[0][1] - self._min[0][1] > self.tolerance:
+            older = self._min if self._min[0][0] < self._max[0][0] else self._max
+            self.start_ns = older.popleft()[2]
+
+    def duration_ns(self):
+        return self.last_ns - self.start_ns if self.start_ns is not None else 0
+
+
+class EventStateMachine:
+    """
+    Turns parsed telemetry into RobotEvents in one pass (no Qt, no history rescans)
+
+    Mirrors the firmware's STEP 2-3 logic from what every sample already carries:
+    - both sensors black           -> line_lost (side = the Loss: the firmware reported)
+    - a sensor white again         -> line_reacquired (duration = time searching)
+    - Loss: changes while searching -> search_flip (the firmware's SEARCH_TIMEOUT toggle)
+    - searching with Loss:- Out:0  -> wiggle_search (no direction to search in)
+    - a raw reading within STUCK_TOLERANCE for STUCK_S (sample time, so the same
+      at any link speed) -> sensor_stuck, then sensor_ok once it moves (real
+      sensors always jitter a few counts)
+
+    feed(sample) returns the events that sample produced (usually none).
+    """
+
+    STUCK_S = 2.0           # Seconds without movement
+    STUCK_TOLERANCE = 1     # ADC counts
+
+    def __init__(self, stuck_s=STUCK_S, stuck_tolerance=STUCK_TOLERANCE):
+        self.stuck_ns = int(stuck_s * 1e9)
+        self.stuck_tolerance = stuck_tolerance
+        self.searching = False
+        self.wiggling = False
+        self.lost_t_ns = 0
+        self.search_loss = '-'
+        self.samples = 0
+        self.sensors = {side: FlatRun(stuck_tolerance) for side in ('L', 'R')}
+        self.stuck = {'L': False, 'R': False}
+
+    def feed(self, sample):
+        events = []
+        t_ns = sample.t_ns
+        self.samples += 1
+        both_black = not sample.left_white and not sample.right_white
+
+        if both_black and not self.searching:
+            self.searching = True
+            self.lost_t_ns = t_ns
+            self.search_loss = sample.loss
+            events.append(RobotEvent(t_ns, EVENT_LINE_LOST, sample.loss, 0, 0))
+        elif both_black and sample.loss != self.search_loss:
+            self.search_loss = sample.loss
+            self.wiggling = False
+            events.append(RobotEvent(t_ns, EVENT_SEARCH_FLIP, sample.loss, t_ns - self.lost_t_ns, 0))
+        elif not both_black and self.searching:
+            self.searching = False
+            self.wiggling = False
+            side = '-' if sample.left_white and sample.right_white else ('L' if sample.left_white else 'R')
+            events.append(RobotEvent(t_ns, EVENT_LINE_REACQUIRED, side, t_ns - self.lost_t_ns, 0))
+
+        if self.searching and not self.wiggling and sample.loss == '-' and sample.out == 0:
+            self.wiggling = True
+            events.append(RobotEvent(t_ns, EVENT_WIGGLE_SEARCH, '-', t_ns - self.lost_t_ns, 0))
+
+        for side, raw in (('L', sample.left_raw), ('R', sample.right_raw)):
+            run = self.sensors[side]
+            run.push(raw, t_ns)
+            flat = run.duration_ns() >= self.stuck_ns
+            if flat != self.stuck[side]:
+                self.stuck[side] = flat
+                events.append(RobotEvent(t_ns, EVENT_SENSOR_STUCK if flat else EVENT_SENSOR_OK, side, 0, raw))
+        return events
+
+    def feed_columns(self, columns):
+        """All events for a block of COLUMN_DTYPES columns (session logs, archives)"""
+        events = []
+        rows = zip(columns['t_ns'].tolist(), columns['left_raw'].tolist(), columns['right_raw'].tolist(),
+                   columns['flags'].tolist(), columns['loss'].tolist(), columns['out'].tolist())
+        for t_ns, left_raw, right_raw, flags, loss, out in rows:
+            events.extend(self.feed(TelemetrySample(
+                t_ns, left_raw, right_raw, bool(flags & FLAG_LEFT_WHITE), bool(flags & FLAG_RIGHT_WHITE),
+                LOSS_CHARS[loss] if 0 <= loss < len(LOSS_CHARS) else '-', out)))
+        return events
+
+
+class EventLog:
+    """
+    In-memory event history (newest last, bounded) with per-kind counts
+
+    Counts cover the whole session even after old events fall off the deque.
+    """
+
+    CAPACITY = 10000
+
+    def __init__(self, capacity=CAPACITY):
+        self.events = deque(maxlen=capacity)
+        self.counts = Counter()
+
+    def __len__(self):
+        return len(self.events)
+
+    def append(self, event):
+        self.events.append(event)
+        self.counts[event.kind] += 1
+
+    def last(self, kind=None):
+        for event in reversed(self.events):
+            if kind is None or event.kind == kind:
+                return event
+        return None
+
+    def since(self, t_ns):
+        """Events at or after t_ns (newest-first scan, stops at the first older one)"""
+        recent = []
+        for event in reversed(self.events):
+            if event.t_ns < t_ns:
+                break
+            recent.append(event)
+        return recent[::-1]
+
+    def of_kind(self, kind):
+        return [event for event in self.events if event.kind == kind]
+
+    def clear(self):
+        self.events.clear()
+        self.counts.clear()
+
+
+class EventDetector(QObject):
+    """
+    Qt front end: connect sample_received -> on_sample once, subscribe to event_detected
+
+    Widgets, the session recorder (and a stopwatch, for lap marks on line_reacquired)
+    react to events instead of re-deriving them from raw lines. Every event is also
+    kept in self.log.
+    """
+
+    event_detected = pyqtSignal(object)   # RobotEvent
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.machine = EventStateMachine()
+        self.log = EventLog()
+
+    def on_sample(self, sample):
+        for event in self.machine.feed(sample):
+            self.log.append(event)
+            self.event_detected.emit(event)
+
+    def reset(self):
+        """New telemetry stream (replay, reconnect): forget the search state and the log"""
+        self.machine = EventStateMachine()
+        self.log.clear()
+
+
+# ===== EVENTS FROM A SIMULATED SESSION =====
+if __name__ == '__main__':
+    """
+    Run the state machine over 10 simulated minutes (FIRMWARE_SIM), cross-check the
+    line-loss count with ANALYTICS, inject a stuck left sensor, and time it per sample
+    """
+    import time
+    import numpy as np
+    from FIRMWARE_SIM import FirmwareSimulator, LineTrack
+    from TELEMETRY_PARSER import parse_lines
+    from ANALYTICS import line_loss_episodes
+
+    # A second, 12 degree gap is long enough for SEARCH_TIMEOUT flips
+    sim = FirmwareSimulator(LineTrack(gaps=((85, 88), (200, 212)), seed=2))
+    sim.boot()
+    blocks = []
+    while sim.clock_ms < 600_000:
+        blocks.append(parse_lines(sim.step(), int(sim.clock_ms * 1e6)))
+    columns = {name: np.concatenate([block[name] for block in blocks]) for name in blocks[0]}
+    # Left sensor unplugged for 5 s at the 5 minute mark: reads a constant 1023
+    stuck = (columns['t_ns'] >= 300e9) & (columns['t_ns'] < 305e9)
+    columns['left_raw'][stuck] = 1023
+
+    machine = EventStateMachine()
+    start = time.perf_counter()
+    events = machine.feed_columns(columns)
+    elapsed = time.perf_counter() - start
+
+    counts = Counter(event.kind for event in events)
+    print(f"{len(columns['t_ns']):,} samples -> {len(events)} events in {elapsed * 1e3:.0f} ms "
+          f"({elapsed / len(columns['t_ns']) * 1e6:.2f} us per sample)")
+    for kind in EVENT_CODES:
+        print(f"  {kind:<16} {counts[kind]}")
+    print(f"ANALYTICS line_loss_episodes: {len(line_loss_episodes(columns))}")
+    found = [event.duration_ns / 1e6 for event in events if event.kind == EVENT_LINE_REACQUIRED]
+    print(f"reacquire ms p50 {np.percentile(found, 50):.0f}  max {max(found):.0f}")
+    for event in events:
+        if event.kind in (EVENT_SENSOR_STUCK, EVENT_SENSOR_OK):
+            print(f"  t={event.t_ns / 1e9:7.2f}s {event_text(event)} (raw {event.value})")
+
+    # Powered up off the line: no sensor has lost it first yet, so the firmware wiggles
+    boot = EventStateMachine().feed(TelemetrySample(0, 700, 700, False, False, '-', 0))
+    print("placed off the line at boot: " + ", ".join(event_text(event) for event in boot))
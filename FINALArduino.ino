@@ -19,7 +19,15 @@ const byte INPUT2 = 1;
 const byte OUTPUT1 = 2;
 const byte OUTPUT2 = 3;
 
-const int WHITE_THRESHOLD = 30;  // Threshold for white detection
+// Binary telemetry frame (optional, enabled with the T1 command)
+const byte FRAME_SYNC = 0xA5;
+const byte FRAME_SIZE = 14;
+
+// Serial link speed: boots at DEFAULT_BAUD, host may switch with U<baud>
+const long DEFAULT_BAUD = 9600;
+const unsigned long BAUD_CONFIRM_MS = 1000;  // Host must ping ('P') at the new rate within this
+
+const int WHITE_THRESHOLD = 30;  // Default threshold for white detection
 const unsigned long SEARCH_TIMEOUT = 2000;  // 2 seconds timeout for search direction switch
 
 // ============================================
@@ -46,6 +54,10 @@ byte searchSpeedRight = 230;
 bool prevLeftWhite = true;
 bool prevRightWhite = true;
 
+// Per-sensor white thresholds (raw <= threshold = white), set by the host with W<l>,<r>
+int whiteThresholdLeft = WHITE_THRESHOLD;
+int whiteThresholdRight = WHITE_THRESHOLD;
+
 // Recovery direction memory
 bool leftLostFirst = false;
 bool rightLostFirst = false;
@@ -67,6 +79,15 @@ byte output2 = 255;
 byte input1 = 0;
 byte input2 = 0;
 
+// Telemetry format: false = text debug line, true = 14-byte binary frame
+bool binaryTelemetry = false;
+byte telemetrySeq = 0;
+
+// Runtime baud switch (U<baud>)
+long currentBaud = DEFAULT_BAUD;
+long previousBaud = DEFAULT_BAUD;      // Last rate the host confirmed
+unsigned long baudConfirmDeadline = 0; // 0 = no switch waiting for a ping
+
 // ============================================
 // DAC OUTPUT FUNCTIONS - Time Critical
 // ============================================
@@ -169,6 +190,76 @@ void handleSerialCommand() {
       }
     }
   }
+  // NEW: Set both motors in one command: M<left>,<right> (e.g. M60,40)
+  // One delay + parse instead of an L and an R command
+  else if (incoming == 'M' || incoming == 'm') {
+    delay(10);  // Wait for numbers
+    if (Serial.available() > 0) {
+      int newLeft = Serial.parseInt();
+      int newRight = Serial.parseInt();
+      if (newLeft >= 0 && newLeft <= 100 && newRight >= 0 && newRight <= 100) {
+        speedPercentLeft = newLeft;
+        speedPercentRight = newRight;
+        calculateSpeeds();
+      } else {
+        Serial.println(F("ERROR: Speed must be 0-100%"));
+      }
+    }
+  }
+  // NEW: Telemetry format: T0 = text debug line, T1 = binary frame
+  else if (incoming == 'T' || incoming == 't') {
+    delay(10);  // Wait for number
+    if (Serial.available() > 0) {
+      int format = Serial.parseInt();
+      binaryTelemetry = (format == 1);
+      Serial.println(binaryTelemetry ? F("TELEMETRY: BINARY") : F("TELEMETRY: TEXT"));
+    }
+  }
+  // NEW: Switch baud rate: U<baud> (e.g. U115200)
+  // Reply goes out at the old rate, then the host must ping at the new one
+  else if (incoming == 'U' || incoming == 'u') {
+    delay(10);  // Wait for number
+    if (Serial.available() > 0) {
+      long newBaud = Serial.parseInt();
+      if (isSupportedBaud(newBaud)) {
+        Serial.print(F("BAUD: "));
+        Serial.println(newBaud);
+        Serial.flush();  // Finish sending at the old rate
+        previousBaud = currentBaud;
+        currentBaud = newBaud;
+        Serial.end();
+        Serial.begin(currentBaud);
+        baudConfirmDeadline = millis() + BAUD_CONFIRM_MS;
+      } else {
+        Serial.println(F("ERROR: Unsupported baud rate"));
+      }
+    }
+  }
+  // NEW: Per-sensor white thresholds: W<left>,<right> (e.g. W120,135)
+  // Sent by the GUI's calibration (Otsu threshold from a sweep over the line)
+  else if (incoming == 'W' || incoming == 'w') {
+    delay(10);  // Wait for numbers
+    if (Serial.available() > 0) {
+      int newLeft = Serial.parseInt();
+      int newRight = Serial.parseInt();
+      if (newLeft >= 0 && newLeft <= 1023 && newRight >= 0 && newRight <= 1023) {
+        whiteThresholdLeft = newLeft;
+        whiteThresholdRight = newRight;
+        Serial.print(F("THRESHOLD: L="));
+        Serial.print(whiteThresholdLeft);
+        Serial.print(F(" R="));
+        Serial.println(whiteThresholdRight);
+      } else {
+        Serial.println(F("ERROR: Threshold must be 0-1023"));
+      }
+    }
+  }
+  // NEW: Ping - also confirms a pending baud switch
+  else if (incoming == 'P' || incoming == 'p') {
+    baudConfirmDeadline = 0;
+    previousBaud = currentBaud;
+    Serial.println(F("PONG"));
+  }
   // Original 4-byte protocol
   else if (incoming == START && Serial.available() >= 3) {
     byte startByte = START;
@@ -206,11 +297,67 @@ void handleSerialCommand() {
   }
 }
 
+// ============================================
+// BAUD RATE NEGOTIATION
+// ============================================
+// Rates a 16MHz Nano can generate within ~2% (230400 and 250000 are left out:
+// too far off, or not available on every host)
+bool isSupportedBaud(long baud) {
+  return baud == 9600 || baud == 19200 || baud == 38400 || baud == 57600 ||
+         baud == 115200 || baud == 500000 || baud == 1000000;
+}
+
+// No ping at the new rate in time - go back to the last rate that worked
+void checkBaudConfirm() {
+  if (baudConfirmDeadline == 0 || (long)(millis() - baudConfirmDeadline) < 0) return;
+  baudConfirmDeadline = 0;
+  currentBaud = previousBaud;
+  Serial.end();
+  Serial.begin(currentBaud);
+  Serial.print(F("BAUD: "));
+  Serial.println(currentBaud);
+}
+
+// ============================================
+// BINARY TELEMETRY FRAME
+// ============================================
+// 14 bytes instead of ~35 for the text line, so 67Hz fits inside 9600 baud
+// Layout (little-endian):
+//   [0] sync 0xA5  [1] sequence  [2-5] millis  [6-7] left raw  [8-9] right raw
+//   [10] flags (bit0 left white, bit1 right white)  [11] loss (0 '-', 1 'L', 2 'R')
+//   [12] lastOut (signed)  [13] checksum = sum of bytes 0-12
+void sendTelemetryFrame(int leftRaw, int rightRaw, bool leftWhite, bool rightWhite) {
+  byte frame[FRAME_SIZE];
+  unsigned long now = millis();
+
+  frame[0] = FRAME_SYNC;
+  frame[1] = telemetrySeq++;
+  frame[2] = now & 0xFF;
+  frame[3] = (now >> 8) & 0xFF;
+  frame[4] = (now >> 16) & 0xFF;
+  frame[5] = (now >> 24) & 0xFF;
+  frame[6] = leftRaw & 0xFF;
+  frame[7] = (leftRaw >> 8) & 0xFF;
+  frame[8] = rightRaw & 0xFF;
+  frame[9] = (rightRaw >> 8) & 0xFF;
+  frame[10] = (leftWhite ? 0x01 : 0) | (rightWhite ? 0x02 : 0);
+  frame[11] = leftLostFirst ? 1 : (rightLostFirst ? 2 : 0);
+  frame[12] = (byte)lastOut;
+
+  byte checkSum = 0;
+  for (byte i = 0; i < FRAME_SIZE - 1; i++) {
+    checkSum += frame[i];
+  }
+  frame[13] = checkSum;
+
+  Serial.write(frame, FRAME_SIZE);
+}
+
 // ============================================
 // SETUP - Run Once
 // ============================================
 void setup() {
-  Serial.begin(9600);
+  Serial.begin(DEFAULT_BAUD);
   initDACs();
   calculateSpeeds();
   
@@ -219,6 +366,11 @@ void setup() {
   Serial.println(F("  S<num>  - Set both motors speed (e.g., S50)"));
   Serial.println(F("  L<num>  - Set LEFT motor (A6) speed (e.g., L60)"));
   Serial.println(F("  R<num>  - Set RIGHT motor (A7) speed (e.g., R40)"));
+  Serial.println(F("  M<l>,<r> - Set both motors at once (e.g., M60,40)"));
+  Serial.println(F("  T<0|1>  - Telemetry format: 0 = text, 1 = binary"));
+  Serial.println(F("  U<baud> - Switch baud rate, confirm with P (e.g., U115200)"));
+  Serial.println(F("  P       - Ping (replies PONG)"));
+  Serial.println(F("  W<l>,<r> - White thresholds 0-1023 (e.g., W120,135)"));
   Serial.println(F("Valid range: 0-100%"));
   Serial.println(F("========================================"));
 }
@@ -230,8 +382,8 @@ void loop() {
   // ===== STEP 1: READ SENSORS (Time Critical) =====
   int leftRaw  = analogRead(SENSOR1);
   int rightRaw = analogRead(SENSOR2);
-  bool leftWhite  = (leftRaw  <= WHITE_THRESHOLD);
-  bool rightWhite = (rightRaw <= WHITE_THRESHOLD);
+  bool leftWhite  = (leftRaw  <= whiteThresholdLeft);
+  bool rightWhite = (rightRaw <= whiteThresholdRight);
 
   // ===== STEP 2: DETECT LINE LOSS TRANSITIONS =====
   if (prevLeftWhite && !leftWhite && prevRightWhite) {
@@ -315,18 +467,23 @@ void loop() {
   prevRightWhite = rightWhite;
 
   // ===== STEP 5: DEBUG OUTPUT =====
-  Serial.print(F("L:")); Serial.print(leftRaw);
-  Serial.print(leftWhite ? F("(W)") : F("(B)"));
-  Serial.print(F(" R:")); Serial.print(rightRaw);
-  Serial.print(rightWhite ? F("(W)") : F("(B)"));
-  Serial.print(F(" Loss:"));
-  if (leftLostFirst) Serial.print(F("L"));
-  else if (rightLostFirst) Serial.print(F("R"));
-  else Serial.print(F("-"));
-  Serial.print(F(" Out:")); Serial.println(lastOut);
+  if (binaryTelemetry) {
+    sendTelemetryFrame(leftRaw, rightRaw, leftWhite, rightWhite);
+  } else {
+    Serial.print(F("L:")); Serial.print(leftRaw);
+    Serial.print(leftWhite ? F("(W)") : F("(B)"));
+    Serial.print(F(" R:")); Serial.print(rightRaw);
+    Serial.print(rightWhite ? F("(W)") : F("(B)"));
+    Serial.print(F(" Loss:"));
+    if (leftLostFirst) Serial.print(F("L"));
+    else if (rightLostFirst) Serial.print(F("R"));
+    else Serial.print(F("-"));
+    Serial.print(F(" Out:")); Serial.println(lastOut);
+  }
 
   // ===== STEP 6: HANDLE SERIAL COMMANDS =====
   handleSerialCommand();
+  checkBaudConfirm();
 
   // ===== STEP 7: LOOP TIMING =====
   delay(15);  // ~67Hz loop rate
@@ -0,0 +1,593 @@
+import sys
+import math
+import time
+import random
+from PTY_DEVICE import PtyDevice
+from TELEMETRY_PARSER import encode_frame, FLAG_LEFT_WHITE, FLAG_RIGHT_WHITE
+
+
+# ===== FINALArduino.ino CONSTANTS =====
+WHITE_THRESHOLD = 30        # Default threshold for white detection
+SEARCH_TIMEOUT = 2000       # ms before the search direction flips
+WIGGLE_PERIOD_MS = 300
+LOOP_DELAY_MS = 15          # delay(15) at the end of loop()
+COMMAND_DELAY_MS = 10       # delay(10) "Wait for number"
+PARSE_TIMEOUT_MS = 1000     # Stream::parseInt() default timeout
+
+START = 255
+INPUT1 = 0
+INPUT2 = 1
+OUTPUT1 = 2
+OUTPUT2 = 3
+
+DEFAULT_BAUD = 9600
+BAUD_CONFIRM_MS = 1000
+SUPPORTED_BAUD_RATES = (9600, 19200, 38400, 57600, 115200, 500000, 1000000)
+
+SERIAL_RX_BUFFER = 64       # HardwareSerial buffers on the Nano
+SERIAL_TX_BUFFER = 64
+DAC_STOP = 128
+
+
+class LineTrack:
+    """
+    Circular white line on a black floor with the differential-drive robot on it
+
+    - Two IR sensors SENSOR_FORWARD_M ahead of the axle, SENSOR_SPACING_M apart
+    - analog_read(): white ~15, black ~700 (+ noise), like the real sensors
+    - advance(): DAC 128 = wheel stopped, 255 = full forward (DAC1 = left wheel)
+    - gaps: angular ranges (degrees) with no line, to exercise the recovery logic
+    - white_raw / black_raw: per-sensor (left, right) levels, e.g. (110, 160) for
+      ambient light that WHITE_THRESHOLD = 30 no longer separates
+    """
+
+    RADIUS_M = 0.5
+    LINE_WIDTH_M = 0.03
+    SENSOR_SPACING_M = 0.02
+    SENSOR_FORWARD_M = 0.06
+    WHEEL_BASE_M = 0.12
+    MAX_WHEEL_SPEED_M_S = 0.4
+    WHITE_RAW = 15
+    BLACK_RAW = 700
+
+    def __init__(self, gaps=((85, 88),), seed=None, white_raw=(WHITE_RAW, WHITE_RAW),
+                 black_raw=(BLACK_RAW, BLACK_RAW)):
+        self.rng = random.Random(seed)
+        self.gaps = gaps
+        self.white_raw = white_raw
+        self.black_raw = black_raw
+        # Start on the line, driving counter-clockwise
+        self.x = self.RADIUS_M
+        self.y = 0.0
+        self.heading = math.pi / 2
+        self.angle_travelled = 0.0
+        self._last_angle = 0.0
+
+    @property
+    def laps(self):
+        return self.angle_travelled / (2 * math.pi)
+
+    def on_line(self, px, py):
+        if abs(math.hypot(px, py) - self.RADIUS_M) > self.LINE_WIDTH_M / 2:
+            return False
+        angle = math.degrees(math.atan2(py, px)) % 360
+        return not any(start <= angle <= end for start, end in self.gaps)
+
+    def sensor_positions(self):
+        fx, fy = math.cos(self.heading), math.sin(self.heading)
+        lx, ly = -fy, fx
+        cx = self.x + fx * self.SENSOR_FORWARD_M
+        cy = self.y + fy * self.SENSOR_FORWARD_M
+        half = self.SENSOR_SPACING_M / 2
+        return (cx + lx * half, cy + ly * half), (cx - lx * half, cy - ly * half)
+
+    def analog_read(self):
+        """(left_raw, right_raw) as analogRead(SENSOR1/SENSOR2) would return them"""
+        values = []
+        for (px, py), white, black in zip(self.sensor_positions(), self.white_raw, self.black_raw):
+            on_line = self.on_line(px, py)
+            noise = self.rng.gauss(0, 4 if on_line else 60)
+            values.append(max(0, min(1023, int((white if on_line else black) + noise))))
+        return values[0], values[1]
+
+    def advance(self, dac_left, dac_right, dt_ms):
+        """Drive for dt_ms with the current DAC outputs"""
+        if dt_ms <= 0:
+            return
+        dt = dt_ms / 1000.0
+        v_left = max(dac_left - DAC_STOP, 0) / 127.0 * self.MAX_WHEEL_SPEED_M_S
+        v_right = max(dac_right - DAC_STOP, 0) / 127.0 * self.MAX_WHEEL_SPEED_M_S
+        v = (v_left + v_right) / 2
+        omega = (v_right - v_left) / self.WHEEL_BASE_M
+        self.heading += omega * dt
+        self.x += v * math.cos(self.heading) * dt
+        self.y += v * math.sin(self.heading) * dt
+
+        angle = math.atan2(self.y, self.x)
+        delta = (angle - self._last_angle + math.pi) % (2 * math.pi) - math.pi
+        self.angle_travelled += delta
+        self._last_angle = angle
+
+
+class FirmwareSimulator:
+    """
+    Python port of FINALArduino.ino on a virtual clock
+
+    - setup() / loop() / handleSerialCommand() / calculateSpeeds() line by line:
+      per-sensor white thresholds, leftLostFirst/rightLostFirst recovery, wiggle search,
+      SEARCH_TIMEOUT flipping, S/L/R/M/T/U/P/W commands and the 4-byte START protocol
+    - millis() is virtual: delay(), parseInt() timeouts and a full 64-byte TX buffer
+      advance it, and the robot keeps driving on the LineTrack meanwhile
+    - Host bytes arrive at the wire rate into the 64-byte RX buffer (overflow is
+      dropped and counted in rx_overflow, like HardwareSerial)
+
+    Same boot()/receive()/step() interface as PTY_DEVICE.StandInFirmware, so it runs
+    behind a pty (SimulatedNano) or headless with run(ms) for batch tests.
+    """
+
+    def __init__(self, track=None):
+        self.track = track or LineTrack()
+
+        # Speed & motor control
+        self.speed_percent_left = 40
+        self.speed_percent_right = 40
+        self.forward_left = 179
+        self.turn_speed_left = 205
+        self.search_speed_left = 230
+        self.forward_right = 179
+        self.turn_speed_right = 205
+        self.search_speed_right = 230
+
+        # Line tracking state
+        self.white_threshold_left = WHITE_THRESHOLD
+        self.white_threshold_right = WHITE_THRESHOLD
+        self.prev_left_white = True
+        self.prev_right_white = True
+        self.left_lost_first = False
+        self.right_lost_first = False
+        self.last_out = 0
+        self.searching_for_line = False
+        self.line_lost_time = 0
+        self.wiggle_timer = 0
+        self.wiggle_dir = False
+
+        # Serial protocol
+        self.output1 = 255
+        self.output2 = 255
+        self.input1 = 0
+        self.input2 = 0
+        self.binary_telemetry = False
+        self.telemetry_seq = 0
+        self.current_baud = DEFAULT_BAUD
+        self.previous_baud = DEFAULT_BAUD
+        self.baud_confirm_deadline = 0
+
+        # Hardware
+        self.dac1 = 0
+        self.dac2 = 0
+        self.clock_ms = 0.0
+        self.last_loop_ms = LOOP_DELAY_MS
+        self.loop_count = 0
+        self.rx_overflow = 0
+        self.tx_segments = []   # [(baud, length)] for the bytes the last step returned
+        self._wire = bytearray()       # Host bytes not yet through the UART
+        self._wire_credit = 0.0
+        self._rx = bytearray()         # HardwareSerial RX buffer
+        self._tx = bytearray()
+        self._tx_clear_ms = 0.0
+
+    # ===== PTY_DEVICE INTERFACE =====
+    @property
+    def baud_rate(self):
+        return self.current_baud
+
+    @property
+    def tx_baud(self):
+        return self.tx_segments[-1][0] if self.tx_segments else self.current_baud
+
+    def boot(self):
+        self.tx_segments = []
+        self.setup()
+        return self._take_output()
+
+    def receive(self, data):
+        self._wire += data
+
+    def step(self, now_ms=None):
+        """One loop(); now_ms is ignored, the simulator keeps its own clock"""
+        start = self.clock_ms
+        self.tx_segments = []
+        self.loop()
+        self.last_loop_ms = self.clock_ms - start
+        return self._take_output()
+
+    def run(self, duration_ms):
+        """Headless: run loop() for duration_ms of virtual time, return all serial output"""
+        output = bytearray()
+        end = self.clock_ms + duration_ms
+        while self.clock_ms < end:
+            output += self.step()
+        return bytes(output)
+
+    # ===== ARDUINO API =====
+    def millis(self):
+        return int(self.clock_ms) & 0xFFFFFFFF
+
+    def delay(self, ms):
+        self._advance(ms)
+
+    def analog_read_sensors(self):
+        return self.track.analog_read()
+
+    def output_to_dac1(self, data):
+        self.dac1 = data & 0xFF
+
+    def output_to_dac2(self, data):
+        self.dac2 = data & 0xFF
+
+    def _advance(self, ms):
+        """Let virtual time pass: the robot drives and host bytes trickle in"""
+        self.track.advance(self.dac1, self.dac2, ms)
+        self.clock_ms += ms
+        if self._wire:
+            self._wire_credit += ms * self.current_baud / 10000.0
+            count = min(int(self._wire_credit), len(self._wire))
+            if count:
+                self._wire_credit -= count
+                chunk = self._wire[:count]
+                del self._wire[:count]
+                room = SERIAL_RX_BUFFER - len(self._rx)
+                self._rx += chunk[:room]
+                self.rx_overflow += max(0, count - room)
+        else:
+            self._wire_credit = 0.0
+
+    # ----- Serial -----
+    def serial_available(self):
+        return len(self._rx)
+
+    def serial_read(self):
+        return self._rx.pop(0) if self._rx else -1
+
+    def _timed_peek(self):
+        waited = 0
+        while not self._rx:
+            if waited >= PARSE_TIMEOUT_MS:
+                return None
+            self._advance(1)
+            waited += 1
+        return self._rx[0]
+
+    def serial_parse_int(self):
+        """Stream::parseInt(): skip to the first digit or '-', read digits, 0 on timeout"""
+        while True:
+            c = self._timed_peek()
+            if c is None:
+                return 0
+            if c == ord('-') or ord('0') <= c <= ord('9'):
+                break
+            self._rx.pop(0)
+
+        negative = False
+        value = 0
+        while True:
+            c = self._timed_peek()
+            if c is None:
+                break
+            if c == ord('-') and not negative and value == 0:
+                negative = True
+            elif ord('0') <= c <= ord('9'):
+                value = value * 10 + c - ord('0')
+            else:
+                break
+            self._rx.pop(0)
+        return -value if negative else value
+
+    def serial_write(self, data):
+        """Serial.print/write: blocks (virtual time) while the TX buffer is full"""
+        byte_ms = 10000.0 / self.current_baud
+        self._tx_clear_ms = max(self._tx_clear_ms, self.clock_ms) + len(data) * byte_ms
+        blocked_until = self._tx_clear_ms - SERIAL_TX_BUFFER * byte_ms
+        self._tx += data
+        if self.tx_segments and self.tx_segments[-1][0] == self.current_baud:
+            self.tx_segments[-1] = (self.current_baud, self.tx_segments[-1][1] + len(data))
+        else:
+            self.tx_segments.append((self.current_baud, len(data)))
+        if blocked_until > self.clock_ms:
+            self._advance(blocked_until - self.clock_ms)
+
+    def serial_println(self, text=""):
+        self.serial_write(f"{text}\r\n".encode('ascii'))
+
+    def serial_flush(self):
+        if self._tx_clear_ms > self.clock_ms:
+            self._advance(self._tx_clear_ms - self.clock_ms)
+
+    def serial_begin(self, baud):
+        self.current_baud = baud
+        self._tx_clear_ms = self.clock_ms
+
+    def _take_output(self):
+        output = bytes(self._tx)
+        self._tx.clear()
+        return output
+
+    # ===== FIRMWARE FUNCTIONS =====
+    def calculate_speeds(self):
+        # C integer arithmetic: 127 * percent / 100 truncates
+        self.forward_left = 128 + (127 * self.speed_percent_left // 100)
+        turn_percent_left = min(self.speed_percent_left + 35, 100)
+        self.turn_speed_left = 128 + (127 * turn_percent_left // 100)
+        search_percent_left = min(self.speed_percent_left + 40, 100)
+        self.search_speed_left = 128 + (127 * search_percent_left // 100)
+
+        self.forward_right = 128 + (127 * self.speed_percent_right // 100)
+        turn_percent_right = min(self.speed_percent_right + 35, 100)
+        self.turn_speed_right = 128 + (127 * turn_percent_right // 100)
+        search_percent_right = min(self.speed_percent_right + 40, 100)
+        self.search_speed_right = 128 + (127 * search_percent_right // 100)
+
+        self.serial_println(f"Speed Left (A6): {self.speed_percent_left}% | Speed Right (A7): {self.speed_percent_right}")
+        self.serial_println(f"Fwd L: {self.forward_left} | Fwd R: {self.forward_right} | "
+                            f"Turn L: {self.turn_speed_left} | Turn R: {self.turn_speed_right}")
+
+    def setup(self):
+        self.serial_begin(DEFAULT_BAUD)
+        self.dac1 = self.dac2 = 0   # initDACs(): pins LOW
+        self.calculate_speeds()
+        for line in ("=== Dual Motor Line Follower Ready ===",
+                     "Commands:",
+                     "  S<num>  - Set both motors speed (e.g., S50)",
+                     "  L<num>  - Set LEFT motor (A6) speed (e.g., L60)",
+                     "  R<num>  - Set RIGHT motor (A7) speed (e.g., R40)",
+                     "  M<l>,<r> - Set both motors at once (e.g., M60,40)",
+                     "  T<0|1>  - Telemetry format: 0 = text, 1 = binary",
+                     "  U<baud> - Switch baud rate, confirm with P (e.g., U115200)",
+                     "  P       - Ping (replies PONG)",
+                     "  W<l>,<r> - White thresholds 0-1023 (e.g., W120,135)",
+                     "Valid range: 0-100%",
+                     "========================================"):
+            self.serial_println(line)
+
+    def send_telemetry_frame(self, left_raw, right_raw, left_white, right_white):
+        flags = (FLAG_LEFT_WHITE if left_white else 0) | (FLAG_RIGHT_WHITE if right_white else 0)
+        loss = 1 if self.left_lost_first else (2 if self.right_lost_first else 0)
+        self.serial_write(encode_frame(self.telemetry_seq, self.millis(), left_raw, right_raw,
+                                       flags, loss, self.last_out))
+        self.telemetry_seq = (self.telemetry_seq + 1) & 0xFF
+
+    def check_baud_confirm(self):
+        if self.baud_confirm_deadline == 0 or self.millis() < self.baud_confirm_deadline:
+            return
+        self.baud_confirm_deadline = 0
+        self.current_baud = self.previous_baud
+        self.serial_begin(self.current_baud)
+        self.serial_println(f"BAUD: {self.current_baud}")
+
+    def _set_speed(self, left=None, right=None):
+        values = [v for v in (left, right) if v is not None]
+        if all(0 <= v <= 100 for v in values):
+            if left is not None:
+                self.speed_percent_left = left
+            if right is not None:
+                self.speed_percent_right = right
+            self.calculate_speeds()
+        else:
+            self.serial_println("ERROR: Speed must be 0-100%")
+
+    def handle_serial_command(self):
+        if self.serial_available() == 0:
+            return
+
+        incoming = self.serial_read()
+        command = chr(incoming).upper() if incoming < 128 else ''
+
+        if command in ('S', 'L', 'R'):
+            self.delay(COMMAND_DELAY_MS)   # Wait for number
+            if self.serial_available() > 0:
+                value = self.serial_parse_int()
+                if command == 'S':
+                    self._set_speed(value, value)
+                elif command == 'L':
+                    self._set_speed(left=value)
+                else:
+                    self._set_speed(right=value)
+        elif command == 'M':
+            self.delay(COMMAND_DELAY_MS)
+            if self.serial_available() > 0:
+                new_left = self.serial_parse_int()
+                new_right = self.serial_parse_int()
+                self._set_speed(new_left, new_right)
+        elif command == 'T':
+            self.delay(COMMAND_DELAY_MS)
+            if self.serial_available() > 0:
+                self.binary_telemetry = self.serial_parse_int() == 1
+                self.serial_println("TELEMETRY: BINARY" if self.binary_telemetry else "TELEMETRY: TEXT")
+        elif command == 'U':
+            self.delay(COMMAND_DELAY_MS)
+            if self.serial_available() > 0:
+                new_baud = self.serial_parse_int()
+                if new_baud in SUPPORTED_BAUD_RATES:
+                    self.serial_println(f"BAUD: {new_baud}")
+                    self.serial_flush()
+                    self.previous_baud = self.current_baud
+                    self.serial_begin(new_baud)
+                    self.baud_confirm_deadline = self.millis() + BAUD_CONFIRM_MS
+                else:
+                    self.serial_println("ERROR: Unsupported baud rate")
+        elif command == 'W':
+            self.delay(COMMAND_DELAY_MS)
+            if self.serial_available() > 0:
+                new_left = self.serial_parse_int()
+                new_right = self.serial_parse_int()
+                if 0 <= new_left <= 1023 and 0 <= new_right <= 1023:
+                    self.white_threshold_left = new_left
+                    self.white_threshold_right = new_right
+                    self.serial_println(f"THRESHOLD: L={new_left} R={new_right}")
+                else:
+                    self.serial_println("ERROR: Threshold must be 0-1023")
+        elif command == 'P':
+            self.baud_confirm_deadline = 0
+            self.previous_baud = self.current_baud
+            self.serial_println("PONG")
+        elif incoming == START and self.serial_available() >= 3:
+            command_byte = self.serial_read()
+            data_byte = self.serial_read()
+            check_byte = self.serial_read()
+            if check_byte == (START + command_byte + data_byte) & 0xFF:
+                if command_byte in (INPUT1, INPUT2):
+                    # SENSOR1/2 are A6/A7: analog-only on the Nano, digitalRead() is always LOW
+                    value = 0
+                    if command_byte == INPUT1:
+                        self.input1 = value
+                    else:
+                        self.input2 = value
+                    self.serial_write(bytes((START, command_byte, value, (START + command_byte + value) & 0xFF)))
+                elif command_byte == OUTPUT1:
+                    self.output1 = data_byte
+                    self.output_to_dac1(self.output1)
+                elif command_byte == OUTPUT2:
+                    self.output2 = data_byte
+                    self.output_to_dac2(self.output2)
+
+    def loop(self):
+        self.loop_count += 1
+
+        # ===== STEP 1: READ SENSORS =====
+        left_raw, right_raw = self.analog_read_sensors()
+        left_white = left_raw <= self.white_threshold_left
+        right_white = right_raw <= self.white_threshold_right
+
+        # ===== STEP 2: DETECT LINE LOSS TRANSITIONS =====
+        if self.prev_left_white and not left_white and self.prev_right_white:
+            self.left_lost_first = True
+            self.right_lost_first = False
+            self.line_lost_time = self.millis()
+        if self.prev_right_white and not right_white and self.prev_left_white:
+            self.right_lost_first = True
+            self.left_lost_first = False
+            self.line_lost_time = self.millis()
+
+        # ===== STEP 3: BANG-BANG CONTROL LOGIC =====
+        if left_white and right_white:
+            self.last_out = 0
+            self.searching_for_line = False
+            self.output_to_dac1(self.forward_left)
+            self.output_to_dac2(self.forward_right)
+        elif not left_white and right_white:
+            self.last_out = -1
+            self.searching_for_line = False
+            self.output_to_dac1(self.turn_speed_left)
+            self.output_to_dac2(self.forward_right)
+        elif left_white and not right_white:
+            self.last_out = 1
+            self.searching_for_line = False
+            self.output_to_dac1(self.forward_left)
+            self.output_to_dac2(self.turn_speed_right)
+        else:
+            self.searching_for_line = True
+            if self.left_lost_first:
+                self.output_to_dac1(self.search_speed_left)
+                self.output_to_dac2(128)
+            elif self.right_lost_first:
+                self.output_to_dac1(128)
+                self.output_to_dac2(self.search_speed_right)
+            elif self.last_out != 0:
+                if self.last_out < 0:
+                    self.output_to_dac1(self.search_speed_left)
+                    self.output_to_dac2(128)
+                else:
+                    self.output_to_dac1(128)
+                    self.output_to_dac2(self.search_speed_right)
+            else:
+                now = self.millis()
+                if now - self.wiggle_timer > WIGGLE_PERIOD_MS:
+                    self.wiggle_dir = not self.wiggle_dir
+                    self.wiggle_timer = now
+                self.output_to_dac1(self.search_speed_left if self.wiggle_dir else 128)
+                self.output_to_dac2(128 if self.wiggle_dir else self.search_speed_right)
+
+            if self.millis() - self.line_lost_time > SEARCH_TIMEOUT:
+                self.left_lost_first = not self.left_lost_first
+                self.right_lost_first = not self.right_lost_first
+                self.line_lost_time = self.millis()
+
+        # ===== STEP 4: UPDATE STATE MEMORY =====
+        self.prev_left_white = left_white
+        self.prev_right_white = right_white
+
+        # ===== STEP 5: DEBUG OUTPUT =====
+        if self.binary_telemetry:
+            self.send_telemetry_frame(left_raw, right_raw, left_white, right_white)
+        else:
+            loss = 'L' if self.left_lost_first else ('R' if self.right_lost_first else '-')
+            self.serial_println(f"L:{left_raw}({'W' if left_white else 'B'}) R:{right_raw}({'W' if right_white else 'B'}) "
+                                f"Loss:{loss} Out:{self.last_out}")
+
+        # ===== STEP 6: HANDLE SERIAL COMMANDS =====
+        self.handle_serial_command()
+        self.check_baud_confirm()
+
+        # ===== STEP 7: LOOP TIMING =====
+        self.delay(LOOP_DELAY_MS)
+
+
+class SimulatedNano(PtyDevice):
+    """
+    FirmwareSimulator behind a pseudo-terminal
+
+    layout.py (any backend) connects to port_name exactly like a real Nano.
+    speed: 1.0 = real time (GUI soak tests), 10.0 = ten times faster,
+           0 = as fast as the host reads (batch tests)
+    """
+
+    def __init__(self, simulator=None, speed=1.0, simulate_baud=True, record_write_times=False):
+        super().__init__(firmware=simulator or FirmwareSimulator(),
+                         record_write_times=record_write_times, simulate_baud=simulate_baud)
+        self.speed = speed
+
+    def _step_interval(self):
+        if self.speed <= 0:
+            return 0
+        return self.firmware.last_loop_ms / 1000.0 / self.speed
+
+    def _uart_block(self, size, baud):
+        return False   # TX time is already on the simulator's virtual clock
+
+
+# ===== SIMULATOR ENTRY POINT =====
+if __name__ == '__main__':
+    """
+      python FIRMWARE_SIM.py               # pty at real time - connect layout.py to the printed port
+      python FIRMWARE_SIM.py --speed 10    # pty at 10x real time
+      python FIRMWARE_SIM.py --batch 60    # headless: 60 simulated seconds as fast as possible
+    """
+    from TELEMETRY_PARSER import parse_lines
+
+    if '--batch' in sys.argv:
+        seconds = float(sys.argv[sys.argv.index('--batch') + 1])
+        sim = FirmwareSimulator(LineTrack(seed=1))
+        start = time.perf_counter()
+        output = sim.boot() + sim.run(seconds * 1000)
+        wall = time.perf_counter() - start
+        columns = parse_lines(output)
+        loss_events = int(((columns['loss'][1:] != 0) & (columns['loss'][:-1] == 0)).sum())
+        print(f"Simulated {sim.clock_ms / 1000:.1f} s in {wall:.2f} s wall ({sim.clock_ms / 1000 / wall:.0f}x real time)")
+        print(f"Loops: {sim.loop_count} ({sim.loop_count / (sim.clock_ms / 1000):.1f} Hz) | "
+              f"telemetry lines: {len(columns['t_ns'])} | serial bytes: {len(output)}")
+        print(f"Laps: {sim.track.laps:.2f} | line-loss events: {loss_events}")
+        sys.exit(0)
+
+    speed = float(sys.argv[sys.argv.index('--speed') + 1]) if '--speed' in sys.argv else 1.0
+    device = SimulatedNano(speed=speed).start()
+    print(f"Simulated Nano on {device.port_name} at {speed:g}x real time (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+            track = device.firmware.track
+            print(f"[Firmware Sim] t={device.firmware.clock_ms / 1000:7.1f}s laps={track.laps:5.2f} "
+                  f"speed L/R={device.firmware.speed_percent_left}/{device.firmware.speed_percent_right}%")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        device.stop()
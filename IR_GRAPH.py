@@ -1,469 +1,664 @@
-import sys
-from collections import deque
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QBrush, QFontDatabase, QPainterPath
-from PyQt5.QtCore import Qt, QTimer, QPointF
-import ctypes
-from ctypes import c_int, byref, sizeof
-import re
-
-# Font paths - NOTE: Adjust these to match your local paths
-CUSTOM_FONT_PATH_POPSTAR = r"C:\Users\Administrator\Documents\MXEN PROJECT\SerialIO_Arduino_Driver_4BytePackage\POPSTAR.TTF"
-CUSTOM_FONT_PATH_EQUINOX = r"C:\Users\Administrator\Documents\MXEN PROJECT\SerialIO_Arduino_Driver_4BytePackage\Groningen-Regular.ttf"
-
-class IRSensorWidget(QWidget):
-    """
-    Real-time IR Sensor Display Widget - UPDATED FOR NEW ARDUINO CODE
-    
-    NEW FEATURES:
-    - Parses Arduino's Serial.print debug output (e.g., "L:45(W) R:120(B)")
-    - No longer sends INPUT requests (Arduino now continuously prints IR values)
-    - Displays line follower status (white/black detection, line loss direction)
-    - Matches 15ms loop rate of Arduino (~67Hz update)
-    
-    PROTOCOL CHANGES:
-    - OLD: Alternating INPUT1/INPUT2 requests with 4-byte responses
-    - NEW: Continuous Serial.print() parsing from Arduino's debug output
-    """
-    
-    # ===== CONFIGURABLE PARAMETERS =====
-    # Update rate: Match Arduino's delay(15) = ~67Hz
-    UPDATE_INTERVAL_MS = 50  # 50ms polling (20Hz) - faster than Arduino's 15ms loop
-    
-    # Graph settings
-    GRAPH_HISTORY_LENGTH = 50  # Number of data points to display
-    SENSOR_MIN = 0             # Minimum sensor value (ADC range)
-    SENSOR_MAX = 1023          # Maximum sensor value (10-bit ADC)
-    
-    # Visual settings
-    LEFT_IR_COLOR = QColor(255, 30, 30)    # Red for Left IR
-    RIGHT_IR_COLOR = QColor(30, 100, 255)  # Dark Blue for Right IR
-    
-    def __init__(self, serial_manager=None):
-        super().__init__()
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setWindowFlags(Qt.FramelessWindowHint)
-        
-        # Serial manager reference (passed from parent)
-        self.serial_manager = serial_manager
-        
-        # Font loading
-        font_id_popstar = QFontDatabase.addApplicationFont(CUSTOM_FONT_PATH_POPSTAR)
-        font_id_equinox = QFontDatabase.addApplicationFont(CUSTOM_FONT_PATH_EQUINOX)
-        self.font_popstar = QFontDatabase.applicationFontFamilies(font_id_popstar)[0] if font_id_popstar != -1 else "Segoe UI"
-        self.font_equinox = QFontDatabase.applicationFontFamilies(font_id_equinox)[0] if font_id_equinox != -1 else "Segoe UI"
-        
-        self.setWindowTitle("IR Sensor Monitor")
-        self.setGeometry(100, 100, 350, 320)  # Increased height for status info
-        
-        # Data storage: Circular buffers for graph history
-        self.left_ir_history = deque([0] * self.GRAPH_HISTORY_LENGTH, maxlen=self.GRAPH_HISTORY_LENGTH)
-        self.right_ir_history = deque([0] * self.GRAPH_HISTORY_LENGTH, maxlen=self.GRAPH_HISTORY_LENGTH)
-        
-        # Current sensor values
-        self.left_ir_value = 0
-        self.right_ir_value = 0
-        
-        # NEW: Line follower status tracking
-        self.left_is_white = False
-        self.right_is_white = False
-        self.line_loss_direction = "-"  # "L", "R", or "-"
-        self.last_output = 0  # -1, 0, or +1
-        
-        self.setup_ui()
-        self.apply_windows_blur()
-        
-        # Timer for continuous sensor polling
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.poll_sensors)
-        self.update_timer.start(self.UPDATE_INTERVAL_MS)
-        
-    def apply_windows_blur(self):
-        """Apply Windows Acrylic/Blur effect to window background"""
-        try:
-            hwnd = int(self.winId())
-            class ACCENTPOLICY(ctypes.Structure):
-                _fields_ = [("AccentState", c_int), ("AccentFlags", c_int), ("GradientColor", c_int), ("AnimationId", c_int)]
-            class WINDOWCOMPOSITIONATTRIBDATA(ctypes.Structure):
-                _fields_ = [("Attrib", c_int), ("Data", ctypes.POINTER(c_int)), ("SizeOfData", c_int)]
-            accent = ACCENTPOLICY()
-            accent.AccentState = 3
-            accent.GradientColor = 0x40000000
-            data = WINDOWCOMPOSITIONATTRIBDATA()
-            data.Attrib = 19
-            data.SizeOfData = sizeof(accent)
-            data.Data = ctypes.cast(ctypes.pointer(accent), ctypes.POINTER(c_int))
-            ctypes.windll.user32.SetWindowCompositionAttribute(hwnd, byref(data))
-        except: pass
-    
-    def paintEvent(self, event):
-        """Draw chamfered frame with glowing red outline (matching motor gauge style)"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        chamfer = 15
-        w, h = self.width(), self.height()
-        
-        # Chamfered background path
-        path = QPainterPath()
-        path.moveTo(chamfer, 0)
-        path.lineTo(w - chamfer, 0)
-        path.lineTo(w, chamfer)
-        path.lineTo(w, h - chamfer)
-        path.lineTo(w - chamfer, h)
-        path.lineTo(chamfer, h)
-        path.lineTo(0, h - chamfer)
-        path.lineTo(0, chamfer)
-        path.lineTo(chamfer, 0)
-        painter.fillPath(path, QColor(18, 18, 18, 90))
-        
-        # Glowing red outline segments (top-right and bottom-left)
-        base_red = QColor(255, 30, 30)
-        
-        # Top-Right segment path
-        tr_path = QPainterPath()
-        tr_path.moveTo(w * 0.4, 0)
-        tr_path.lineTo(w - chamfer, 0)
-        tr_path.lineTo(w, chamfer)
-        tr_path.lineTo(w, h * 0.25)
-        
-        # Bottom-Left segment path
-        bl_path = QPainterPath()
-        bl_path.moveTo(w * 0.6, h)
-        bl_path.lineTo(chamfer, h)
-        bl_path.lineTo(0, h - chamfer)
-        bl_path.lineTo(0, h * 0.75)
-        
-        # Draw glow layers
-        for i in range(3, 0, -1):
-            painter.setPen(QPen(QColor(255, 30, 30, int(25/i)), 2 + i*1.5))
-            painter.drawPath(tr_path)
-            painter.drawPath(bl_path)
-            
-        # Draw main outline
-        painter.setPen(QPen(base_red, 2))
-        painter.drawPath(tr_path)
-        painter.drawPath(bl_path)
-        painter.end()
-    
-    def setup_ui(self):
-        """Build the widget UI structure"""
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(8, 5, 8, 5)
-        main_layout.setSpacing(3)
-        
-        # Title
-        title = QLabel("IR SENSOR READINGS")
-        title.setFont(QFont(self.font_popstar, 11, QFont.Bold))
-        title.setStyleSheet("color: #FF3030; background: transparent;")
-        title.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(title)
-        
-        # Numeric displays (Left and Right IR values)
-        numeric_layout = QHBoxLayout()
-        numeric_layout.setSpacing(10)
-        
-        # Left IR Display
-        left_container = QVBoxLayout()
-        left_container.setSpacing(0)
-        left_label = QLabel("LEFT IR (A6)")
-        left_label.setFont(QFont(self.font_popstar, 7, QFont.Bold))
-        left_label.setStyleSheet("color: white; background: transparent;")
-        left_label.setAlignment(Qt.AlignCenter)
-        self.left_value_label = QLabel("0")
-        self.left_value_label.setFont(QFont(self.font_popstar, 20, QFont.Bold))
-        self.left_value_label.setStyleSheet("color: #FF3030; background: transparent;")
-        self.left_value_label.setAlignment(Qt.AlignCenter)
-        left_container.addWidget(left_label)
-        left_container.addWidget(self.left_value_label)
-        
-        # NEW: White/Black indicator for Left
-        self.left_status_label = QLabel("●")
-        self.left_status_label.setFont(QFont(self.font_popstar, 12))
-        self.left_status_label.setStyleSheet("color: #888888; background: transparent;")
-        self.left_status_label.setAlignment(Qt.AlignCenter)
-        left_container.addWidget(self.left_status_label)
-        
-        numeric_layout.addLayout(left_container)
-        
-        # Right IR Display
-        right_container = QVBoxLayout()
-        right_container.setSpacing(0)
-        right_label = QLabel("RIGHT IR (A7)")
-        right_label.setFont(QFont(self.font_popstar, 7, QFont.Bold))
-        right_label.setStyleSheet("color: white; background: transparent;")
-        right_label.setAlignment(Qt.AlignCenter)
-        self.right_value_label = QLabel("0")
-        self.right_value_label.setFont(QFont(self.font_popstar, 20, QFont.Bold))
-        self.right_value_label.setStyleSheet("color: #1E64FF; background: transparent;")
-        self.right_value_label.setAlignment(Qt.AlignCenter)
-        right_container.addWidget(right_label)
-        right_container.addWidget(self.right_value_label)
-        
-        # NEW: White/Black indicator for Right
-        self.right_status_label = QLabel("●")
-        self.right_status_label.setFont(QFont(self.font_popstar, 12))
-        self.right_status_label.setStyleSheet("color: #888888; background: transparent;")
-        self.right_status_label.setAlignment(Qt.AlignCenter)
-        right_container.addWidget(self.right_status_label)
-        
-        numeric_layout.addLayout(right_container)
-        
-        main_layout.addLayout(numeric_layout)
-        
-        # NEW: Line Follower Status Display
-        status_container = QHBoxLayout()
-        status_container.setSpacing(10)
-        status_container.setAlignment(Qt.AlignCenter)
-        
-        # Loss Direction Indicator
-        loss_label = QLabel("LOSS DIR:")
-        loss_label.setFont(QFont(self.font_popstar, 7))
-        loss_label.setStyleSheet("color: #888888; background: transparent;")
-        self.loss_indicator = QLabel("-")
-        self.loss_indicator.setFont(QFont(self.font_popstar, 10, QFont.Bold))
-        self.loss_indicator.setStyleSheet("color: #FF3030; background: transparent;")
-        
-        # Output Direction Indicator
-        output_label = QLabel("OUTPUT:")
-        output_label.setFont(QFont(self.font_popstar, 7))
-        output_label.setStyleSheet("color: #888888; background: transparent;")
-        self.output_indicator = QLabel("0")
-        self.output_indicator.setFont(QFont(self.font_popstar, 10, QFont.Bold))
-        self.output_indicator.setStyleSheet("color: #1E64FF; background: transparent;")
-        
-        status_container.addWidget(loss_label)
-        status_container.addWidget(self.loss_indicator)
-        status_container.addSpacing(15)
-        status_container.addWidget(output_label)
-        status_container.addWidget(self.output_indicator)
-        
-        main_layout.addLayout(status_container)
-        
-        # Graph display widget (custom painted)
-        self.graph_widget = QWidget()
-        self.graph_widget.setMinimumHeight(120)
-        self.graph_widget.paintEvent = self.paint_graph
-        main_layout.addWidget(self.graph_widget)
-        
-        # Legend
-        legend_layout = QHBoxLayout()
-        legend_layout.setAlignment(Qt.AlignCenter)
-        legend_layout.setSpacing(15)
-        
-        left_legend = QLabel("● Left IR")
-        left_legend.setFont(QFont(self.font_popstar, 7))
-        left_legend.setStyleSheet("color: #FF3030; background: transparent;")
-        
-        right_legend = QLabel("● Right IR")
-        right_legend.setFont(QFont(self.font_popstar, 7))
-        right_legend.setStyleSheet("color: #1E64FF; background: transparent;")
-        
-        legend_layout.addWidget(left_legend)
-        legend_layout.addWidget(right_legend)
-        main_layout.addLayout(legend_layout)
-    
-    def paint_graph(self, event):
-        """
-        Draw the scrolling line graph with glowing lines
-        - Red line for Left IR (A6)
-        - Dark Blue line for Right IR (A7)
-        """
-        painter = QPainter(self.graph_widget)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        w = self.graph_widget.width()
-        h = self.graph_widget.height()
-        
-        # Background
-        painter.fillRect(0, 0, w, h, QColor(10, 10, 10, 150))
-        
-        # Grid lines (horizontal - for sensor values)
-        painter.setPen(QPen(QColor(40, 40, 40), 1))
-        grid_steps = 4
-        for i in range(grid_steps + 1):
-            y = h - (i * h / grid_steps)
-            painter.drawLine(0, int(y), w, int(y))
-            # Value labels
-            value = int(self.SENSOR_MIN + (self.SENSOR_MAX - self.SENSOR_MIN) * (i / grid_steps))
-            painter.setPen(QColor(80, 80, 80))
-            painter.setFont(QFont("Consolas", 7))
-            painter.drawText(5, int(y) - 2, str(value))
-            painter.setPen(QPen(QColor(40, 40, 40), 1))
-        
-        # Convert data to screen coordinates
-        def map_to_screen(value, index, total_points):
-            """Map sensor value and index to screen coordinates"""
-            x = (index / (total_points - 1)) * w if total_points > 1 else 0
-            y = h - ((value - self.SENSOR_MIN) / (self.SENSOR_MAX - self.SENSOR_MIN)) * h
-            return QPointF(x, max(0, min(h, y)))
-        
-        # Draw Left IR line (RED with glow)
-        if len(self.left_ir_history) > 1:
-            points = [map_to_screen(val, i, len(self.left_ir_history)) 
-                     for i, val in enumerate(self.left_ir_history)]
-            
-            # Glow layers (3 passes with decreasing alpha)
-            for glow_width in [6, 4, 2]:
-                painter.setPen(QPen(QColor(255, 30, 30, 40), glow_width))
-                for i in range(len(points) - 1):
-                    painter.drawLine(points[i], points[i + 1])
-            
-            # Main line
-            painter.setPen(QPen(self.LEFT_IR_COLOR, 2))
-            for i in range(len(points) - 1):
-                painter.drawLine(points[i], points[i + 1])
-        
-        # Draw Right IR line (DARK BLUE with glow)
-        if len(self.right_ir_history) > 1:
-            points = [map_to_screen(val, i, len(self.right_ir_history)) 
-                     for i, val in enumerate(self.right_ir_history)]
-            
-            # Glow layers
-            for glow_width in [6, 4, 2]:
-                painter.setPen(QPen(QColor(30, 100, 255, 40), glow_width))
-                for i in range(len(points) - 1):
-                    painter.drawLine(points[i], points[i + 1])
-            
-            # Main line
-            painter.setPen(QPen(self.RIGHT_IR_COLOR, 2))
-            for i in range(len(points) - 1):
-                painter.drawLine(points[i], points[i + 1])
-        
-        painter.end()
-    
-    def poll_sensors(self):
-        """
-        NEW METHOD: Parse Arduino's Serial.print() debug output
-        
-        Expected format from Arduino (example):
-        "L:45(W) R:120(B) Loss:L Out:-1"
-        
-        Regex patterns:
-        - L:(\d+)     → Left IR raw value
-        - \(W\|\(B\)  → White/Black detection
-        - R:(\d+)     → Right IR raw value
-        - Loss:([LR-])→ Line loss direction
-        - Out:([-+]?\d+) → Output direction
-        """
-        if not self.serial_manager or not self.serial_manager.is_connected:
-            return
-        
-        try:
-            port = self.serial_manager.serial_port
-            
-            # Read all available lines (Arduino prints at ~67Hz)
-            while port.in_waiting > 0:
-                line = port.readline().decode('utf-8', errors='ignore').strip()
-                
-                if line and "L:" in line and "R:" in line:
-                    # Parse left sensor value
-                    left_match = re.search(r'L:(\d+)', line)
-                    if left_match:
-                        self.left_ir_value = int(left_match.group(1))
-                        self.left_ir_history.append(self.left_ir_value)
-                        self.left_value_label.setText(str(self.left_ir_value))
-                    
-                    # Parse left white/black status
-                    if "(W)" in line[:line.index("R:")]:
-                        self.left_is_white = True
-                        self.left_status_label.setText("⬜")
-                        self.left_status_label.setStyleSheet("color: #FFFFFF; background: transparent;")
-                    elif "(B)" in line[:line.index("R:")]:
-                        self.left_is_white = False
-                        self.left_status_label.setText("⬛")
-                        self.left_status_label.setStyleSheet("color: #333333; background: transparent;")
-                    
-                    # Parse right sensor value
-                    right_match = re.search(r'R:(\d+)', line)
-                    if right_match:
-                        self.right_ir_value = int(right_match.group(1))
-                        self.right_ir_history.append(self.right_ir_value)
-                        self.right_value_label.setText(str(self.right_ir_value))
-                    
-                    # Parse right white/black status
-                    if "(W)" in line[line.index("R:"):]:
-                        self.right_is_white = True
-                        self.right_status_label.setText("⬜")
-                        self.right_status_label.setStyleSheet("color: #FFFFFF; background: transparent;")
-                    elif "(B)" in line[line.index("R:"):]:
-                        self.right_is_white = False
-                        self.right_status_label.setText("⬛")
-                        self.right_status_label.setStyleSheet("color: #333333; background: transparent;")
-                    
-                    # Parse line loss direction
-                    loss_match = re.search(r'Loss:([LR\-])', line)
-                    if loss_match:
-                        self.line_loss_direction = loss_match.group(1)
-                        self.loss_indicator.setText(self.line_loss_direction)
-                    
-                    # Parse output direction
-                    output_match = re.search(r'Out:([-+]?\d+)', line)
-                    if output_match:
-                        self.last_output = int(output_match.group(1))
-                        self.output_indicator.setText(str(self.last_output))
-        
-        except Exception as e:
-            # Silently handle errors to prevent UI freezing
-            pass
-        
-        # Force graph redraw
-        self.graph_widget.update()
-    
-    def set_serial_manager(self, serial_manager):
-        """Allow external assignment of serial manager (for layout integration)"""
-        self.serial_manager = serial_manager
-    
-    # Mouse events for dragging the frameless window
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.drag_pos = event.globalPos() - self.frameGeometry().topLeft()
-    
-    def mouseMoveEvent(self, event):
-        if event.buttons() == Qt.LeftButton and hasattr(self, 'drag_pos'):
-            self.move(event.globalPos() - self.drag_pos)
-
-
-# ===== STANDALONE TESTING =====
-if __name__ == '__main__':
-    """
-    Test the widget standalone without serial connection
-    Simulates random sensor data for visualization testing
-    """
-    import random
-    
-    app = QApplication(sys.argv)
-    
-    # Create widget without serial manager (simulation mode)
-    window = IRSensorWidget(serial_manager=None)
-    
-    # Simulate sensor data with a timer
-    def simulate_data():
-        window.left_ir_value = random.randint(20, 800)
-        window.right_ir_value = random.randint(20, 800)
-        window.left_ir_history.append(window.left_ir_value)
-        window.right_ir_history.append(window.right_ir_value)
-        window.left_value_label.setText(str(window.left_ir_value))
-        window.right_value_label.setText(str(window.right_ir_value))
-        
-        # Simulate white/black detection
-        window.left_is_white = window.left_ir_value < 100
-        window.right_is_white = window.right_ir_value < 100
-        
-        window.left_status_label.setText("⬜" if window.left_is_white else "⬛")
-        window.left_status_label.setStyleSheet(f"color: {'#FFFFFF' if window.left_is_white else '#333333'}; background: transparent;")
-        window.right_status_label.setText("⬜" if window.right_is_white else "⬛")
-        window.right_status_label.setStyleSheet(f"color: {'#FFFFFF' if window.right_is_white else '#333333'}; background: transparent;")
-        
-        # Simulate line loss/output
-        window.loss_indicator.setText(random.choice(["L", "R", "-"]))
-        window.output_indicator.setText(str(random.choice([-1, 0, 1])))
-        
-        window.graph_widget.update()
-    
-    sim_timer = QTimer()
-    sim_timer.timeout.connect(simulate_data)
-    sim_timer.start(50)  # Match UPDATE_INTERVAL_MS
-    
-    window.show()
+import sys
+import time
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QBrush, QFontDatabase, QPixmap, QPolygonF
+from PyQt5.QtCore import Qt, QTimer, QRectF
+import ctypes
+import numpy as np
+from ctypes import c_int, byref, sizeof
+from CHAMFER_FRAME import ChamferedFrameWidget
+from SERIAL_BUFFER import LatencyMeter
+from TELEMETRY_STORE import TelemetryStore
+from CALIBRATION import ThresholdCalibrator
+from MINMAX_PYRAMID import StreamingEnvelope
+from ROLLING_STATS import SensorStats
+from RENDER_SCHEDULER import RenderScheduler
+from EVENT_DETECTOR import event_text, EVENT_LINE_LOST, EVENT_LINE_REACQUIRED, EVENT_SEARCH_FLIP, EVENT_SENSOR_STUCK
+
+# Font paths - NOTE: Adjust these to match your local paths
+CUSTOM_FONT_PATH_POPSTAR = r"C:\Users\Administrator\Documents\MXEN PROJECT\SerialIO_Arduino_Driver_4BytePackage\POPSTAR.TTF"
+CUSTOM_FONT_PATH_EQUINOX = r"C:\Users\Administrator\Documents\MXEN PROJECT\SerialIO_Arduino_Driver_4BytePackage\Groningen-Regular.ttf"
+
+class IRSensorWidget(ChamferedFrameWidget):
+    """
+    Real-time IR Sensor Display Widget - UPDATED FOR NEW ARDUINO CODE
+    
+    NEW FEATURES:
+    - Receives parsed TelemetrySample objects from SerialReaderThread (e.g., "L:45(W) R:120(B)")
+    - No longer sends INPUT requests (Arduino now continuously prints IR values)
+    - Displays line follower status (white/black detection, line loss direction)
+    - Updates on every sample the Arduino prints (~67Hz, 15ms loop)
+    
+    PROTOCOL CHANGES:
+    - OLD: Alternating INPUT1/INPUT2 requests with 4-byte responses
+    - NEW: Continuous Serial.print() parsing from Arduino's debug output
+    - The widget never reads the serial port itself; connect
+      SerialReaderThread.sample_received to on_telemetry_sample()
+    - Graph history comes from the shared TelemetryStore (set_telemetry_store);
+      without one the widget keeps a small private store of its own
+    - CALIBRATE: sweep the sensors over the line, Otsu thresholds per sensor are
+      pushed to the robot (W<l>,<r>) and drawn as dashed lines on the graph
+    - Rolling mean/std/min-max/rate under each value (SensorStats, O(1) per sample,
+      no history rescan on repaint); hover for every window
+    - EVT: latest robot event - connect EventDetector.event_detected to on_robot_event
+    - Long history (GRAPH_HISTORY_LENGTH samples) drawn as a per-pixel min/max band
+      once it holds more samples than the graph has pixels, so spikes stay visible
+      and the paint cost follows the graph width, not the history length
+    - on_telemetry_sample only records values; labels and the graph are applied by a
+      RenderScheduler at most RENDER_FPS times a second (latest value per label)
+    """
+    
+    # ===== CONFIGURABLE PARAMETERS =====
+    # Graph settings
+    GRAPH_HISTORY_LENGTH = 20000  # Samples in the graph (~5 min at 67Hz), min/max per pixel
+    SENSOR_MIN = 0             # Minimum sensor value (ADC range)
+    SENSOR_MAX = 1023          # Maximum sensor value (10-bit ADC)
+    WHITE_THRESHOLD = 30       # FINALArduino.ino default until calibrated
+    
+    # Latency label refresh (every N samples, ~0.25s at 67Hz)
+    LATENCY_REFRESH_SAMPLES = 16
+    
+    # Rolling statistics windows in samples (~0.25s, 1s, 10s) and the one shown
+    STATS_WINDOWS = (16, 67, 670)
+    STATS_DISPLAY_WINDOW = 67
+    STATS_REFRESH_SAMPLES = 8
+    
+    # Labels and graph are redrawn at most this often, however fast samples arrive
+    RENDER_FPS = 30
+    
+    # Visual settings
+    LEFT_IR_COLOR = QColor(255, 30, 30)    # Red for Left IR
+    RIGHT_IR_COLOR = QColor(30, 100, 255)  # Dark Blue for Right IR
+    GLOW_WIDTHS = (6, 4, 2)                # Glow passes under each line (alpha 40)
+    GRID_STEPS = 4
+    STROKE_CHUNK = 4                       # Segments per drawPolyline call (see paint_graph)
+    WHITE_STATUS_STYLE = "color: #FFFFFF; background: transparent;"
+    BLACK_STATUS_STYLE = "color: #333333; background: transparent;"
+    
+    def __init__(self, serial_manager=None):
+        super().__init__()
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setWindowFlags(Qt.FramelessWindowHint)
+        
+        # Serial manager reference (passed from parent)
+        self.serial_manager = serial_manager
+        
+        # Font loading
+        font_id_popstar = QFontDatabase.addApplicationFont(CUSTOM_FONT_PATH_POPSTAR)
+        font_id_equinox = QFontDatabase.addApplicationFont(CUSTOM_FONT_PATH_EQUINOX)
+        self.font_popstar = QFontDatabase.applicationFontFamilies(font_id_popstar)[0] if font_id_popstar != -1 else "Segoe UI"
+        self.font_equinox = QFontDatabase.applicationFontFamilies(font_id_equinox)[0] if font_id_equinox != -1 else "Segoe UI"
+        
+        self.setWindowTitle("IR Sensor Monitor")
+        self.setGeometry(100, 100, 350, 320)  # Increased height for status info
+        
+        # Data storage: graph history is read from a TelemetryStore window
+        # (private until layout.py shares the application-wide store)
+        self.telemetry_store = TelemetryStore(self.GRAPH_HISTORY_LENGTH)
+        self.owns_telemetry_store = True
+        
+        # Current sensor values
+        self.left_ir_value = 0
+        self.right_ir_value = 0
+        
+        # NEW: Line follower status tracking
+        self.left_is_white = False
+        self.right_is_white = False
+        self.line_loss_direction = "-"  # "L", "R", or "-"
+        self.last_output = 0  # -1, 0, or +1
+        
+        # White thresholds the robot confirmed (left, right)
+        self.white_thresholds = (self.WHITE_THRESHOLD, self.WHITE_THRESHOLD)
+        self.calibrator = ThresholdCalibrator(self)
+        self.calibrator.progress.connect(self.on_calibration_progress)
+        self.calibrator.finished.connect(self.on_calibration_finished)
+        self.calibrator.confirmed.connect(self.on_thresholds_confirmed)
+        
+        # Byte arrival (sample.t_ns) → widget update latency, ended when the frame is applied
+        self.latency_meter = LatencyMeter()
+        self.latency_pending_ns = []   # t_ns of samples not drawn yet
+        self.latency_samples = 0
+        self.measure_latency = True    # Off while replaying (stamps are not receive times)
+        self.samples_received = 0
+        
+        # Rolling per-channel statistics (updated per sample, read on refresh)
+        self.sensor_stats = SensorStats(self.STATS_WINDOWS)
+        
+        # Graph rendering: static layer cached per size, pens built once
+        self.grid_pixmap = None
+        self.grid_pixmap_key = None
+        self.series_pens = [self.make_series_pens(color) for color in (self.LEFT_IR_COLOR, self.RIGHT_IR_COLOR)]
+        self.graph_envelope = StreamingEnvelope(self.GRAPH_HISTORY_LENGTH, 1)
+        
+        # Own frame governor until layout.py shares the application-wide one
+        self.render_scheduler = RenderScheduler(self.RENDER_FPS, self)
+        
+        self.setup_ui()
+        self.apply_windows_blur()
+        
+    def apply_windows_blur(self):
+        """Apply Windows Acrylic/Blur effect to window background"""
+        try:
+            hwnd = int(self.winId())
+            class ACCENTPOLICY(ctypes.Structure):
+                _fields_ = [("AccentState", c_int), ("AccentFlags", c_int), ("GradientColor", c_int), ("AnimationId", c_int)]
+            class WINDOWCOMPOSITIONATTRIBDATA(ctypes.Structure):
+                _fields_ = [("Attrib", c_int), ("Data", ctypes.POINTER(c_int)), ("SizeOfData", c_int)]
+            accent = ACCENTPOLICY()
+            accent.AccentState = 3
+            accent.GradientColor = 0x40000000
+            data = WINDOWCOMPOSITIONATTRIBDATA()
+            data.Attrib = 19
+            data.SizeOfData = sizeof(accent)
+            data.Data = ctypes.cast(ctypes.pointer(accent), ctypes.POINTER(c_int))
+            ctypes.windll.user32.SetWindowCompositionAttribute(hwnd, byref(data))
+        except: pass
+    
+    def setup_ui(self):
+        """Build the widget UI structure"""
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(8, 5, 8, 5)
+        main_layout.setSpacing(3)
+        
+        # Title
+        title = QLabel("IR SENSOR READINGS")
+        title.setFont(QFont(self.font_popstar, 11, QFont.Bold))
+        title.setStyleSheet("color: #FF3030; background: transparent;")
+        title.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(title)
+        
+        # Numeric displays (Left and Right IR values)
+        numeric_layout = QHBoxLayout()
+        numeric_layout.setSpacing(10)
+        
+        # Left IR Display
+        left_container = QVBoxLayout()
+        left_container.setSpacing(0)
+        left_label = QLabel("LEFT IR (A6)")
+        left_label.setFont(QFont(self.font_popstar, 7, QFont.Bold))
+        left_label.setStyleSheet("color: white; background: transparent;")
+        left_label.setAlignment(Qt.AlignCenter)
+        self.left_value_label = QLabel("0")
+        self.left_value_label.setFont(QFont(self.font_popstar, 20, QFont.Bold))
+        self.left_value_label.setStyleSheet("color: #FF3030; background: transparent;")
+        self.left_value_label.setAlignment(Qt.AlignCenter)
+        left_container.addWidget(left_label)
+        left_container.addWidget(self.left_value_label)
+        
+        # NEW: White/Black indicator for Left
+        self.left_status_label = QLabel("●")
+        self.left_status_label.setFont(QFont(self.font_popstar, 12))
+        self.left_status_label.setStyleSheet("color: #888888; background: transparent;")
+        self.left_status_label.setAlignment(Qt.AlignCenter)
+        left_container.addWidget(self.left_status_label)
+        
+        self.left_stats_label = QLabel("-")
+        self.left_stats_label.setFont(QFont(self.font_popstar, 6))
+        self.left_stats_label.setStyleSheet("color: #888888; background: transparent;")
+        self.left_stats_label.setAlignment(Qt.AlignCenter)
+        left_container.addWidget(self.left_stats_label)
+        
+        numeric_layout.addLayout(left_container)
+        
+        # Right IR Display
+        right_container = QVBoxLayout()
+        right_container.setSpacing(0)
+        right_label = QLabel("RIGHT IR (A7)")
+        right_label.setFont(QFont(self.font_popstar, 7, QFont.Bold))
+        right_label.setStyleSheet("color: white; background: transparent;")
+        right_label.setAlignment(Qt.AlignCenter)
+        self.right_value_label = QLabel("0")
+        self.right_value_label.setFont(QFont(self.font_popstar, 20, QFont.Bold))
+        self.right_value_label.setStyleSheet("color: #1E64FF; background: transparent;")
+        self.right_value_label.setAlignment(Qt.AlignCenter)
+        right_container.addWidget(right_label)
+        right_container.addWidget(self.right_value_label)
+        
+        # NEW: White/Black indicator for Right
+        self.right_status_label = QLabel("●")
+        self.right_status_label.setFont(QFont(self.font_popstar, 12))
+        self.right_status_label.setStyleSheet("color: #888888; background: transparent;")
+        self.right_status_label.setAlignment(Qt.AlignCenter)
+        right_container.addWidget(self.right_status_label)
+        
+        self.right_stats_label = QLabel("-")
+        self.right_stats_label.setFont(QFont(self.font_popstar, 6))
+        self.right_stats_label.setStyleSheet("color: #888888; background: transparent;")
+        self.right_stats_label.setAlignment(Qt.AlignCenter)
+        right_container.addWidget(self.right_stats_label)
+        
+        numeric_layout.addLayout(right_container)
+        
+        main_layout.addLayout(numeric_layout)
+        
+        # NEW: Line Follower Status Display
+        status_container = QHBoxLayout()
+        status_container.setSpacing(10)
+        status_container.setAlignment(Qt.AlignCenter)
+        
+        # Loss Direction Indicator
+        loss_label = QLabel("LOSS DIR:")
+        loss_label.setFont(QFont(self.font_popstar, 7))
+        loss_label.setStyleSheet("color: #888888; background: transparent;")
+        self.loss_indicator = QLabel("-")
+        self.loss_indicator.setFont(QFont(self.font_popstar, 10, QFont.Bold))
+        self.loss_indicator.setStyleSheet("color: #FF3030; background: transparent;")
+        
+        # Output Direction Indicator
+        output_label = QLabel("OUTPUT:")
+        output_label.setFont(QFont(self.font_popstar, 7))
+        output_label.setStyleSheet("color: #888888; background: transparent;")
+        self.output_indicator = QLabel("0")
+        self.output_indicator.setFont(QFont(self.font_popstar, 10, QFont.Bold))
+        self.output_indicator.setStyleSheet("color: #1E64FF; background: transparent;")
+        
+        status_container.addWidget(loss_label)
+        status_container.addWidget(self.loss_indicator)
+        status_container.addSpacing(15)
+        status_container.addWidget(output_label)
+        status_container.addWidget(self.output_indicator)
+        
+        # Byte arrival → widget update latency (p50 over the last samples)
+        latency_label = QLabel("LAT:")
+        latency_label.setFont(QFont(self.font_popstar, 7))
+        latency_label.setStyleSheet("color: #888888; background: transparent;")
+        self.latency_indicator = QLabel("-")
+        self.latency_indicator.setFont(QFont(self.font_popstar, 8, QFont.Bold))
+        self.latency_indicator.setStyleSheet("color: #FFFFFF; background: transparent;")
+        status_container.addSpacing(15)
+        status_container.addWidget(latency_label)
+        status_container.addWidget(self.latency_indicator)
+        
+        # Latest robot event (EventDetector.event_detected)
+        event_label = QLabel("EVT:")
+        event_label.setFont(QFont(self.font_popstar, 7))
+        event_label.setStyleSheet("color: #888888; background: transparent;")
+        self.event_indicator = QLabel("-")
+        self.event_indicator.setFont(QFont(self.font_popstar, 8, QFont.Bold))
+        self.event_indicator.setStyleSheet("color: #FFFFFF; background: transparent;")
+        status_container.addSpacing(15)
+        status_container.addWidget(event_label)
+        status_container.addWidget(self.event_indicator)
+        
+        main_layout.addLayout(status_container)
+        
+        # Graph display widget (custom painted)
+        self.graph_widget = QWidget()
+        self.graph_widget.setMinimumHeight(120)
+        self.graph_widget.paintEvent = self.paint_graph
+        main_layout.addWidget(self.graph_widget)
+        
+        # Legend
+        legend_layout = QHBoxLayout()
+        legend_layout.setAlignment(Qt.AlignCenter)
+        legend_layout.setSpacing(15)
+        
+        left_legend = QLabel("● Left IR")
+        left_legend.setFont(QFont(self.font_popstar, 7))
+        left_legend.setStyleSheet("color: #FF3030; background: transparent;")
+        
+        right_legend = QLabel("● Right IR")
+        right_legend.setFont(QFont(self.font_popstar, 7))
+        right_legend.setStyleSheet("color: #1E64FF; background: transparent;")
+        
+        legend_layout.addWidget(left_legend)
+        legend_layout.addWidget(right_legend)
+        
+        # Threshold calibration
+        self.calibrate_btn = QPushButton("CALIBRATE")
+        self.calibrate_btn.setCursor(Qt.PointingHandCursor)
+        self.calibrate_btn.setStyleSheet("""
+            QPushButton {
+                background-color: rgba(40, 40, 40, 180);
+                color: #FF3030;
+                border: 1px solid #FF3030;
+                border-radius: 3px;
+                font-family: Consolas;
+                font-size: 7pt;
+                font-weight: bold;
+                padding: 1px 6px;
+            }
+            QPushButton:hover {
+                background-color: rgba(255, 30, 30, 80);
+                color: white;
+            }
+        """)
+        self.calibrate_btn.clicked.connect(self.start_calibration)
+        legend_layout.addWidget(self.calibrate_btn)
+        main_layout.addLayout(legend_layout)
+    
+    def make_series_pens(self, color):
+        """(glow pens, main pen) for one series"""
+        glow = QColor(color.red(), color.green(), color.blue(), 40)
+        return [QPen(glow, width) for width in self.GLOW_WIDTHS], QPen(color, 2)
+    
+    def value_to_y(self, values, h):
+        """Sensor value(s) -> y pixel (0 at the top), clamped to the graph"""
+        return np.clip(h - (np.asarray(values, dtype=np.float64) - self.SENSOR_MIN)
+                       * (h / (self.SENSOR_MAX - self.SENSOR_MIN)), 0, h)
+    
+    @staticmethod
+    def make_polygon(xs, ys):
+        """QPolygonF filled in place through its buffer (no QPointF per sample)"""
+        polygon = QPolygonF(len(xs))
+        buffer = polygon.data()
+        buffer.setsize(len(xs) * 2 * np.dtype(np.float64).itemsize)
+        points = np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)
+        points[:, 0] = xs
+        points[:, 1] = ys
+        return polygon
+    
+    def grid_layer(self, w, h):
+        """
+        Background, grid, value labels and threshold lines as one cached pixmap
+        Rebuilt only when the size (or a confirmed threshold) changes
+        """
+        ratio = self.graph_widget.devicePixelRatioF()
+        key = (w, h, ratio, self.white_thresholds)
+        if self.grid_pixmap is not None and self.grid_pixmap_key == key:
+            return self.grid_pixmap
+        
+        pixmap = QPixmap(int(w * ratio), int(h * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Background
+        painter.fillRect(0, 0, w, h, QColor(10, 10, 10, 150))
+        
+        # Grid lines (horizontal - for sensor values) and value labels
+        grid_pen = QPen(QColor(40, 40, 40), 1)
+        label_pen = QPen(QColor(80, 80, 80))
+        painter.setFont(QFont("Consolas", 7))
+        for i in range(self.GRID_STEPS + 1):
+            y = int(h - (i * h / self.GRID_STEPS))
+            painter.setPen(grid_pen)
+            painter.drawLine(0, y, w, y)
+            value = int(self.SENSOR_MIN + (self.SENSOR_MAX - self.SENSOR_MIN) * (i / self.GRID_STEPS))
+            painter.setPen(label_pen)
+            painter.drawText(5, y - 2, str(value))
+        
+        # White thresholds (dashed, sensor colours): raw <= threshold reads as white
+        for threshold, color in zip(self.white_thresholds, (self.LEFT_IR_COLOR, self.RIGHT_IR_COLOR)):
+            y = int(self.value_to_y(threshold, h))
+            painter.setPen(QPen(QColor(color.red(), color.green(), color.blue(), 140), 1, Qt.DashLine))
+            painter.drawLine(0, y, w, y)
+        
+        painter.end()
+        self.grid_pixmap = pixmap
+        self.grid_pixmap_key = key
+        return pixmap
+    
+    def paint_lines(self, painter, w, h):
+        """
+        History no longer than the graph is wide: every sample is a vertex
+        
+        Each series is one QPolygonF built from NumPy, stroked per glow pass and for
+        the main line in STROKE_CHUNK-segment pieces: one wide, translucent polyline
+        over the whole history makes the rasteriser fill a self-overlapping outline
+        (10x slower than per-segment lines at 500 points); short pieces keep the
+        rasteriser linear and still need 4x fewer calls.
+        """
+        # Newest samples straight from the store (zero-copy views), right-aligned
+        # so the trace scrolls in from the right while the history fills up
+        history = self.telemetry_store.window(self.GRAPH_HISTORY_LENGTH, ('left_raw', 'right_raw'))
+        count = len(history['left_raw'])
+        if count < 2:
+            return
+        painter.setRenderHint(QPainter.Antialiasing)
+        offset = self.GRAPH_HISTORY_LENGTH - count
+        xs = np.arange(offset, offset + count) * (w / (self.GRAPH_HISTORY_LENGTH - 1))
+        for values, (glow_pens, main_pen) in zip((history['left_raw'], history['right_raw']), self.series_pens):
+            polygon = self.make_polygon(xs, self.value_to_y(values, h))
+            pieces = [polygon.mid(i, self.STROKE_CHUNK + 1) for i in range(0, count - 1, self.STROKE_CHUNK)]
+            for pen in glow_pens + [main_pen]:
+                painter.setPen(pen)
+                for piece in pieces:
+                    painter.drawPolyline(piece)
+    
+    def paint_envelope(self, painter, w, h):
+        """
+        History longer than the graph is wide: one min/max bucket per pixel column
+        (StreamingEnvelope only reduces the samples that arrived since the last paint)
+        
+        Each column is a rectangle from its minimum to its maximum, stretched to reach
+        the previous column's range so a jump between columns stays joined like a line.
+        Filled once per glow layer and once for the line, grown by half of that layer's
+        pen width so a flat trace looks like the stroked line. Column rectangles fill
+        ~10x faster than one jagged band polygon of the same outline.
+        """
+        if self.graph_envelope.pixels != w:
+            self.graph_envelope.resize(w)
+        envelope = self.graph_envelope.update(self.telemetry_store)
+        if len(envelope['offset']) == 0:
+            return
+        painter.setPen(Qt.NoPen)
+        lefts = np.floor(envelope['offset'] * (w / self.GRAPH_HISTORY_LENGTH)).clip(0, w)
+        widths = (np.append(lefts[1:], w) - lefts).tolist()
+        lefts = lefts.tolist()
+        for name, (glow_pens, main_pen) in zip(('left_raw', 'right_raw'), self.series_pens):
+            highs = envelope[f'{name}_max']
+            lows = envelope[f'{name}_min']
+            tops = self.value_to_y(np.maximum(highs, np.append(lows[:1], lows[:-1])), h).tolist()
+            bottoms = self.value_to_y(np.minimum(lows, np.append(highs[:1], highs[:-1])), h).tolist()
+            for pen in glow_pens + [main_pen]:
+                half = pen.widthF() / 2
+                painter.setBrush(pen.color())
+                painter.drawRects([QRectF(x, top - half, width, bottom - top + 2 * half)
+                                   for x, width, top, bottom in zip(lefts, widths, tops, bottoms)])
+    
+    def paint_graph(self, event):
+        """
+        Draw the scrolling line graph with glowing lines
+        - Red line for Left IR (A6)
+        - Dark Blue line for Right IR (A7)
+        - Static layer from grid_layer(), then the series: one polyline per series
+          (paint_lines) or a per-pixel min/max band for long histories (paint_envelope)
+        """
+        painter = QPainter(self.graph_widget)
+        
+        w = self.graph_widget.width()
+        h = self.graph_widget.height()
+        painter.drawPixmap(0, 0, self.grid_layer(w, h))
+        
+        if self.GRAPH_HISTORY_LENGTH > w:
+            self.paint_envelope(painter, w, h)
+        else:
+            self.paint_lines(painter, w, h)
+        
+        painter.end()
+    
+    def on_telemetry_sample(self, sample):
+        """
+        Slot for SerialReaderThread.sample_received
+        
+        The reader has already parsed the Arduino line, e.g.
+        "L:45(W) R:120(B) Loss:L Out:-1" → TelemetrySample(left_raw=45, left_white=True, ...)
+        A shared store is filled by layout.py before this slot runs
+        """
+        if self.owns_telemetry_store:
+            self.telemetry_store.append(sample)
+        self.calibrator.on_sample(sample)
+        self.sensor_stats.on_sample(sample)
+        
+        # Current values; the labels and the graph follow at the next frame
+        self.left_ir_value = sample.left_raw
+        self.left_is_white = sample.left_white
+        self.right_ir_value = sample.right_raw
+        self.right_is_white = sample.right_white
+        self.line_loss_direction = sample.loss
+        self.last_output = sample.out
+        
+        scheduler = self.render_scheduler
+        scheduler.set_text(self.left_value_label, str(self.left_ir_value))
+        scheduler.set_text(self.right_value_label, str(self.right_ir_value))
+        for label, is_white in ((self.left_status_label, self.left_is_white),
+                                (self.right_status_label, self.right_is_white)):
+            scheduler.set_text(label, "⬜" if is_white else "⬛")
+            scheduler.set_style(label, self.WHITE_STATUS_STYLE if is_white else self.BLACK_STATUS_STYLE)
+        scheduler.set_text(self.loss_indicator, self.line_loss_direction)
+        scheduler.set_text(self.output_indicator, str(self.last_output))
+        scheduler.repaint(self.graph_widget)
+        
+        # Latency from byte arrival (stamped by the serial backend) to the frame showing it
+        if self.measure_latency:
+            self.latency_pending_ns.append(sample.t_ns)
+            scheduler.call(self.record_frame_latency)
+        self.samples_received += 1
+        if self.samples_received % self.STATS_REFRESH_SAMPLES == 0:
+            scheduler.call(self.update_stats_labels)
+    
+    def record_frame_latency(self):
+        """Frame callback: end every pending sample's latency now that it is drawn"""
+        now_ns = time.perf_counter_ns()
+        refresh = False
+        for t_ns in self.latency_pending_ns:
+            self.latency_meter.record(t_ns, now_ns)
+            self.latency_samples += 1
+            refresh = refresh or self.latency_samples % self.LATENCY_REFRESH_SAMPLES == 0
+        self.latency_pending_ns.clear()
+        if refresh:
+            p50 = self.latency_meter.percentiles_ms((50,))[50]
+            self.render_scheduler.set_text(self.latency_indicator, f"{p50:.1f}ms")
+    
+    def set_latency_measurement(self, enabled):
+        """Start over with an empty LAT meter; disabled, samples are shown but not timed"""
+        self.measure_latency = enabled
+        self.latency_pending_ns.clear()
+        self.latency_meter.samples_ns.clear()
+        self.latency_samples = 0
+        self.render_scheduler.set_text(self.latency_indicator, "-")
+    
+    def on_robot_event(self, event):
+        """Slot for EventDetector.event_detected: show the latest transition"""
+        text = event_text(event).upper()
+        if event.kind in (EVENT_LINE_REACQUIRED, EVENT_SEARCH_FLIP):
+            text += f" {event.duration_ns / 1e6:.0f}ms"
+        alert = event.kind in (EVENT_LINE_LOST, EVENT_SENSOR_STUCK)
+        self.render_scheduler.set_text(self.event_indicator, text)
+        self.render_scheduler.set_style(self.event_indicator,
+                                        f"color: {'#FF3030' if alert else '#FFFFFF'}; background: transparent;")
+    
+    def update_stats_labels(self):
+        """Rolling statistics under the value labels (reads the O(1) accumulators)"""
+        for channel, label in ((self.sensor_stats.left, self.left_stats_label),
+                               (self.sensor_stats.right, self.right_stats_label)):
+            window = channel[self.STATS_DISPLAY_WINDOW]
+            label.setText(f"μ{window.mean:.0f} σ{window.std:.0f} {window.min}-{window.max} Δ{window.rate:+.0f}/s")
+            label.setToolTip("\n".join(
+                f"{size} samples: mean {w.mean:.1f}  std {w.std:.1f}  min {w.min}  max {w.max}  rate {w.rate:+.0f}/s"
+                for size, w in channel.windows.items()))
+    
+    def set_serial_manager(self, serial_manager):
+        """Allow external assignment of serial manager (for layout integration)"""
+        self.serial_manager = serial_manager
+    
+    def start_calibration(self):
+        """CALIBRATE button: collect a sweep, then push W<left>,<right> to the robot"""
+        if self.calibrator.is_running:
+            self.calibrator.cancel()
+            self.calibrate_btn.setText("CALIBRATE")
+            return
+        self.calibrator.start(self.serial_manager)
+    
+    def on_calibration_progress(self, seconds_left):
+        self.calibrate_btn.setText(f"SWEEP {seconds_left:.1f}s" if seconds_left > 0 else "CALIBRATE")
+    
+    def on_calibration_finished(self, success, left, right, message):
+        self.calibrate_btn.setText("CALIBRATE" if success else "CAL FAILED")
+        self.calibrate_btn.setToolTip(message)
+        if success and (self.serial_manager is None or not self.serial_manager.is_connected):
+            self.on_thresholds_confirmed(left, right)   # Preview only - nothing to confirm
+    
+    def on_thresholds_confirmed(self, left, right):
+        """Robot replied THRESHOLD: L=<left> R=<right>"""
+        self.white_thresholds = (left, right)
+        self.graph_widget.update()
+    
+    def set_telemetry_store(self, telemetry_store):
+        """Draw the graph from the application-wide TelemetryStore (filled elsewhere)"""
+        self.telemetry_store = telemetry_store
+        self.owns_telemetry_store = False
+        self.graph_envelope.resize(self.graph_envelope.pixels)   # Buckets came from the old store
+        self.graph_widget.update()
+    
+    def set_render_scheduler(self, render_scheduler):
+        """Share one frame governor with the other widgets (layout.py)"""
+        self.render_scheduler.flush()
+        self.render_scheduler = render_scheduler
+    
+    # Mouse events for dragging the frameless window
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.drag_pos = event.globalPos() - self.frameGeometry().topLeft()
+    
+    def mouseMoveEvent(self, event):
+        if event.buttons() == Qt.LeftButton and hasattr(self, 'drag_pos'):
+            self.move(event.globalPos() - self.drag_pos)
+
+
+# ===== STANDALONE TESTING =====
+if __name__ == '__main__':
+    """
+    Test the widget standalone without serial connection
+    Simulates random sensor data for visualization testing
+    
+      python IR_GRAPH.py               # live demo
+      python IR_GRAPH.py --benchmark   # paint_graph cost (QT_QPA_PLATFORM=offscreen works)
+    """
+    import random
+    from TELEMETRY_PARSER import TelemetrySample
+    
+    app = QApplication(sys.argv)
+    
+    if '--benchmark' in sys.argv:
+        # Renders of the graph area (same paintEvent as on screen) at several history lengths:
+        # 'random' = the demo's uniform values, 'line' = white/black steps like a real run
+        from PyQt5.QtGui import QImage
+        REPAINTS = 100
+        random.seed(0)
+        for shape, history in [(shape, history) for shape in ('random', 'line') for history in (50, 300, 2000, 20000, 200000)]:
+            IRSensorWidget.GRAPH_HISTORY_LENGTH = history
+            window = IRSensorWidget(serial_manager=None)
+            window.resize(350, 320)
+            window.show()
+            for i in range(history):
+                if shape == 'random':
+                    left, right = random.randint(20, 800), random.randint(20, 800)
+                else:
+                    left = (700 if i // 7 % 3 == 0 else 15) + random.randint(0, 40)
+                    right = (700 if i // 5 % 4 == 0 else 15) + random.randint(0, 40)
+                window.telemetry_store.append(TelemetrySample(i, left, right, left < 100, right < 100, '-', 0))
+            target = QImage(window.graph_widget.size(), QImage.Format_ARGB32_Premultiplied)
+            window.graph_widget.render(target)   # Warm-up (and any cache build)
+            start = time.perf_counter()
+            for i in range(REPAINTS):
+                # ~4 new samples per frame (67Hz telemetry, ~15 fps repaints)
+                for _ in range(4):
+                    window.telemetry_store.append(TelemetrySample(history + i, 15, 700, True, False, '-', 0))
+                window.graph_widget.render(target)
+            per_paint_ms = (time.perf_counter() - start) / REPAINTS * 1e3
+            print(f"{shape:<6} history {history:>5}: {per_paint_ms:.3f} ms per paint_graph "
+                  f"({window.graph_widget.width()}x{window.graph_widget.height()})")
+            window.close()
+        sys.exit(0)
+    
+    # Create widget without serial manager (simulation mode)
+    window = IRSensorWidget(serial_manager=None)
+    
+    # Simulate sensor data with a timer
+    def simulate_data():
+        left = random.randint(20, 800)
+        right = random.randint(20, 800)
+        
+        # Simulate white/black detection and line loss/output
+        window.on_telemetry_sample(TelemetrySample(time.perf_counter_ns(), left, right, left < 100, right < 100,
+                                                   random.choice(["L", "R", "-"]), random.choice([-1, 0, 1])))
+    
+    sim_timer = QTimer()
+    sim_timer.timeout.connect(simulate_data)
+    sim_timer.start(50)  # 20Hz simulated samples
+    
+    window.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,375 @@
+import os
+import numpy as np
+
+
+# ===== FILE FORMAT =====
+# <session>.mxlog.pyr (or <archive>.mxarc.pyr), written next to the recording
+#   header       64 bytes (PYRAMID_HEADER_DTYPE), incl. size + mtime of the source
+#   level table  one LEVEL_DTYPE entry per level (file offset, bucket count)
+#   level 0      one BUCKET_DTYPE per sample (min == max == the reading)
+#   level 1      one bucket per FACTOR level-0 buckets
+#   ...          until a level has a single bucket
+#
+# Every bucket keeps the time of its first sample and the min/max of both IR
+# channels, so a graph column is drawn from one bucket whatever the zoom.
+# The file is memory-mapped: opening reads the header and level table only.
+PYRAMID_MAGIC = b'MXPYR1\x00\x00'
+PYRAMID_EXTENSION = '.pyr'
+CHANNELS = ('left', 'right')
+
+PYRAMID_HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('factor', '<u4'),
+    ('levels', '<u4'),
+    ('samples', '<i8'),
+    ('source_size', '<i8'),      # Cache is stale when the recording's size or
+    ('source_mtime_ns', '<i8'),  # mtime no longer match
+    ('reserved', 'V24'),
+])
+LEVEL_DTYPE = np.dtype([('offset', '<i8'), ('buckets', '<i8')])
+BUCKET_DTYPE = np.dtype([
+    ('t_ns', '<i8'),       # First sample in the bucket
+    ('left_min', '<u2'),
+    ('left_max', '<u2'),
+    ('right_min', '<u2'),
+    ('right_max', '<u2'),
+])   # 16 bytes
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution min/max envelope of the IR channels (mipmaps for a graph)
+
+    - Level n holds one bucket per FACTOR**n samples; building is one reduceat per
+      level, total size 4/3 of level 0 for FACTOR = 4
+    - envelope(start, end, pixels) picks the coarsest level that still has at least
+      `pixels` buckets in range, reads the buckets lying fully inside [start, end)
+      (between pixels and FACTOR x pixels), adds the partial head and tail from
+      finer levels (reduce_range) and folds it all into exactly `pixels` columns.
+      The work depends on the graph width, not the recording length: an hour and
+      a day redraw alike.
+    - last_read reports the buckets touched by the previous call
+    """
+
+    FACTOR = 4
+
+    def __init__(self, levels, factor=FACTOR, source_stamp=(0, 0)):
+        self.levels = levels              # [BUCKET_DTYPE array per level]
+        self.factor = factor
+        self.source_stamp = source_stamp  # (size, mtime_ns) of the recording
+        self.last_read = 0
+
+    def __len__(self):
+        return len(self.levels[0]) if self.levels else 0
+
+    @property
+    def t_ns(self):
+        return self.levels[0]['t_ns']
+
+    # ===== BUILD / CACHE =====
+    @classmethod
+    def from_columns(cls, columns, factor=FACTOR, source_stamp=(0, 0)):
+        """Build from COLUMN_DTYPES columns (SessionLogReader.samples(), TelemetryArchive.read_all())"""
+        base = np.zeros(len(columns['t_ns']), dtype=BUCKET_DTYPE)
+        base['t_ns'] = columns['t_ns']
+        for channel in CHANNELS:
+            base[f'{channel}_min'] = columns[f'{channel}_raw']
+            base[f'{channel}_max'] = columns[f'{channel}_raw']
+        levels = [base]
+        while len(levels[-1]) > 1:
+            below = levels[-1]
+            starts = np.arange(0, len(below), factor)
+            level = np.empty(len(starts), dtype=BUCKET_DTYPE)
+            level['t_ns'] = below['t_ns'][starts]
+            for channel in CHANNELS:
+                level[f'{channel}_min'] = np.minimum.reduceat(below[f'{channel}_min'], starts)
+                level[f'{channel}_max'] = np.maximum.reduceat(below[f'{channel}_max'], starts)
+            levels.append(level)
+        return cls(levels, factor, source_stamp)
+
+    def save(self, path):
+        """Write the cache (temp file + rename, so readers never see half a pyramid)"""
+        header = np.zeros(1, dtype=PYRAMID_HEADER_DTYPE)
+        header['magic'] = PYRAMID_MAGIC
+        header['factor'] = self.factor
+        header['levels'] = len(self.levels)
+        header['samples'] = len(self)
+        header['source_size'], header['source_mtime_ns'] = self.source_stamp
+        table = np.zeros(len(self.levels), dtype=LEVEL_DTYPE)
+        offset = PYRAMID_HEADER_DTYPE.itemsize + table.nbytes
+        for i, level in enumerate(self.levels):
+            table[i] = (offset, len(level))
+            offset += level.nbytes
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(header.tobytes())
+            f.write(table.tobytes())
+            for level in self.levels:
+                f.write(level.tobytes())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        raw = np.memmap(path, dtype=np.uint8, mode='r')
+        header = raw[:PYRAMID_HEADER_DTYPE.itemsize].view(PYRAMID_HEADER_DTYPE)[0]
+        if header['magic'] != PYRAMID_MAGIC.rstrip(b'\x00'):
+            raise ValueError(f"{path} is not a min/max pyramid")
+        start = PYRAMID_HEADER_DTYPE.itemsize
+        table = raw[start:start + int(header['levels']) * LEVEL_DTYPE.itemsize].view(LEVEL_DTYPE)
+        levels = [raw[int(offset):int(offset) + int(buckets) * BUCKET_DTYPE.itemsize].view(BUCKET_DTYPE)
+                  for offset, buckets in table.tolist()]
+        return cls(levels, int(header['factor']), (int(header['source_size']), int(header['source_mtime_ns'])))
+
+    # ===== QUERIES =====
+    def index_range(self, t_start, t_end):
+        """Sample indices [start, end) for t_start <= t_ns < t_end"""
+        t_ns = self.t_ns
+        return int(np.searchsorted(t_ns, t_start)), int(np.searchsorted(t_ns, t_end))
+
+    def level_for(self, samples, pixels):
+        """Coarsest level with at least `pixels` buckets across `samples` samples"""
+        level = 0
+        while level + 1 < len(self.levels) and samples // self.factor ** (level + 1) >= pixels:
+            level += 1
+        return level
+
+    def reduce_range(self, start, end):
+        """
+        One bucket (1-element BUCKET_DTYPE array) covering exactly samples [start, end),
+        from the largest aligned buckets that fit: O(FACTOR x levels) reads
+        """
+        result = np.zeros(1, dtype=BUCKET_DTYPE)
+        result['t_ns'] = self.levels[0]['t_ns'][start]
+        for channel in CHANNELS:
+            result[f'{channel}_min'] = np.iinfo(np.uint16).max
+        reads = 0
+        while start < end:
+            level = 0
+            while level + 1 < len(self.levels):
+                size = self.factor ** (level + 1)
+                if start % size or start + size > end:
+                    break
+                level += 1
+            size = self.factor ** level
+            bucket = self.levels[level][start // size]
+            for channel in CHANNELS:
+                result[f'{channel}_min'] = min(result[f'{channel}_min'][0], bucket[f'{channel}_min'])
+                result[f'{channel}_max'] = max(result[f'{channel}_max'][0], bucket[f'{channel}_max'])
+            start += size
+            reads += 1
+        self.last_read += reads
+        return result
+
+    def envelope(self, start, end, pixels):
+        """
+        Min/max per screen column for samples [start, end)
+
+        Returns {'t_ns', 'left_min', 'left_max', 'right_min', 'right_max'} arrays of
+        `pixels` entries (fewer when the range holds fewer samples than pixels).
+        """
+        start, end = max(0, start), min(len(self), end)
+        if end <= start or pixels <= 0:
+            self.last_read = 0
+            return {name: np.empty(0, dtype=BUCKET_DTYPE[name]) for name in BUCKET_DTYPE.names}
+        level = self.level_for(end - start, pixels)
+        size = self.factor ** level
+        # Buckets fully inside the range; partial ones at either end would pull in
+        # samples outside it, so the head and tail are reduced from finer levels
+        first, last = -(-start // size), end // size
+        self.last_read = 0
+        if first >= last:
+            buckets = self.reduce_range(start, end)
+        else:
+            parts = [self.levels[level][first:last]]
+            self.last_read = last - first
+            if start < first * size:
+                parts.insert(0, self.reduce_range(start, first * size))
+            if last * size < end:
+                parts.append(self.reduce_range(last * size, end))
+            buckets = np.concatenate(parts) if len(parts) > 1 else parts[0]
+        if len(buckets) <= pixels:
+            return {name: np.asarray(buckets[name]) for name in BUCKET_DTYPE.names}
+
+        # Fold the slice into exactly `pixels` columns
+        edges = np.arange(pixels) * len(buckets) // pixels
+        result = {'t_ns': np.asarray(buckets['t_ns'][edges])}
+        for channel in CHANNELS:
+            result[f'{channel}_min'] = np.minimum.reduceat(buckets[f'{channel}_min'], edges)
+            result[f'{channel}_max'] = np.maximum.reduceat(buckets[f'{channel}_max'], edges)
+        return result
+
+    def envelope_time(self, t_start, t_end, pixels):
+        return self.envelope(*self.index_range(t_start, t_end), pixels)
+
+
+class StreamingEnvelope:
+    """
+    Per-pixel min/max of the newest `window` samples of a live TelemetryStore
+
+    - Samples fall into fixed buckets by absolute sample number (store.total), with
+      bucket = ceil(window / pixels); a completed bucket is reduced once, kept in a
+      ring and never recomputed as the graph scrolls
+    - update(store) reduces only the samples appended since the previous call plus
+      the open bucket, then returns the visible buckets: O(pixels + new samples),
+      independent of the window length
+    - resize(pixels) changes the bucket size (one full rebuild on the next update)
+    """
+
+    def __init__(self, window, pixels, channels=('left_raw', 'right_raw')):
+        self.window = window
+        self.channels = channels
+        self.resize(pixels)
+
+    def resize(self, pixels):
+        self.pixels = max(1, pixels)
+        self.bucket = max(1, -(-self.window // self.pixels))
+        self.slots = -(-self.window // self.bucket) + 2
+        self.mins = {name: np.zeros(self.slots, dtype=np.uint16) for name in self.channels}
+        self.maxs = {name: np.zeros(self.slots, dtype=np.uint16) for name in self.channels}
+        self.next_bucket = 0   # First bucket not reduced yet
+        self.seen = 0          # store.total at the last update
+
+    def update(self, store):
+        """
+        Visible buckets, oldest first: {'offset': first sample of each bucket relative
+        to the window start (the first may be negative), '<channel>_min', '<channel>_max'}
+        """
+        total, bucket = store.total, self.bucket
+        if total < self.seen:
+            self.resize(self.pixels)   # Store was cleared
+        self.seen = total
+        oldest = total - len(store)
+        window_start = total - self.window
+        b_first = max(window_start, oldest, 0) // bucket
+        b_done = total // bucket
+
+        # Newly completed buckets
+        b_from = max(self.next_bucket, b_first)
+        if b_done > b_from:
+            start = max(b_from * bucket, oldest)
+            view = store.window(total - start, self.channels)
+            edges = np.maximum(np.arange(b_from, b_done) * bucket - start, 0)
+            used = b_done * bucket - start
+            slots = np.arange(b_from, b_done) % self.slots
+            for name in self.channels:
+                self.mins[name][slots] = np.minimum.reduceat(view[name][:used], edges)
+                self.maxs[name][slots] = np.maximum.reduceat(view[name][:used], edges)
+        self.next_bucket = max(self.next_bucket, b_done)
+
+        slots = np.arange(b_first, b_done) % self.slots
+        result = {'offset': np.arange(b_first, b_done) * bucket - window_start}
+        for name in self.channels:
+            result[f'{name}_min'] = self.mins[name][slots]
+            result[f'{name}_max'] = self.maxs[name][slots]
+
+        # Open bucket (fewer than `bucket` samples, reduced on every call)
+        open_count = min(total - b_done * bucket, len(store))
+        if open_count > 0:
+            view = store.window(open_count, self.channels)
+            result['offset'] = np.append(result['offset'], max(b_done * bucket, b_first * bucket) - window_start)
+            for name in self.channels:
+                result[f'{name}_min'] = np.append(result[f'{name}_min'], view[name].min())
+                result[f'{name}_max'] = np.append(result[f'{name}_max'], view[name].max())
+        return result
+
+
+def source_stamp(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def open_pyramid(source_path, rebuild=False):
+    """
+    Pyramid for a recording (.mxlog / .mxarc): the cached <source>.pyr when it still
+    matches the file, otherwise built from the samples and cached next to it
+    """
+    cache_path = source_path + PYRAMID_EXTENSION
+    stamp = source_stamp(source_path)
+    if not rebuild and os.path.exists(cache_path):
+        try:
+            pyramid = MinMaxPyramid.load(cache_path)
+            if pyramid.source_stamp == stamp:
+                return pyramid
+        except (ValueError, OSError) as e:
+            print(f"[Pyramid] Ignoring cache {cache_path}: {e}")
+
+    from ANALYTICS import load_columns
+    pyramid = MinMaxPyramid.from_columns(load_columns(source_path), source_stamp=stamp)
+    try:
+        pyramid.save(cache_path)
+    except OSError as e:
+        print(f"[Pyramid] Cannot cache {cache_path}: {e}")
+    return pyramid
+
+
+# ===== ZOOM BENCHMARK =====
+if __name__ == '__main__':
+    """
+    Build + cache the pyramid for a simulated hour, reopen it from the cache, then time
+    800-pixel redraws at every zoom for 1 h and 16 h of samples (should not grow)
+
+      python MINMAX_PYRAMID.py                   # simulated hour
+      python MINMAX_PYRAMID.py sessions/x.mxlog  # a recording (.mxlog / .mxarc)
+    """
+    import sys
+    import time
+    import tempfile
+
+    PIXELS = 800
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        from SESSION_REPLAY import record_simulated_session
+        path = record_simulated_session(os.path.join(tempfile.mkdtemp(), 'hour.mxlog'), seconds=3600)
+
+    start = time.perf_counter()
+    pyramid = open_pyramid(path, rebuild=True)
+    build_ms = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    pyramid = open_pyramid(path)
+    open_ms = (time.perf_counter() - start) * 1e3
+    cache_mb = os.path.getsize(path + PYRAMID_EXTENSION) / 1e6
+    print(f"{len(pyramid):,} samples, {len(pyramid.levels)} levels: built + cached in {build_ms:.0f} ms "
+          f"({cache_mb:.1f} MB), reopened from cache in {open_ms:.2f} ms")
+
+    # Same hour tiled 16x: a 16-hour recording
+    t_ns = np.asarray(pyramid.t_ns)
+    span_ns = int(t_ns[-1] - t_ns[0]) + 15_000_000
+    base = {'t_ns': t_ns, 'left_raw': np.asarray(pyramid.levels[0]['left_min']),
+            'right_raw': np.asarray(pyramid.levels[0]['right_min'])}
+    long_columns = {name: np.concatenate([values + i * span_ns if name == 't_ns' else values for i in range(16)])
+                    for name, values in base.items()}
+    long_pyramid = MinMaxPyramid.from_columns(long_columns)
+
+    for label, pyr in (('1 h', pyramid), ('16 h', long_pyramid)):
+        total = len(pyr)
+        for fraction in (1.0, 0.1, 0.01, 0.001):
+            samples = max(int(total * fraction), 1)
+            starts = np.random.default_rng(0).integers(0, total - samples + 1, 200)
+            begin = time.perf_counter()
+            for s in starts.tolist():
+                pyr.envelope(s, s + samples, PIXELS)
+            per_redraw_us = (time.perf_counter() - begin) / len(starts) * 1e6
+            print(f"{label:>5} zoom {fraction:>6.1%} ({samples:>9,} samples): "
+                  f"{per_redraw_us:6.1f} us per redraw, {pyr.last_read:>5} buckets read")
+
+    # Check: the envelope equals a brute-force min/max of every column's samples
+    s, e = 12345, 12345 + 98765
+    env = pyramid.envelope(s, e, PIXELS)
+    raw = np.asarray(pyramid.levels[0]['left_min'][s:e])
+    print(f"whole-range min/max {env['left_min'].min()}/{env['left_max'].max()} "
+          f"vs raw {raw.min()}/{raw.max()}")
+
+    # Check: a flat range right after a step never sees the samples before it
+    n = 100_000
+    step = {'t_ns': np.arange(n, dtype=np.int64) * 15_000_000,
+            'left_raw': np.where(np.arange(n) < 1000, 0, 500).astype(np.uint16),
+            'right_raw': np.where(np.arange(n) < 1000, 0, 500).astype(np.uint16)}
+    step_pyramid = MinMaxPyramid.from_columns(step)
+    worst = 0
+    for s, e in ((1000, n), (1001, n - 3), (999, 70_001), (1000, 1017)):
+        env = step_pyramid.envelope(s, e, 10)
+        raw = step['left_raw'][s:e]
+        worst = max(worst, abs(int(env['left_min'].min()) - int(raw.min())),
+                    abs(int(env['left_max'].max()) - int(raw.max())))
+    print(f"flat range next to a step: max min/max error {worst} (expected 0)")
@@ -0,0 +1,330 @@
+import os
+import sys
+import pty
+import tty
+import math
+import time
+import select
+import random
+import termios
+import threading
+from collections import deque
+from TELEMETRY_PARSER import encode_frame, FLAG_LEFT_WHITE, FLAG_RIGHT_WHITE, LOSS_CHARS
+
+
+class StandInFirmware:
+    """
+    Minimal stand-in for FINALArduino.ino's serial protocol (no control logic)
+
+    - boot():          the "=== Dual Motor Line Follower Ready ===" banner
+    - step(now_ms):    one loop() worth of output: the debug line "L:..(W) R:..(B) Loss:- Out:0"
+                       (or a binary frame after T1) plus any pending replies
+    - receive(data):   S/L/R<num> and M<left>,<right> speed commands (echoed like
+                       calculateSpeeds()), T0/T1, U<baud>, P (ping) and W<left>,<right>
+                       (white thresholds)
+
+    baud_rate is the rate the firmware listens at, tx_baud the rate the last step()
+    output went out at (a U reply leaves at the old rate). max_link_baud simulates a
+    USB-serial bridge that garbles anything faster.
+
+    Sensor values are a slow sweep across the threshold so every flag combination appears.
+    """
+
+    WHITE_THRESHOLD = 30
+    DEFAULT_BAUD = 9600
+    SUPPORTED_BAUD_RATES = (9600, 19200, 38400, 57600, 115200, 500000, 1000000)
+    BAUD_CONFIRM_MS = 1000
+
+    def __init__(self):
+        self.speed_left = 40
+        self.speed_right = 40
+        self.white_threshold_left = self.WHITE_THRESHOLD
+        self.white_threshold_right = self.WHITE_THRESHOLD
+        self.binary_telemetry = False
+        self.seq = 0
+        self.loop_count = 0
+        self.commands_received = 0
+        self.baud_rate = self.DEFAULT_BAUD
+        self.tx_baud = self.DEFAULT_BAUD
+        self.max_link_baud = None
+        self._previous_baud = self.DEFAULT_BAUD
+        self._switch_to_baud = None
+        self._baud_confirm_deadline = None
+        self._rx = bytearray()
+        self._tx = bytearray()
+
+    def boot(self):
+        return (b"=== Dual Motor Line Follower Ready ===\r\n"
+                + self._speed_echo()
+                + b"========================================\r\n")
+
+    def receive(self, data):
+        self._rx += data
+        while self._rx:
+            command = chr(self._rx[0]).upper()
+            end = 1
+            while end < len(self._rx) and chr(self._rx[end]) in '0123456789-,':
+                end += 1
+            if command in 'SLRTMUW' and end == len(self._rx):
+                return  # Number may still be arriving
+            values = [int(v) for v in self._rx[1:end].split(b',') if v.strip(b'-')]
+            del self._rx[:end]
+            if command == 'P':
+                self._handle_ping()
+            elif values:
+                self.commands_received += 1
+                self._handle(command, *values[:2])
+
+    def _handle(self, command, value, second=None):
+        if command == 'W':
+            if second is None:
+                return
+            if not (0 <= value <= 1023 and 0 <= second <= 1023):
+                self._tx += b"ERROR: Threshold must be 0-1023\r\n"
+                return
+            self.white_threshold_left, self.white_threshold_right = value, second
+            self._tx += f"THRESHOLD: L={value} R={second}\r\n".encode()
+        elif command == 'M':
+            if second is None:
+                return
+            if not (0 <= value <= 100 and 0 <= second <= 100):
+                self._tx += b"ERROR: Speed must be 0-100%\r\n"
+                return
+            self.speed_left, self.speed_right = value, second
+            self._tx += self._speed_echo()
+        elif command == 'U':
+            if value in self.SUPPORTED_BAUD_RATES:
+                self._tx += f"BAUD: {value}\r\n".encode()
+                self._switch_to_baud = value   # After this reply has gone out
+            else:
+                self._tx += b"ERROR: Unsupported baud rate\r\n"
+        elif command == 'T':
+            self.binary_telemetry = value == 1
+            self._tx += b"TELEMETRY: BINARY\r\n" if self.binary_telemetry else b"TELEMETRY: TEXT\r\n"
+        elif command in 'SLR':
+            if not 0 <= value <= 100:
+                self._tx += b"ERROR: Speed must be 0-100%\r\n"
+                return
+            if command in 'SL':
+                self.speed_left = value
+            if command in 'SR':
+                self.speed_right = value
+            self._tx += self._speed_echo()
+
+    def _handle_ping(self):
+        self._baud_confirm_deadline = None
+        self._previous_baud = self.baud_rate
+        self._tx += b"PONG\r\n"
+
+    def _check_baud_confirm(self, now_ms):
+        # checkBaudConfirm(): no ping at the new rate in time - go back
+        if self._baud_confirm_deadline is not None and now_ms >= self._baud_confirm_deadline:
+            self._baud_confirm_deadline = None
+            self.baud_rate = self._previous_baud
+            self._tx += f"BAUD: {self.baud_rate}\r\n".encode()
+
+    def _speed_echo(self):
+        return f"Speed Left (A6): {self.speed_left}% | Speed Right (A7): {self.speed_right}\r\n".encode()
+
+    def step(self, now_ms):
+        self._check_baud_confirm(now_ms)
+        self.tx_baud = self.baud_rate
+        self.loop_count += 1
+        phase = self.loop_count / 40.0
+        left_raw = int(400 + 390 * math.sin(phase))
+        right_raw = int(400 + 390 * math.sin(phase + 1.5))
+        left_white = left_raw <= self.white_threshold_left
+        right_white = right_raw <= self.white_threshold_right
+
+        if self.binary_telemetry:
+            flags = (FLAG_LEFT_WHITE if left_white else 0) | (FLAG_RIGHT_WHITE if right_white else 0)
+            out = encode_frame(self.seq, now_ms, left_raw, right_raw, flags, 0, 0)
+            self.seq = (self.seq + 1) & 0xFF
+        else:
+            out = (f"L:{left_raw}({'W' if left_white else 'B'}) R:{right_raw}({'W' if right_white else 'B'}) "
+                   f"Loss:{LOSS_CHARS[0]} Out:0\r\n").encode()
+
+        if self._tx:
+            out += bytes(self._tx)
+            self._tx.clear()
+        if self._switch_to_baud is not None:
+            self._previous_baud = self.baud_rate
+            self.baud_rate = self._switch_to_baud
+            self._switch_to_baud = None
+            self._baud_confirm_deadline = now_ms + self.BAUD_CONFIRM_MS
+        return out
+
+
+class PtyDevice:
+    """
+    Pseudo-terminal that plays a firmware object on a background thread
+
+    Anything that opens `port_name` (pyserial, QSerialPort, AsyncSerialClient,
+    layout.py) sees it like a real Nano on /dev/ttyUSB0. Linux/macOS only.
+
+    firmware   - object with boot(), step(now_ms) -> bytes, receive(bytes)
+    interval_s - loop period (0.015 = FINALArduino.ino's delay(15); 0 = as fast as possible)
+    record_write_times - keep a perf_counter_ns() stamp per step in write_times
+                         (consumers pop one per sample to measure end-to-end latency)
+    simulate_baud - behave like a UART at firmware.baud_rate: the loop blocks once the
+                    64-byte TX buffer is full, and bytes are garbled both ways while the
+                    host's port rate (read from the pty's termios) differs
+    """
+
+    LOOP_INTERVAL_S = 0.015
+    WRITE_TIMEOUT_S = 0.1   # Output is dropped if nobody reads the port for this long
+    UART_TX_BUFFER = 64     # HardwareSerial TX buffer on the Nano
+
+    def __init__(self, firmware=None, interval_s=LOOP_INTERVAL_S, record_write_times=False,
+                 simulate_baud=False):
+        self.firmware = firmware or StandInFirmware()
+        self.interval_s = interval_s
+        self.record_write_times = record_write_times
+        self.simulate_baud = simulate_baud
+        self._tx_clear_at = 0.0
+        self.write_times = deque()
+        self.dropped_bytes = 0
+        self.steps = 0
+
+        self.master_fd, self.slave_fd = pty.openpty()
+        tty.setraw(self.slave_fd)   # No echo, no CR/LF translation - behave like a UART
+        self.port_name = os.ttyname(self.slave_fd)
+
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="PtyDevice", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join(1.0)
+        for fd in (self.master_fd, self.slave_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _write(self, data):
+        view = memoryview(data)
+        while view:
+            _, writable, _ = select.select([], [self.master_fd], [], self.WRITE_TIMEOUT_S)
+            if not writable:
+                self.dropped_bytes += len(view)
+                return
+            written = os.write(self.master_fd, view)
+            view = view[written:]
+
+    def _host_baud(self):
+        speed = termios.tcgetattr(self.master_fd)[5]
+        for rate in StandInFirmware.SUPPORTED_BAUD_RATES:
+            if getattr(termios, f"B{rate}", None) == speed:
+                return rate
+        return None
+
+    def _link_ok(self, baud):
+        if not self.simulate_baud or baud is None:
+            return True
+        limit = getattr(self.firmware, 'max_link_baud', None)
+        return self._host_baud() == baud and (limit is None or baud <= limit)
+
+    @staticmethod
+    def _garble(data):
+        # Framing errors: the receiver sees junk with the high bit set
+        return bytes(0x80 | random.getrandbits(7) for _ in range(len(data)))
+
+    def _garble_output(self, output, tx_baud):
+        # firmware.tx_segments = [(baud, length), ...] when the rate changed mid-step
+        segments = getattr(self.firmware, 'tx_segments', None) or [(tx_baud, len(output))]
+        if all(self._link_ok(baud) for baud, _ in segments):
+            return output
+        parts = []
+        pos = 0
+        for baud, length in segments:
+            part = output[pos:pos + length]
+            parts.append(part if self._link_ok(baud) else self._garble(part))
+            pos += length
+        return b''.join(parts)
+
+    def _uart_block(self, size, baud):
+        """Sleep while Serial.print() would block on a full TX buffer; returns True if it did"""
+        byte_s = 10.0 / baud
+        now = time.perf_counter()
+        self._tx_clear_at = max(self._tx_clear_at, now) + size * byte_s
+        blocked_until = self._tx_clear_at - self.UART_TX_BUFFER * byte_s
+        if blocked_until <= now:
+            return False
+        time.sleep(blocked_until - now)
+        return True
+
+    def _step_interval(self):
+        """Wall-clock seconds between two firmware steps"""
+        return self.interval_s
+
+    def _run(self):
+        start = time.perf_counter()
+        self._write(self.firmware.boot())
+        next_step = time.perf_counter()
+
+        while self._running:
+            try:
+                readable, _, _ = select.select([self.master_fd], [], [], 0)
+                if readable:
+                    data = os.read(self.master_fd, 4096)
+                    if not self._link_ok(getattr(self.firmware, 'baud_rate', None)):
+                        data = self._garble(data)
+                    self.firmware.receive(data)
+
+                now_ms = int((time.perf_counter() - start) * 1000)
+                output = self.firmware.step(now_ms)
+                if self.record_write_times:
+                    self.write_times.append(time.perf_counter_ns())
+                blocked = False
+                if output:
+                    tx_baud = getattr(self.firmware, 'tx_baud', None)
+                    output = self._garble_output(output, tx_baud)
+                    self._write(output)
+                    if self.simulate_baud and tx_baud:
+                        blocked = self._uart_block(len(output), tx_baud)
+                self.steps += 1
+            except OSError:
+                break  # pty closed
+
+            if blocked:
+                next_step = time.perf_counter()   # delay(15) starts after the print returns
+
+            interval_s = self._step_interval()
+            if interval_s > 0:
+                next_step += interval_s
+                delay = next_step - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_step = time.perf_counter()  # Fell behind - don't try to catch up
+
+
+# ===== STANDALONE STAND-IN DEVICE =====
+if __name__ == '__main__':
+    """
+    Run the stand-in and point layout.py (or a serial terminal) at the printed port
+    """
+    device = PtyDevice().start()
+    print(f"Stand-in Arduino on {device.port_name} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        device.stop()
+        sys.exit(0)
@@ -0,0 +1,286 @@
+import time
+from PyQt5.QtCore import QObject, QIODevice, QTimer, pyqtSignal
+from PyQt5.QtSerialPort import QSerialPort, QSerialPortInfo
+from TELEMETRY_PARSER import FORMAT_TEXT
+from SERIAL_BUFFER import TelemetryIngestor
+from BAUD_NEGOTIATION import BaudNegotiator
+
+
+class QtSerialManager(QObject):
+    """
+    Event-driven serial backend built on QSerialPort.readyRead
+
+    Drop-in alternative to the MOTOR_METER serial manager:
+    - Same interface: is_connected, serial_port, sendSpeedCommand(), sendRawCommand(),
+      disconnect(); every write happens on the GUI thread, the only writer
+    - Same fan-out signals as SerialReaderThread (sample_received, line_received, ...)
+      so widgets subscribe exactly the same way
+
+    No polling timer and no reader thread: Qt wakes the GUI thread the moment bytes
+    land, readAll() drains them in one call and TelemetryIngestor parses them.
+    sample.t_ns is stamped on readyRead, so (time of widget update - t_ns) is the
+    byte-arrival-to-widget latency (see LatencyMeter).
+
+    With target_baud set, connect() opens at the firmware's 9600 and runs the
+    U<baud>/P handshake (BaudNegotiator) from readyRead and a poll timer.
+    """
+
+    sample_received = pyqtSignal(object)   # TelemetrySample for every sensor line
+    line_received = pyqtSignal(str)        # Every raw line (sensor lines included)
+    message_received = pyqtSignal(str, object)  # Non-sensor lines + receive t_ns (round-trip timing)
+    error_occurred = pyqtSignal(str)       # Port errors (unplugged, permission, ...)
+    connection_changed = pyqtSignal(bool)  # True after connect(), False after disconnect()
+    baud_negotiated = pyqtSignal(int, bool)  # Rate in use, whether target_baud was reached
+
+    DEFAULT_BAUD_RATE = 9600   # Must match Serial.begin() in FINALArduino.ino
+    NEGOTIATION_POLL_MS = 10
+
+    def __init__(self, parent=None, telemetry_format=FORMAT_TEXT, target_baud=None):
+        super().__init__(parent)
+        self.serial_port = None
+        self.is_connected = False
+        self.target_baud = target_baud
+        self.ingestor = TelemetryIngestor(self.sample_received.emit, self.line_received.emit,
+                                          telemetry_format=telemetry_format,
+                                          on_message=self.message_received.emit)
+
+        # Baud handshake (only runs right after connect())
+        self.negotiator = None
+        self.negotiation_timer = QTimer(self)
+        self.negotiation_timer.timeout.connect(self._poll_negotiation)
+        self.line_received.connect(self._on_negotiation_line)
+
+    @property
+    def telemetry_format(self):
+        return self.ingestor.telemetry_format
+
+    @property
+    def stats(self):
+        """IngestStats for the current connection (reads, samples, allocations per sample)"""
+        return self.ingestor.stats
+
+    def set_telemetry_format(self, telemetry_format):
+        """Switch between FORMAT_TEXT and FORMAT_BINARY at runtime"""
+        self.ingestor.set_telemetry_format(telemetry_format)
+        self._send_format_command()
+
+    @staticmethod
+    def available_ports():
+        """Return the names of all serial ports Qt can see (e.g. ['COM3', 'ttyUSB0'])"""
+        return [info.portName() for info in QSerialPortInfo.availablePorts()]
+
+    def connect(self, port_name, baud_rate=DEFAULT_BAUD_RATE):
+        """Open the port; returns (success, message) like sendSpeedCommand()"""
+        if self.is_connected:
+            self.disconnect()
+
+        port = QSerialPort(self)
+        port.setPortName(port_name)
+        port.setBaudRate(baud_rate)
+        port.setDataBits(QSerialPort.Data8)
+        port.setParity(QSerialPort.NoParity)
+        port.setStopBits(QSerialPort.OneStop)
+        port.setFlowControl(QSerialPort.NoFlowControl)
+
+        if not port.open(QIODevice.ReadWrite):
+            message = f"Failed to open {port_name}: {port.errorString()}"
+            port.deleteLater()
+            self.error_occurred.emit(message)
+            return False, message
+
+        port.readyRead.connect(self._on_ready_read)
+        port.errorOccurred.connect(self._on_error)
+
+        self.serial_port = port
+        self.is_connected = True
+        self.ingestor.reset()
+        self.ingestor.stats.reset()
+        self.connection_changed.emit(True)
+        print(f"[Qt Serial] Connected to {port_name} @ {baud_rate}")
+
+        if self.target_baud and self.target_baud != baud_rate:
+            self.negotiator = BaudNegotiator(self.target_baud, baud_rate)
+            self._apply_negotiation(self.negotiator.start(self._now_ms()))
+            self.negotiation_timer.start(self.NEGOTIATION_POLL_MS)
+        return True, f"Connected to {port_name}"
+
+    def disconnect(self):
+        """Close the port"""
+        self.negotiation_timer.stop()
+        self.negotiator = None
+        if self.serial_port is not None:
+            self.serial_port.readyRead.disconnect(self._on_ready_read)
+            self.serial_port.close()
+            self.serial_port.deleteLater()
+        self.serial_port = None
+        was_connected = self.is_connected
+        self.is_connected = False
+        if was_connected:
+            self.connection_changed.emit(False)
+            print("[Qt Serial] Disconnected")
+
+    def sendSpeedCommand(self, speed, motor='both'):
+        """
+        Send a speed command (0-100%) to the Arduino
+        motor: 'left' → L<num>, 'right' → R<num>, 'both' → S<num>
+        Returns (success, message)
+        """
+        if not self.is_connected:
+            return False, "Not connected"
+        if not 0 <= speed <= 100:
+            return False, "Speed must be 0-100%"
+
+        prefix = {'left': 'L', 'right': 'R'}.get(motor, 'S')
+        return self.sendRawCommand(f"{prefix}{int(speed)}\n")
+
+    def sendRawCommand(self, command):
+        """Write a raw ASCII command; returns (success, message)"""
+        if not self.is_connected:
+            return False, "Not connected"
+        written = self.serial_port.write(command.encode('ascii'))
+        if written < 0:
+            return False, self.serial_port.errorString()
+        return True, f"Sent {command.strip()}"
+
+    def _on_ready_read(self):
+        """readyRead slot: drain everything that arrived and parse it immediately"""
+        t_ns = time.perf_counter_ns()
+        data = self.serial_port.readAll()
+        self.ingestor.feed(bytes(data), t_ns)
+        self._send_format_command()
+
+    # ===== BAUD HANDSHAKE =====
+    @staticmethod
+    def _now_ms():
+        return time.perf_counter_ns() // 1_000_000
+
+    def _on_negotiation_line(self, line):
+        if self.negotiator is not None:
+            self._apply_negotiation(self.negotiator.on_line(line, self._now_ms()))
+
+    def _poll_negotiation(self):
+        if self.negotiator is not None:
+            self._apply_negotiation(self.negotiator.poll(self._now_ms()))
+
+    def _apply_negotiation(self, actions):
+        for action in actions:
+            if action[0] == 'write':
+                self.serial_port.write(action[1])
+            elif action[0] == 'set_baud':
+                self.serial_port.flush()
+                self.serial_port.waitForBytesWritten(100)
+                self.serial_port.setBaudRate(action[1])
+                self.serial_port.clear(QSerialPort.Input)
+                self.ingestor.reset()
+            elif action[0] == 'done':
+                self.negotiation_timer.stop()
+                self.negotiator = None
+                print(f"[Qt Serial] Link at {action[1]} baud" + ("" if action[2] else f" ({self.target_baud} failed)"))
+                self.baud_negotiated.emit(action[1], action[2])
+
+    def _send_format_command(self):
+        if not self.is_connected:
+            return
+        command = self.ingestor.pending_format_command()
+        if command:
+            self.serial_port.write(command)
+
+    def _on_error(self, error):
+        if error == QSerialPort.NoError:
+            return
+        message = self.serial_port.errorString() if self.serial_port else str(error)
+        self.error_occurred.emit(message)
+        if error == QSerialPort.ResourceError:
+            # Device unplugged
+            self.disconnect()
+
+
+# ===== LATENCY BENCHMARK =====
+if __name__ == '__main__':
+    """
+    Byte-write → widget-slot latency on a Linux pty (stand-in for the Nano):
+    QtSerialManager (readyRead) vs SerialReaderThread (pyserial, 2ms poll)
+    vs the old 50ms QTimer polling of IRSensorWidget.
+    """
+    import os
+    import pty
+    import sys
+    import threading
+    from collections import deque
+    from PyQt5.QtCore import QCoreApplication, QTimer
+    from SERIAL_BUFFER import LatencyMeter
+    from SERIAL_READER import SerialReaderThread
+
+    app = QCoreApplication(sys.argv)
+    seconds = 3.0
+    line = b"L:45(W) R:120(B) Loss:L Out:-1\r\n"
+
+    def run(label, setup):
+        master, slave = pty.openpty()
+        written = deque()
+        meter = LatencyMeter(window=100000)
+
+        def on_sample(sample):
+            if written:
+                meter.record(written.popleft())
+
+        def writer():
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline:
+                written.append(time.perf_counter_ns())
+                os.write(master, line)
+                time.sleep(0.015)
+
+        teardown = setup(os.ttyname(slave), on_sample)
+        threading.Thread(target=writer, daemon=True).start()
+        QTimer.singleShot(int(seconds * 1000) + 200, app.quit)
+        app.exec_()
+        teardown()
+        os.close(master)
+        os.close(slave)
+        p = meter.percentiles_ms((50, 95, 99))
+        print(f"{label:<30} samples: {len(meter):>4} | p50 {p[50]:6.2f} ms | p95 {p[95]:6.2f} ms | p99 {p[99]:6.2f} ms")
+
+    def qt_backend(port_name, on_sample):
+        manager = QtSerialManager()
+        manager.sample_received.connect(on_sample)
+        manager.connect(port_name)
+        return manager.disconnect
+
+    def pyserial_manager(port_name):
+        import serial
+
+        class PySerialManager:
+            # Minimal pyserial manager with the MOTOR_METER attributes the reader uses
+            def __init__(self):
+                self.serial_port = serial.Serial(port_name, 9600, timeout=0.1)
+                self.is_connected = True
+
+        return PySerialManager()
+
+    def thread_backend(port_name, on_sample):
+        manager = pyserial_manager(port_name)
+        reader = SerialReaderThread(manager)
+        reader.sample_received.connect(on_sample)
+        reader.start()
+        return lambda: (reader.stop(), manager.serial_port.close())
+
+    def legacy_polling(port_name, on_sample):
+        from TELEMETRY_PARSER import parse_line
+        manager = pyserial_manager(port_name)
+        timer = QTimer()
+
+        def poll():
+            port = manager.serial_port
+            while port.in_waiting > 0:
+                sample = parse_line(port.readline())
+                if sample is not None:
+                    on_sample(sample)
+
+        timer.timeout.connect(poll)
+        timer.start(50)
+        return lambda: (timer.stop(), manager.serial_port.close())
+
+    run("QSerialPort.readyRead", qt_backend)
+    run("SerialReaderThread", thread_backend)
+    run("50ms QTimer polling (old)", legacy_polling)
@@ -0,0 +1,178 @@
+import time
+from PyQt5.QtCore import QObject, QTimer, Qt
+
+
+class RenderScheduler(QObject):
+    """
+    Frame-rate governor between telemetry slots and the widgets they display on
+
+    Ingestion slots only record what changed; widgets are touched once per frame:
+    - set_text(label, text) / set_style(widget, sheet): latest value per widget wins,
+      and it is skipped if the widget already shows it (setStyleSheet re-polishes)
+    - repaint(widget):  widget.update() once per frame
+    - call(callback):   run once per frame (e.g. labels formatted from accumulators)
+
+    A frame runs at most every 1/fps s. The timer is single-shot and only armed
+    while something is dirty, so an idle link costs no wake-ups, and the first
+    change after a quiet spell is shown without waiting a full frame.
+    fps=0 applies every write immediately (the old per-line behaviour).
+    """
+
+    FPS = 30
+
+    def __init__(self, fps=FPS, parent=None):
+        super().__init__(parent)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.flush)
+        self.last_frame_ns = 0
+        self.in_frame = False
+
+        # Pending work (dicts as insertion-ordered sets)
+        self.texts = {}
+        self.styles = {}
+        self.widgets = {}
+        self.callbacks = {}
+
+        # Counters for the coalescing report
+        self.frames = 0
+        self.requests = 0
+        self.writes = 0
+        self.set_fps(fps)
+
+    def set_fps(self, fps):
+        self.fps = fps
+        self.interval_ns = int(1e9 / fps) if fps else 0
+
+    # ===== INGESTION SIDE =====
+    def set_text(self, label, text):
+        self.texts[label] = text
+        self._mark()
+
+    def set_style(self, widget, style_sheet):
+        self.styles[widget] = style_sheet
+        self._mark()
+
+    def repaint(self, widget):
+        self.widgets[widget] = None
+        self._mark()
+
+    def call(self, callback):
+        self.callbacks[callback] = None
+        self._mark()
+
+    def _mark(self):
+        self.requests += 1
+        if self.in_frame or self.timer.isActive():
+            return
+        if not self.fps:
+            self.flush()
+            return
+        wait_ns = self.last_frame_ns + self.interval_ns - time.perf_counter_ns()
+        self.timer.start(max(0, -(-wait_ns // 1_000_000)))   # Round up to whole ms
+
+    # ===== FRAME =====
+    def flush(self):
+        """Apply everything pending now (the frame timer calls this)"""
+        self.timer.stop()
+        self.in_frame = True
+        try:
+            # Callbacks first: they may queue texts for this same frame
+            callbacks, self.callbacks = self.callbacks, {}
+            for callback in callbacks:
+                callback()
+            texts, self.texts = self.texts, {}
+            for label, text in texts.items():
+                if label.text() != text:
+                    label.setText(text)
+                    self.writes += 1
+            styles, self.styles = self.styles, {}
+            for widget, style_sheet in styles.items():
+                if widget.styleSheet() != style_sheet:
+                    widget.setStyleSheet(style_sheet)
+                    self.writes += 1
+            widgets, self.widgets = self.widgets, {}
+            for widget in widgets:
+                widget.update()
+                self.writes += 1
+        finally:
+            self.in_frame = False
+        self.frames += 1
+        self.last_frame_ns = time.perf_counter_ns()
+
+    def clear(self):
+        """Drop pending work (widgets being destroyed)"""
+        self.timer.stop()
+        self.texts.clear()
+        self.styles.clear()
+        self.widgets.clear()
+        self.callbacks.clear()
+
+
+# ===== CPU AT A STEADY 67 Hz =====
+if __name__ == '__main__':
+    """
+    Feed an IRSensorWidget simulated firmware lines at the real 15 ms loop rate and
+    report process CPU for per-sample redraws (fps 0) vs capped frames:
+      python RENDER_SCHEDULER.py [seconds per run] [--burst N]   (N samples per delivery)
+    QT_QPA_PLATFORM=offscreen works; paints still run through the backing store
+    """
+    import sys
+    from PyQt5.QtWidgets import QApplication
+    from FIRMWARE_SIM import FirmwareSimulator, LineTrack
+    from TELEMETRY_PARSER import parse_line
+    from IR_GRAPH import IRSensorWidget
+
+    app = QApplication(sys.argv)
+    positional = [arg for i, arg in enumerate(sys.argv[1:], 1) if not arg.startswith('--')
+                  and sys.argv[i - 1] != '--burst']
+    seconds = float(positional[0]) if positional else 10.0
+    burst = int(sys.argv[sys.argv.index('--burst') + 1]) if '--burst' in sys.argv else 1
+
+    sim = FirmwareSimulator(LineTrack(gaps=((85, 88),), seed=3))
+    sim.boot()
+    lines = [line for line in sim.run(120_000).split(b'\n') if parse_line(line)]
+
+    for fps in (0, 60, 30):
+        widget = IRSensorWidget()
+        widget.render_scheduler.set_fps(fps)
+        widget.show()
+        paints = [0]
+        paint_graph = widget.graph_widget.paintEvent
+
+        def counted_paint(event, paint_graph=paint_graph):
+            paints[0] += 1
+            paint_graph(event)
+        widget.graph_widget.paintEvent = counted_paint
+        for line in lines[:2000]:   # Fill the graph history first
+            widget.on_telemetry_sample(parse_line(line))
+        widget.render_scheduler.flush()
+        app.processEvents()
+
+        fed = [0]
+
+        def feed(widget=widget):
+            for _ in range(burst):
+                widget.on_telemetry_sample(parse_line(lines[fed[0] % len(lines)]))
+                fed[0] += 1
+        feeder = QTimer()
+        feeder.setTimerType(Qt.PreciseTimer)
+        feeder.timeout.connect(feed)
+        scheduler = widget.render_scheduler
+        scheduler.frames = scheduler.requests = scheduler.writes = paints[0] = 0
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        feeder.start(15 * burst)
+        QTimer.singleShot(int(seconds * 1000), app.quit)
+        app.exec_()
+        feeder.stop()
+        cpu_s = time.process_time() - cpu_start
+        wall_s = time.perf_counter() - wall_start
+        print(f"fps {fps or 'uncapped':>8}: CPU {100 * cpu_s / wall_s:5.1f}%  "
+              f"{fed[0] / wall_s:5.1f} samples/s  {scheduler.frames / wall_s:5.1f} frames/s  "
+              f"{paints[0] / wall_s:5.1f} paints/s  {scheduler.requests} requests -> {scheduler.writes} writes")
+        widget.close()
+        widget.deleteLater()
+        app.processEvents()
@@ -0,0 +1,339 @@
+import time
+from collections import deque
+import numpy as np
+from TELEMETRY_PARSER import parse_line, decode_stream, frames_to_samples, FORMAT_TEXT, FORMAT_BINARY
+
+
+class ByteRingBuffer:
+    """
+    Preallocated receive buffer for bulk serial reads
+
+    - write() copies a whole port.read(in_waiting) chunk into one fixed bytearray
+    - Complete records are split in place (memoryview slices, see decode_stream)
+    - consume() drops processed bytes; a trailing partial record stays for the next read
+    - When the tail runs out of room the partial record is moved back to the front
+      (it is only ever a fraction of one line/frame, so the move is tiny)
+
+    If the consumer falls behind by more than `capacity` bytes the oldest bytes are dropped
+    and counted in `dropped`.
+    """
+
+    DEFAULT_CAPACITY = 64 * 1024   # ~2000 text lines / ~4600 binary frames
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.buffer = bytearray(capacity)
+        self.view = memoryview(self.buffer)
+        self.start = 0     # First unconsumed byte
+        self.end = 0       # One past the last written byte
+        self.dropped = 0   # Bytes discarded on overflow
+        self.copies = 0    # Temporary copies made while compacting
+
+    def __len__(self):
+        return self.end - self.start
+
+    def write(self, data):
+        """Append a chunk of received bytes"""
+        size = len(data)
+        if size == 0:
+            return
+        if size > self.capacity:
+            self.dropped += size - self.capacity
+            data = memoryview(data)[size - self.capacity:]
+            size = self.capacity
+
+        if self.end + size > self.capacity:
+            overflow = (self.end - self.start) + size - self.capacity
+            if overflow > 0:
+                self.dropped += overflow
+                self.start += overflow
+            self.compact()
+
+        self.view[self.end:self.end + size] = data
+        self.end += size
+
+    def compact(self):
+        """Move the unconsumed bytes to the front of the buffer"""
+        length = self.end - self.start
+        if self.start == 0:
+            return
+        if length > 0:
+            if length > self.start:
+                # Regions overlap - go through a temporary copy
+                self.buffer[0:length] = bytes(self.view[self.start:self.end])
+                self.copies += 1
+            else:
+                self.buffer[0:length] = self.view[self.start:self.end]
+        self.start = 0
+        self.end = length
+
+    def consume(self, pos):
+        """Mark everything before absolute index `pos` as processed"""
+        self.start = pos
+        if self.start >= self.end:
+            self.start = self.end = 0
+
+    def clear(self):
+        self.start = self.end = 0
+
+
+class IngestStats:
+    """
+    Counters for the serial ingestion path
+
+    reads      - port read calls that returned data (one syscall + one bytes object each)
+    allocs     - I/O buffer allocations (read chunks + compaction copies)
+    samples    - telemetry samples produced
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started = time.perf_counter()
+        self.reads = 0
+        self.bytes = 0
+        self.allocs = 0
+        self.samples = 0
+        self.lines = 0
+
+    def record_read(self, size):
+        self.reads += 1
+        self.bytes += size
+        self.allocs += 1
+
+    def snapshot(self):
+        """Return a dict with per-second rates and allocations-per-sample"""
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return {
+            'elapsed_s': elapsed,
+            'reads_per_sec': self.reads / elapsed,
+            'bytes_per_sec': self.bytes / elapsed,
+            'samples_per_sec': self.samples / elapsed,
+            'allocs_per_sample': self.allocs / self.samples if self.samples else 0.0,
+            'samples_per_read': self.samples / self.reads if self.reads else 0.0,
+        }
+
+    def format(self):
+        s = self.snapshot()
+        return (f"reads/s: {s['reads_per_sec']:.1f} | samples/s: {s['samples_per_sec']:.1f} | "
+                f"samples/read: {s['samples_per_read']:.1f} | allocs/sample: {s['allocs_per_sample']:.2f}")
+
+
+class LatencyMeter:
+    """
+    Rolling latency statistics (nanosecond samples, reported in milliseconds)
+
+    Used for byte-arrival-to-widget latency: record(sample.t_ns) in the widget slot.
+    """
+
+    def __init__(self, window=512):
+        self.samples_ns = deque(maxlen=window)
+
+    def record(self, start_ns, end_ns=None):
+        end_ns = end_ns if end_ns is not None else time.perf_counter_ns()
+        self.samples_ns.append(end_ns - start_ns)
+
+    def __len__(self):
+        return len(self.samples_ns)
+
+    def percentiles_ms(self, points=(50, 95, 99)):
+        """Return {percentile: milliseconds} over the rolling window"""
+        if not self.samples_ns:
+            return {p: 0.0 for p in points}
+        values = np.percentile(np.fromiter(self.samples_ns, dtype=np.int64), points) / 1e6
+        return dict(zip(points, values.tolist()))
+
+    def last_ms(self):
+        return self.samples_ns[-1] / 1e6 if self.samples_ns else 0.0
+
+
+class TelemetryIngestor:
+    """
+    Transport-independent ingestion core shared by every serial backend
+
+    feed() takes whatever bytes the transport delivered (one bulk read), splits
+    them in the ring buffer, parses each record exactly once and hands the results
+    to the callbacks:
+      on_sample(TelemetrySample) - every sensor line or binary frame
+      on_line(str)               - every text line (sensor lines included)
+      on_message(str, t_ns)      - every non-sensor text line (replies, echoes) with
+                                   the receive stamp of its chunk, for round-trip timing
+
+    It also tracks the requested telemetry format (FORMAT_TEXT / FORMAT_BINARY);
+    pending_format_command() returns the T0/T1 bytes to send until the firmware
+    confirms with "TELEMETRY: ..." (the Nano resets to text mode when the port opens).
+    """
+
+    FORMAT_RETRY_MS = 500     # Re-send the T command until "TELEMETRY: ..." comes back
+
+    def __init__(self, on_sample, on_line=None, telemetry_format=FORMAT_TEXT, capacity=ByteRingBuffer.DEFAULT_CAPACITY,
+                 on_message=None):
+        self.on_sample = on_sample
+        self.on_line = on_line
+        self.on_message = on_message
+        self.ring = ByteRingBuffer(capacity)
+        self.stats = IngestStats()
+
+        # Telemetry format state
+        self.telemetry_format = telemetry_format
+        self.format_confirmed = telemetry_format == FORMAT_TEXT  # Firmware boots in text mode
+        self._format_sent_ns = 0
+
+    def set_telemetry_format(self, telemetry_format):
+        """Switch between FORMAT_TEXT and FORMAT_BINARY at runtime"""
+        if telemetry_format not in (FORMAT_TEXT, FORMAT_BINARY):
+            raise ValueError(f"Unknown telemetry format: {telemetry_format}")
+        self.telemetry_format = telemetry_format
+        self.format_confirmed = False
+        self._format_sent_ns = 0
+
+    def pending_format_command(self):
+        """Return b'T0\\n'/b'T1\\n' if the format command is due, otherwise None"""
+        if self.format_confirmed:
+            return None
+        now_ns = time.perf_counter_ns()
+        if now_ns - self._format_sent_ns < self.FORMAT_RETRY_MS * 1_000_000:
+            return None
+        self._format_sent_ns = now_ns
+        return b'T1\n' if self.telemetry_format == FORMAT_BINARY else b'T0\n'
+
+    def reset(self):
+        """Drop buffered bytes (call after reconnecting)"""
+        self.ring.clear()
+
+    def feed(self, data, t_ns=None):
+        """Process one chunk of received bytes; returns the number of samples produced"""
+        if not data:
+            return 0
+        t_ns = t_ns if t_ns is not None else time.perf_counter_ns()
+        self.stats.record_read(len(data))
+        copies_before = self.ring.copies
+        self.ring.write(data)
+
+        ring = self.ring
+        frames, lines, pos = decode_stream(ring.buffer, ring.start, ring.end)
+
+        produced = 0
+        for raw in lines:
+            produced += self._handle_line(raw, t_ns)
+        ring.consume(pos)
+
+        if len(frames):
+            for sample in frames_to_samples(frames, t_ns):
+                self.on_sample(sample)
+            produced += len(frames)
+
+        self.stats.allocs += self.ring.copies - copies_before
+        self.stats.samples += produced
+        return produced
+
+    def _handle_line(self, raw, t_ns):
+        """Publish one text line and its parsed sample (if it is a sensor line)"""
+        self.stats.lines += 1
+        sample = parse_line(raw, t_ns)
+
+        if self.on_line is not None or sample is None:
+            line = str(raw, 'utf-8', 'ignore').strip()
+            if sample is None:
+                if line.startswith("TELEMETRY:"):
+                    self.format_confirmed = line.endswith(self.telemetry_format.upper())
+                elif line.startswith("=== Dual Motor Line Follower Ready"):
+                    # Arduino was reset (port re-opened): it is back in text mode
+                    self.format_confirmed = self.telemetry_format == FORMAT_TEXT
+            if self.on_line is not None and line:
+                self.on_line(line)
+            if sample is None and self.on_message is not None and line:
+                self.on_message(line, t_ns)
+
+        if sample is None:
+            return 0
+        if self.telemetry_format == FORMAT_BINARY:
+            self.format_confirmed = False  # Still receiving text - ask again
+        self.on_sample(sample)
+        return 1
+
+
+# ===== INGESTION BENCHMARK =====
+if __name__ == '__main__':
+    """
+    Legacy readline() loop vs bulk read(in_waiting) + ring buffer on a Linux pty
+
+    A writer thread plays the firmware (one debug line every 15ms, or as fast as
+    possible with --burst). os.read is wrapped to count read syscalls; allocations
+    are the bytes objects the I/O path creates: one per port.read() result, plus
+    the line object readline() assembles from its one-byte reads.
+    Requires Linux/macOS (pty) and pyserial.
+    """
+    import os
+    import pty
+    import sys
+    import threading
+    import serial
+
+    seconds = float(sys.argv[sys.argv.index('--seconds') + 1]) if '--seconds' in sys.argv else 3.0
+    burst = '--burst' in sys.argv
+    line = b"L:45(W) R:120(B) Loss:L Out:-1\r\n"
+
+    syscalls = [0]
+    real_read = os.read
+
+    def counting_read(fd, n):
+        syscalls[0] += 1
+        return real_read(fd, n)
+
+    os.read = counting_read
+
+    def run(label, consume):
+        master, slave = pty.openpty()
+        port = serial.Serial(os.ttyname(slave), 9600, timeout=0.1)
+        stop = threading.Event()
+
+        def writer():
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline:
+                os.write(master, line * (64 if burst else 1))
+                if not burst:
+                    time.sleep(0.015)
+            time.sleep(0.1)
+            stop.set()
+
+        thread = threading.Thread(target=writer, daemon=True)
+        syscalls[0] = 0
+        start = time.perf_counter()
+        thread.start()
+        samples, allocs = consume(port, stop)
+        elapsed = time.perf_counter() - start
+        port.close()
+        os.close(master)
+        os.close(slave)
+        print(f"{label:<34} samples: {samples:>7} | read syscalls/s: {syscalls[0] / elapsed:>9.1f} | "
+              f"syscalls/sample: {syscalls[0] / max(samples, 1):>6.2f} | allocs/sample: {allocs / max(samples, 1):>6.2f}")
+
+    def legacy(port, stop):
+        # Old IRSensorWidget.poll_sensors loop (50ms timer)
+        samples = allocs = 0
+        while not stop.is_set() or port.in_waiting:
+            while port.in_waiting > 0:
+                raw = port.readline()
+                allocs += 1
+                if parse_line(raw) is not None:
+                    samples += 1
+            time.sleep(0.05)
+        return samples, allocs + syscalls[0]
+
+    def ring(port, stop):
+        count = [0]
+        ingestor = TelemetryIngestor(lambda sample: count.__setitem__(0, count[0] + 1))
+        while not stop.is_set() or port.in_waiting:
+            waiting = port.in_waiting
+            if waiting:
+                ingestor.feed(port.read(waiting))
+            else:
+                time.sleep(0.002)
+        print(f"{'':<34} {ingestor.stats.format()}")
+        return count[0], ingestor.stats.allocs
+
+    mode = "burst" if burst else "67Hz"
+    run(f"readline() loop ({mode})", legacy)
+    run(f"read(in_waiting) + ring ({mode})", ring)
@@ -0,0 +1,158 @@
+import time
+import queue
+from PyQt5.QtCore import QThread, pyqtSignal
+from TELEMETRY_PARSER import FORMAT_TEXT
+from SERIAL_BUFFER import TelemetryIngestor
+from BAUD_NEGOTIATION import negotiate_baud
+
+
+class SerialReaderThread(QThread):
+    """
+    Single background reader for the shared Arduino serial port
+
+    - Owns all reads from serial_manager.serial_port (widgets must NOT call readline())
+    - Bulk reads: one port.read(in_waiting) per wake-up into a preallocated ring buffer
+      (TelemetryIngestor), never a blocking readline() on a partial line
+    - Parses each line exactly once
+    - Fans out to any number of subscribers through Qt signals
+      (queued connections deliver them on the GUI thread)
+
+    - Owns all writes too: set_serial_manager() installs send_raw_command() as the
+      manager's sendRawCommand(), which queues the bytes for this thread. The
+      scheduler's speed commands and the calibration's W thresholds therefore never
+      interleave with the baud handshake; anything queued meanwhile goes out after it
+      (negotiating(True/False) lets the scheduler hold its writes instead).
+
+    TELEMETRY FORMAT (selectable at runtime with set_telemetry_format):
+    - FORMAT_TEXT:   "L:45(W) R:120(B) Loss:L Out:-1" lines (firmware default)
+    - FORMAT_BINARY: 14-byte frames (T1 command), decoded in bulk with numpy.frombuffer
+    The reader keeps re-sending the T command (through the same write queue) until
+    the firmware confirms it, so the choice survives the Arduino resetting when the
+    port is opened.
+
+    BAUD RATE: with target_baud set, every new connection starts with the U<baud>/P
+    handshake (BAUD_NEGOTIATION.py) before telemetry is read; if the firmware or the
+    link can't do it, both sides stay at the current rate.
+    """
+
+    sample_received = pyqtSignal(object)   # TelemetrySample for every sensor line
+    line_received = pyqtSignal(str)        # Every raw line (sensor lines included)
+    message_received = pyqtSignal(str, object)  # Non-sensor lines + receive t_ns (round-trip timing)
+    error_occurred = pyqtSignal(str)       # Read errors (port unplugged, closed, ...)
+    stats_updated = pyqtSignal(object)     # IngestStats.snapshot() dict every STATS_INTERVAL_MS
+    baud_negotiated = pyqtSignal(int, bool)  # Rate in use, whether the requested rate was reached
+    negotiating = pyqtSignal(bool)         # Baud handshake running (port writes held meanwhile)
+    command_written = pyqtSignal(str, object)  # sendRawCommand text (stripped) + t_ns right after port.write
+
+    IDLE_SLEEP_MS = 50          # Wait while the port is disconnected
+    POLL_SLEEP_MS = 2           # Wait while no bytes are pending
+    STATS_INTERVAL_MS = 1000    # Ingestion statistics period
+
+    def __init__(self, serial_manager=None, parent=None, telemetry_format=FORMAT_TEXT, target_baud=None):
+        super().__init__(parent)
+        self.serial_manager = None
+        self.target_baud = target_baud
+        self._running = False
+        self._port = None
+        self._writes = queue.SimpleQueue()   # (bytes, command or None), written on this thread only
+        
+        # Ring buffer + parser shared with the other serial backends
+        self.ingestor = TelemetryIngestor(self.sample_received.emit, self.line_received.emit,
+                                          telemetry_format=telemetry_format,
+                                          on_message=self.message_received.emit)
+        self.set_serial_manager(serial_manager)
+
+    @property
+    def telemetry_format(self):
+        return self.ingestor.telemetry_format
+
+    @property
+    def stats(self):
+        """IngestStats for the current connection (read syscalls, allocations per sample)"""
+        return self.ingestor.stats
+
+    def set_serial_manager(self, serial_manager):
+        """Allow external assignment of serial manager (its sendRawCommand now queues here)"""
+        self.serial_manager = serial_manager
+        if serial_manager is not None:
+            serial_manager.sendRawCommand = self.send_raw_command
+
+    def send_raw_command(self, command):
+        """Queue a raw ASCII command for the reader thread (any thread); returns (success, message)"""
+        manager = self.serial_manager
+        if manager is None or not manager.is_connected:
+            return False, "Not connected"
+        self._writes.put((command.encode('ascii'), command.strip()))
+        return True, f"Queued {command.strip()}"
+
+    def set_telemetry_format(self, telemetry_format):
+        """Switch between FORMAT_TEXT and FORMAT_BINARY at runtime"""
+        self.ingestor.set_telemetry_format(telemetry_format)
+
+    def run(self):
+        self._running = True
+        next_stats = time.perf_counter() + self.STATS_INTERVAL_MS / 1000
+        while self._running:
+            serial_mgr = self.serial_manager
+            if not serial_mgr or not serial_mgr.is_connected or not serial_mgr.serial_port:
+                self._port = None
+                self.msleep(self.IDLE_SLEEP_MS)
+                continue
+
+            try:
+                port = serial_mgr.serial_port
+                if port is not self._port:
+                    # New connection: drop stale bytes and restart the statistics
+                    self._port = port
+                    if self.target_baud and port.baudrate != self.target_baud:
+                        self.negotiating.emit(True)
+                        try:
+                            rate, ok = negotiate_baud(port, self.target_baud, on_line=self.line_received.emit)
+                        finally:
+                            self.negotiating.emit(False)
+                        self.baud_negotiated.emit(rate, ok)
+                    self.ingestor.reset()
+                    self.ingestor.stats.reset()
+
+                command = self.ingestor.pending_format_command()
+                if command:
+                    self._writes.put((command, None))   # Same queue as sendRawCommand: one writer, one order
+                self._write_pending(port)
+
+                # Only read once bytes are pending so stop() never waits on a port timeout
+                waiting = port.in_waiting
+                if waiting == 0:
+                    self.msleep(self.POLL_SLEEP_MS)
+                else:
+                    self.ingestor.feed(port.read(waiting), time.perf_counter_ns())
+
+                if time.perf_counter() >= next_stats:
+                    next_stats += self.STATS_INTERVAL_MS / 1000
+                    self.stats_updated.emit(self.ingestor.stats.snapshot())
+
+            except Exception as e:
+                self.error_occurred.emit(str(e))
+                self.msleep(self.IDLE_SLEEP_MS)
+
+        # Stopping: whatever was queued just before (e.g. the last speed command) still goes out
+        if self._port is not None:
+            try:
+                self._write_pending(self._port)
+            except Exception as e:
+                self.error_occurred.emit(str(e))
+
+    def _write_pending(self, port):
+        """Write everything queued by send_raw_command, in order (command_written per command)"""
+        while True:
+            try:
+                data, command = self._writes.get_nowait()
+            except queue.Empty:
+                return
+            port.write(data)
+            if command:
+                self.command_written.emit(command, time.perf_counter_ns())
+
+    def stop(self):
+        """Stop the reader loop (after writing anything queued) and wait for the thread to exit"""
+        self._running = False
+        self.wait(1000)
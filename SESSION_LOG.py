@@ -0,0 +1,415 @@
+import os
+import time
+from datetime import datetime
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+from TELEMETRY_PARSER import COLUMN_DTYPES, sample_to_row
+from EVENT_DETECTOR import event_text
+
+
+# ===== FILE FORMAT =====
+# <name>.mxlog      64-byte header + fixed 24-byte records, written through a memory map
+# <name>.mxlog.idx  sidecar index: one (t_ns, record) entry every INDEX_STRIDE records
+#
+# Record layout (little endian)
+# Offset  Size  Field
+#   0      8    t_ns       host time (perf_counter_ns), non-decreasing
+#   8      1    kind       KIND_SAMPLE / KIND_COMMAND / KIND_MODE / KIND_EVENT
+#   9      1    flags      FLAG_LEFT_WHITE | FLAG_RIGHT_WHITE   (samples)
+#  10      1    loss       LOSS_NONE / LOSS_LEFT / LOSS_RIGHT    (samples)
+#  11      1    out        -1, 0 or +1                           (samples)
+#  12      2    left_raw                                         (samples)
+#  14      2    right_raw                                        (samples)
+#  16      8    text       command ("M60,40"), mode key or event ("lost L"), ASCII, truncated to 8 bytes
+SESSION_MAGIC = b'MXSLOG1\x00'
+SESSION_EXTENSION = '.mxlog'
+INDEX_EXTENSION = '.idx'
+
+KIND_SAMPLE = 0
+KIND_COMMAND = 1
+KIND_MODE = 2
+KIND_EVENT = 3    # EVENT_DETECTOR.event_text()
+KIND_NAMES = ('sample', 'command', 'mode', 'event')
+
+RECORD_DTYPE = np.dtype([
+    ('t_ns', '<i8'),
+    ('kind', 'u1'),
+    ('flags', 'u1'),
+    ('loss', 'i1'),
+    ('out', 'i1'),
+    ('left_raw', '<u2'),
+    ('right_raw', '<u2'),
+    ('text', 'S8'),
+])
+RECORD_SIZE = RECORD_DTYPE.itemsize   # 24
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('record_size', '<u4'),
+    ('index_stride', '<u4'),
+    ('count', '<i8'),          # Records written (refreshed every INDEX_STRIDE records and on close)
+    ('start_unix_ns', '<i8'),  # Wall clock when recording started
+    ('start_t_ns', '<i8'),     # perf_counter_ns at the same moment (converts t_ns to wall time)
+    ('closed', 'u1'),          # 1 after a clean close()
+    ('reserved', 'V23'),
+])
+HEADER_SIZE = HEADER_DTYPE.itemsize   # 64
+
+INDEX_DTYPE = np.dtype([('t_ns', '<i8'), ('record', '<i8')])
+
+
+class SessionLogWriter:
+    """
+    Append-only session log backed by a memory-mapped file
+
+    - Every sample / command / mode change is one 24-byte record written into the
+      map (no file I/O per record; the OS writes the dirty pages back)
+    - The file grows in GROW_RECORDS steps (one remap per ~65 minutes at 67Hz) and
+      is trimmed to the exact size on close()
+    - Every INDEX_STRIDE records one (t_ns, record) entry goes to the sidecar index
+      and the header count is refreshed, so a crashed run loses at most one stride
+
+    Timestamps are clamped to be non-decreasing: samples are stamped on the serial
+    thread and commands on the GUI thread, so they can arrive a fraction of a ms
+    out of order. Readers can then binary-search t_ns.
+    """
+
+    GROW_RECORDS = 1 << 18   # 6 MB
+    INDEX_STRIDE = 1024      # One index entry per ~15s of samples
+
+    def __init__(self, path, grow_records=GROW_RECORDS, index_stride=INDEX_STRIDE):
+        self.path = path
+        self.index_path = path + INDEX_EXTENSION
+        self.grow_records = grow_records
+        self.index_stride = index_stride
+        self.count = 0
+        self.capacity = 0
+        self._last_t_ns = 0
+        self._map = None
+        self._header = None
+        self._records = None
+
+        with open(path, 'wb') as f:
+            f.write(np.zeros(1, dtype=HEADER_DTYPE).tobytes())
+        self._index_file = open(self.index_path, 'wb')
+        self._remap(grow_records)
+
+        header = self._header
+        header['magic'] = SESSION_MAGIC
+        header['record_size'] = RECORD_SIZE
+        header['index_stride'] = index_stride
+        header['start_unix_ns'] = time.time_ns()
+        header['start_t_ns'] = time.perf_counter_ns()
+
+    def __len__(self):
+        return self.count
+
+    # ===== MAPPING =====
+    def _release(self):
+        if self._map is not None:
+            self._map.flush()
+        # The map must be gone before the file can be resized (Windows)
+        self._header = self._records = self._map = None
+
+    def _remap(self, capacity):
+        self._release()
+        with open(self.path, 'r+b') as f:
+            f.truncate(HEADER_SIZE + capacity * RECORD_SIZE)
+        self._map = np.memmap(self.path, dtype=np.uint8, mode='r+')
+        self._header = self._map[:HEADER_SIZE].view(HEADER_DTYPE)[0]
+        self._records = self._map[HEADER_SIZE:].view(RECORD_DTYPE)
+        self.capacity = capacity
+
+    def _reserve(self, size):
+        if self.count + size > self.capacity:
+            self._remap(self.capacity + max(self.grow_records, size))
+
+    def _clamp(self, t_ns):
+        if t_ns is None:
+            t_ns = time.perf_counter_ns()
+        if t_ns < self._last_t_ns:
+            t_ns = self._last_t_ns
+        self._last_t_ns = t_ns
+        return t_ns
+
+    def _committed(self, first, size):
+        # Index entries for every stride boundary in [first, first + size)
+        stride = self.index_stride
+        boundary = -(-first // stride) * stride
+        if boundary < first + size:
+            records = np.arange(boundary, first + size, stride)
+            entries = np.empty(len(records), dtype=INDEX_DTYPE)
+            entries['record'] = records
+            entries['t_ns'] = self._records['t_ns'][records]
+            self._index_file.write(entries.tobytes())
+            self._index_file.flush()   # Readers of a live log see the index too
+            self._header['count'] = first + size
+        self.count = first + size
+
+    # ===== RECORDS =====
+    def append_sample(self, sample):
+        """Record one TelemetrySample"""
+        t_ns, left_raw, right_raw, flags, loss, out = sample_to_row(sample)
+        self._reserve(1)
+        self._records[self.count] = (self._clamp(t_ns), KIND_SAMPLE, flags, loss, out, left_raw, right_raw, b'')
+        self._committed(self.count, 1)
+
+    def append_samples(self, columns):
+        """Record a whole chunk (dict of columns from parse_lines() / frames_to_columns())"""
+        size = len(columns['t_ns'])
+        if size == 0:
+            return
+        self._reserve(size)
+        block = self._records[self.count:self.count + size]
+        block['t_ns'] = np.maximum(columns['t_ns'], self._last_t_ns)
+        np.maximum.accumulate(block['t_ns'], out=block['t_ns'])
+        self._last_t_ns = int(block['t_ns'][-1])
+        block['kind'] = KIND_SAMPLE
+        for name in ('flags', 'loss', 'out', 'left_raw', 'right_raw'):
+            block[name] = columns[name]
+        block['text'] = b''
+        self._committed(self.count, size)
+
+    def append_text(self, kind, text, t_ns=None):
+        """Record a command, mode change or event (text truncated to 8 ASCII bytes)"""
+        self._reserve(1)
+        self._records[self.count] = (self._clamp(t_ns), kind, 0, 0, 0, 0, 0,
+                                     text.encode('ascii', 'replace')[:8])
+        self._committed(self.count, 1)
+
+    def append_command(self, command, t_ns=None):
+        """Record an outgoing command; "L60\\nR40" becomes two records"""
+        for part in command.split('\n'):
+            if part:
+                self.append_text(KIND_COMMAND, part, t_ns)
+
+    def append_mode(self, mode_key, t_ns=None):
+        self.append_text(KIND_MODE, mode_key, t_ns)
+
+    # ===== FINISH =====
+    def flush(self):
+        """Push the header count and dirty pages to disk (not needed for correctness)"""
+        if self._map is not None:
+            self._header['count'] = self.count
+            self._map.flush()
+            self._index_file.flush()
+
+    def close(self):
+        """Write the final count, trim the preallocated tail and close the index"""
+        if self._map is None:
+            return
+        self._header['count'] = self.count
+        self._header['closed'] = 1
+        self._release()
+        with open(self.path, 'r+b') as f:
+            f.truncate(HEADER_SIZE + self.count * RECORD_SIZE)
+        self._index_file.close()
+
+
+class SessionLogReader:
+    """
+    Read-only view of a session log (complete or still being written)
+
+    Opening maps the file and reads the 64-byte header; nothing else is read until
+    a column is touched, so a multi-hour log opens instantly. The sidecar index
+    narrows time lookups to one stride before the final binary search.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        raw = np.memmap(path, dtype=np.uint8, mode='r')
+        header = raw[:HEADER_SIZE].view(HEADER_DTYPE)[0]
+        if header['magic'] != SESSION_MAGIC.rstrip(b'\x00') or header['record_size'] != RECORD_SIZE:
+            raise ValueError(f"{path} is not a session log")
+        self.start_unix_ns = int(header['start_unix_ns'])
+        self.start_t_ns = int(header['start_t_ns'])
+        self.closed = bool(header['closed'])
+
+        capacity = (len(raw) - HEADER_SIZE) // RECORD_SIZE
+        records = raw[HEADER_SIZE:HEADER_SIZE + capacity * RECORD_SIZE].view(RECORD_DTYPE)
+        count = min(int(header['count']), capacity)
+        if not self.closed:
+            # Still recording (or crashed): the header lags by up to one stride
+            valid = records['t_ns'][count:count + int(header['index_stride']) + 1] > 0
+            count += len(valid) if valid.all() else int(np.argmin(valid))
+        self.records = records[:count]
+
+        index_path = path + INDEX_EXTENSION
+        if os.path.exists(index_path):
+            self.index = np.fromfile(index_path, dtype=INDEX_DTYPE)
+        else:
+            self.index = np.empty(0, dtype=INDEX_DTYPE)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def duration_s(self):
+        if len(self.records) == 0:
+            return 0.0
+        return (int(self.records['t_ns'][-1]) - int(self.records['t_ns'][0])) / 1e9
+
+    def to_unix_ns(self, t_ns):
+        """Convert record timestamps (perf_counter_ns) to wall-clock ns"""
+        return np.asarray(t_ns, dtype=np.int64) - self.start_t_ns + self.start_unix_ns
+
+    def find(self, t_ns):
+        """Index of the first record at or after t_ns"""
+        times = self.records['t_ns']
+        lo, hi = 0, len(times)
+        if len(self.index):
+            block = int(np.searchsorted(self.index['t_ns'], t_ns, side='left'))
+            if block > 0:
+                lo = int(self.index['record'][block - 1])
+            if block < len(self.index):
+                hi = min(hi, int(self.index['record'][block]) + 1)
+        return lo + int(np.searchsorted(times[lo:hi], t_ns, side='left'))
+
+    def between(self, start_ns, end_ns):
+        """Records with start_ns <= t_ns < end_ns (a view, no copy)"""
+        return self.records[self.find(start_ns):self.find(end_ns)]
+
+    def samples(self, records=None):
+        """Sample records as columns keyed like COLUMN_DTYPES"""
+        records = self.records if records is None else records
+        samples = records[records['kind'] == KIND_SAMPLE]
+        return {name: samples[name].astype(dtype) for name, dtype in COLUMN_DTYPES.items()}
+
+    def texts(self, kind, records=None):
+        """[(t_ns, text)] for KIND_COMMAND, KIND_MODE or KIND_EVENT records"""
+        records = self.records if records is None else records
+        selected = records[records['kind'] == kind]
+        return [(t_ns, text.decode('ascii', 'replace'))
+                for t_ns, text in zip(selected['t_ns'].tolist(), selected['text'].tolist())]
+
+    def commands(self, records=None):
+        return self.texts(KIND_COMMAND, records)
+
+    def modes(self, records=None):
+        return self.texts(KIND_MODE, records)
+
+    def events(self, records=None):
+        return self.texts(KIND_EVENT, records)
+
+
+class SessionRecorder(QObject):
+    """
+    Records a session while learning mode is active
+
+    - on_mode_changed:  connect OperationProfilesWidget.mode_changed; entering a
+                        RECORD_MODES mode starts a new log, leaving it stops it
+    - on_sample:        connect the telemetry source's sample_received
+    - on_command_sent:  connect SpeedCommandScheduler.command_sent
+    - on_event:         connect EventDetector.event_detected ("lost L", "found R", ...)
+
+    Logs go to <directory>/session_<timestamp>.mxlog (+ .idx).
+    """
+
+    recording_changed = pyqtSignal(bool, str)   # recording, log path
+
+    RECORD_MODES = ('learning',)
+
+    def __init__(self, directory='sessions', parent=None, record_modes=RECORD_MODES):
+        super().__init__(parent)
+        self.directory = directory
+        self.record_modes = record_modes
+        self.writer = None
+
+    @property
+    def is_recording(self):
+        return self.writer is not None
+
+    def start(self, path=None):
+        """Open a new log (closing the current one); returns its path"""
+        self.stop()
+        if path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            name = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}{SESSION_EXTENSION}"
+            path = os.path.join(self.directory, name)
+        try:
+            self.writer = SessionLogWriter(path)
+        except OSError as e:
+            print(f"[Session Log] Cannot create {path}: {e}")
+            return None
+        print(f"[Session Log] Recording to {path}")
+        self.recording_changed.emit(True, path)
+        return path
+
+    def stop(self):
+        if self.writer is None:
+            return
+        writer, self.writer = self.writer, None
+        writer.close()
+        print(f"[Session Log] Saved {len(writer)} records to {writer.path}")
+        self.recording_changed.emit(False, writer.path)
+
+    # ===== SLOTS =====
+    def on_mode_changed(self, mode_key):
+        if mode_key in self.record_modes:
+            if self.writer is None:
+                self.start()
+            if self.writer is not None:
+                self.writer.append_mode(mode_key)
+        elif self.writer is not None:
+            self.writer.append_mode(mode_key)
+            self.stop()
+
+    def on_sample(self, sample):
+        if self.writer is not None:
+            self.writer.append_sample(sample)
+
+    def on_command_sent(self, command):
+        if self.writer is not None:
+            self.writer.append_command(command)
+
+    def on_event(self, event):
+        if self.writer is not None:
+            self.writer.append_text(KIND_EVENT, event_text(event), event.t_ns)
+
+
+# ===== MULTI-HOUR RECORDING BENCHMARK =====
+if __name__ == '__main__':
+    """
+    Write 4 hours of 67Hz telemetry (~1M samples plus a command every second),
+    per sample and in parsed chunks, then time reopening and a time lookup
+    """
+    import tempfile
+    from TELEMETRY_PARSER import TelemetrySample, parse_lines
+
+    HOURS = 4
+    SAMPLES = int(HOURS * 3600 * 67)
+    directory = tempfile.mkdtemp()
+
+    samples = [TelemetrySample(i * 15_000_000, i % 1024, (i * 7) % 1024, i % 2 == 0, False, '-', 0)
+               for i in range(200_000)]
+    writer = SessionLogWriter(os.path.join(directory, 'per_sample.mxlog'))
+    start = time.perf_counter()
+    for sample in samples:
+        writer.append_sample(sample)
+    per_sample_s = time.perf_counter() - start
+    writer.close()
+    print(f"append_sample      {len(samples) / per_sample_s:>12,.0f} records/s")
+
+    path = os.path.join(directory, 'chunked.mxlog')
+    writer = SessionLogWriter(path)
+    columns = parse_lines(b''.join(b"L:%d(W) R:%d(B) Loss:- Out:0\r\n" % (i, 1023 - i) for i in range(67)))
+    start = time.perf_counter()
+    for second in range(SAMPLES // 67):
+        columns['t_ns'] = np.arange(67, dtype=np.int64) * 15_000_000 + second * 1_000_000_000
+        writer.append_samples(columns)
+        writer.append_command(f"M{second % 101},{100 - second % 101}", second * 1_000_000_000)
+    chunked_s = time.perf_counter() - start
+    writer.close()
+    size_mb = os.path.getsize(path) / 1e6
+    print(f"append_samples     {len(writer) / chunked_s:>12,.0f} records/s "
+          f"({HOURS} h in {chunked_s:.2f} s, {size_mb:.1f} MB, index {os.path.getsize(path + INDEX_EXTENSION)} B)")
+
+    start = time.perf_counter()
+    reader = SessionLogReader(path)
+    open_ms = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    window = reader.between(3600 * 1_000_000_000, 3601 * 1_000_000_000)
+    lookup_us = (time.perf_counter() - start) * 1e6
+    print(f"reopen             {open_ms:>12.2f} ms ({len(reader):,} records, {reader.duration_s / 3600:.2f} h)")
+    print(f"1s window at 1h    {lookup_us:>12.1f} us ({len(reader.samples(window)['t_ns'])} samples, "
+          f"commands {reader.commands(window)})")
@@ -0,0 +1,273 @@
+import sys
+import time
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from TELEMETRY_PARSER import TelemetrySample, FLAG_LEFT_WHITE, FLAG_RIGHT_WHITE, LOSS_CHARS
+from SESSION_LOG import SessionLogReader, KIND_SAMPLE, KIND_COMMAND, KIND_MODE
+
+
+class SessionReplay(QObject):
+    """
+    Plays a recorded session (.mxlog) back through the live telemetry interface
+
+    - sample_received:  same signal the serial backends emit, so the store, IR graph
+                        and every other sample_received subscriber animate unchanged
+    - command_replayed: every recorded speed command ("M60,40") - drives the DAC view
+    - mode_replayed:    recorded mode changes - drives ModeDisplayWidget
+    - position_changed: replay time in seconds since the first record (throttled)
+
+    Speed: 1.0 = real time, 10.0 = 10x, 0 = as fast as possible. Timed replay emits
+    every record whose recorded time has passed on each TICK_MS tick; max speed emits
+    MAX_BATCH records per event-loop pass so the widgets still repaint in between.
+    seek() goes through the log's time index (no scan).
+
+    Replayed samples keep their recorded spacing, moved onto the current perf_counter
+    clock (t - anchor t + anchor wall time), so event durations, laps and sample rates
+    read as recorded at any speed; speed only changes when they are emitted.
+    Re-anchoring (play, seek, speed change) never moves stamps backwards.
+    finished carries the throughput: max-speed replay doubles as a benchmark.
+    """
+
+    sample_received = pyqtSignal(object)   # TelemetrySample
+    command_replayed = pyqtSignal(str)
+    mode_replayed = pyqtSignal(str)
+    position_changed = pyqtSignal(float)   # Seconds since the start of the recording
+    finished = pyqtSignal(dict)            # stats()
+
+    TICK_MS = 15            # One firmware loop
+    MAX_BATCH = 4096        # Records per event-loop pass at max speed
+    POSITION_INTERVAL_S = 0.1
+
+    def __init__(self, session=None, speed=1.0, mode_keys=(), parent=None):
+        super().__init__(parent)
+        self.speed = speed
+        self.mode_keys = tuple(mode_keys)   # Full keys for the 8-byte mode records
+        self.reader = None
+        self.position = 0   # Next record to emit
+
+        self.samples_emitted = 0
+        self.records_emitted = 0
+        self._busy_ns = 0          # Wall time spent inside emit (slots included)
+        self._play_started_ns = 0
+        self._anchor_t_ns = 0      # Recorded time at the anchor
+        self._anchor_wall_ns = 0   # Wall time at the anchor
+        self._stamp_offset_ns = 0  # Recorded time -> emitted sample stamp
+        self._last_stamp_ns = 0
+        self._last_position_ns = 0
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._tick)
+
+        if session is not None:
+            self.open(session)
+
+    # ===== CONTROL =====
+    def open(self, session):
+        """Load a SessionLogReader or a .mxlog path and rewind"""
+        self.pause()
+        self.reader = session if isinstance(session, SessionLogReader) else SessionLogReader(session)
+        self.position = 0
+        print(f"[Replay] {self.reader.path}: {len(self.reader)} records, {self.reader.duration_s:.1f} s")
+
+    @property
+    def is_playing(self):
+        return self.timer.isActive()
+
+    @property
+    def start_t_ns(self):
+        return int(self.reader.records['t_ns'][0]) if self.reader is not None and len(self.reader) else 0
+
+    @property
+    def position_s(self):
+        if self.reader is None or len(self.reader) == 0:
+            return 0.0
+        index = min(self.position, len(self.reader) - 1)
+        return (int(self.reader.records['t_ns'][index]) - self.start_t_ns) / 1e9
+
+    def play(self):
+        if self.reader is None or self.position >= len(self.reader):
+            return
+        if self.samples_emitted == 0:
+            self._play_started_ns = time.perf_counter_ns()
+        self._set_anchor()
+        self.timer.start(0 if self.speed <= 0 else self.TICK_MS)
+
+    def pause(self):
+        self.timer.stop()
+
+    def close(self):
+        """Stop for good: pause, detach every subscriber and release the log mapping"""
+        self.pause()
+        for signal in (self.sample_received, self.command_replayed, self.mode_replayed,
+                       self.position_changed, self.finished):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass   # Nothing connected
+        self.reader = None
+
+    def set_speed(self, speed):
+        """1.0 = real time, 10.0 = 10x, 0 = as fast as possible"""
+        self.speed = speed
+        if self.is_playing:
+            self.play()
+
+    def seek(self, seconds):
+        """Jump to `seconds` after the first record (index lookup)"""
+        if self.reader is None:
+            return
+        self.position = self.reader.find(self.start_t_ns + int(seconds * 1e9))
+        self._set_anchor()
+        self.position_changed.emit(self.position_s)
+
+    def _set_anchor(self):
+        if self.reader is not None and self.position < len(self.reader):
+            self._anchor_t_ns = int(self.reader.records['t_ns'][self.position])
+        self._anchor_wall_ns = time.perf_counter_ns()
+        # Stamps continue from the last one emitted: after a fast stretch they run ahead of the wall clock
+        self._stamp_offset_ns = max(self._anchor_wall_ns, self._last_stamp_ns + 1) - self._anchor_t_ns
+
+    # ===== PLAYBACK =====
+    def _tick(self):
+        total = len(self.reader)
+        if self.speed <= 0:
+            end = min(self.position + self.MAX_BATCH, total)
+        else:
+            elapsed_ns = time.perf_counter_ns() - self._anchor_wall_ns
+            end = self.reader.find(self._anchor_t_ns + int(elapsed_ns * self.speed) + 1)
+
+        if end > self.position:
+            self._emit(self.position, end)
+            self.position = end
+
+        now_ns = time.perf_counter_ns()
+        if now_ns - self._last_position_ns >= self.POSITION_INTERVAL_S * 1e9 or self.position >= total:
+            self._last_position_ns = now_ns
+            self.position_changed.emit(self.position_s)
+
+        if self.position >= total:
+            self.timer.stop()
+            stats = self.stats()
+            print(f"[Replay] Finished: {stats['samples']} samples in {stats['wall_s']:.2f} s "
+                  f"({stats['samples_per_sec']:,.0f} samples/s, {stats['speed']:g}x requested)")
+            self.finished.emit(stats)
+
+    def _emit(self, start, end):
+        begin_ns = time.perf_counter_ns()
+        block = self.reader.records[start:end]
+        kinds = block['kind'].tolist()
+        offset_ns = self._stamp_offset_ns
+        rows = zip(kinds, block['t_ns'].tolist(), block['left_raw'].tolist(), block['right_raw'].tolist(), block['flags'].tolist(),
+                   block['loss'].tolist(), block['out'].tolist(), block['text'].tolist())
+        samples = 0
+        for kind, t_ns, left_raw, right_raw, flags, loss, out, text in rows:
+            if kind == KIND_SAMPLE:
+                samples += 1
+                self._last_stamp_ns = t_ns + offset_ns
+                self.sample_received.emit(TelemetrySample(
+                    self._last_stamp_ns, left_raw, right_raw,
+                    bool(flags & FLAG_LEFT_WHITE), bool(flags & FLAG_RIGHT_WHITE),
+                    LOSS_CHARS[loss] if 0 <= loss < len(LOSS_CHARS) else '-', out))
+            elif kind == KIND_COMMAND:
+                self.command_replayed.emit(text.decode('ascii', 'replace'))
+            elif kind == KIND_MODE:
+                self.mode_replayed.emit(self.resolve_mode(text.decode('ascii', 'replace')))
+        self.samples_emitted += samples
+        self.records_emitted += len(kinds)
+        self._busy_ns += time.perf_counter_ns() - begin_ns
+
+    def resolve_mode(self, text):
+        """Mode records keep 8 characters ("powersav"); map them back to the full key"""
+        return next((key for key in self.mode_keys if key[:8] == text), text)
+
+    def stats(self):
+        wall_s = (time.perf_counter_ns() - self._play_started_ns) / 1e9 if self._play_started_ns else 0.0
+        busy_s = self._busy_ns / 1e9
+        return {
+            'samples': self.samples_emitted,
+            'records': self.records_emitted,
+            'speed': self.speed,
+            'wall_s': wall_s,
+            'samples_per_sec': self.samples_emitted / wall_s if wall_s > 0 else 0.0,
+            'emit_samples_per_sec': self.samples_emitted / busy_s if busy_s > 0 else 0.0,
+        }
+
+
+def record_simulated_session(path, seconds=60.0, command_every_s=1.0, seed=1):
+    """Write a session from FIRMWARE_SIM (telemetry + speed commands) for demos and benchmarks"""
+    from FIRMWARE_SIM import FirmwareSimulator, LineTrack
+    from SESSION_LOG import SessionLogWriter
+    from TELEMETRY_PARSER import parse_lines
+
+    sim = FirmwareSimulator(LineTrack(seed=seed))
+    writer = SessionLogWriter(path)
+    sim.boot()
+    writer.append_mode('learning', 0)
+    next_command_ms = 0
+    while sim.clock_ms < seconds * 1000:
+        if sim.clock_ms >= next_command_ms:
+            speed = 40 + int(next_command_ms / 1000) % 5 * 10
+            command = f"S{speed}"
+            sim.receive(f"{command}\n".encode('ascii'))
+            writer.append_command(command, int(sim.clock_ms * 1e6))
+            next_command_ms += command_every_s * 1000
+        columns = parse_lines(sim.step(), int(sim.clock_ms * 1e6))
+        writer.append_samples(columns)
+    writer.close()
+    return path
+
+
+# ===== WIDGET PIPELINE THROUGHPUT =====
+if __name__ == '__main__':
+    """
+    Replay a session into the IR graph, DAC visualiser and mode display
+    (the same slots layout.py connects) and report samples/sec
+
+      python SESSION_REPLAY.py                          # simulated 10 min session, max speed
+      python SESSION_REPLAY.py sessions/x.mxlog --speed 10
+    """
+    import os
+    import tempfile
+    from PyQt5.QtWidgets import QApplication
+    from IR_GRAPH import IRSensorWidget
+    from DAC_PIN_VISUALISER import DualDACWidget
+    from MODE import ModeDisplayWidget, OPERATION_MODES
+    from COMMAND_LATENCY import CommandRoundTripTracker
+    from TELEMETRY_STORE import TelemetryStore
+
+    app = QApplication(sys.argv)
+    speed = float(sys.argv[sys.argv.index('--speed') + 1]) if '--speed' in sys.argv else 0.0
+    paths = [arg for arg in sys.argv[1:] if arg.endswith('.mxlog')]
+    if paths:
+        path = paths[0]
+    else:
+        path = record_simulated_session(os.path.join(tempfile.mkdtemp(), 'simulated.mxlog'), seconds=600)
+
+    store = TelemetryStore()
+    ir_sensor = IRSensorWidget()
+    ir_sensor.set_telemetry_store(store)
+    dac = DualDACWidget()
+    mode_display = ModeDisplayWidget()
+
+    def on_command(command):
+        left, right = CommandRoundTripTracker.expected_speeds(command) or (None, None)
+        if left is not None:
+            dac.update_pins(min(255, int(round(2.55 * left))), 'a6')
+        if right is not None:
+            dac.update_pins(min(255, int(round(2.55 * right))), 'a7')
+
+    replay = SessionReplay(path, speed=speed, mode_keys=OPERATION_MODES)
+    replay.sample_received.connect(store.append)
+    replay.sample_received.connect(ir_sensor.on_telemetry_sample)
+    replay.command_replayed.connect(on_command)
+    replay.mode_replayed.connect(mode_display.update_mode_display)
+
+    def on_finished(stats):
+        print(f"Widget pipeline: {stats['samples_per_sec']:,.0f} samples/s end to end "
+              f"(slots alone {stats['emit_samples_per_sec']:,.0f} samples/s) | store holds {len(store)}")
+        app.quit()
+
+    replay.finished.connect(on_finished)
+    for widget in (ir_sensor, dac, mode_display):
+        widget.show()
+    replay.play()
+    sys.exit(app.exec_())
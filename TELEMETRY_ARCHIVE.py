@@ -0,0 +1,348 @@
+import os
+import zlib
+import lzma
+import numpy as np
+from TELEMETRY_PARSER import COLUMN_DTYPES, parse_lines
+
+
+# ===== FILE FORMAT =====
+# <name>.mxarc
+#   header      16 bytes (ARCHIVE_HEADER_DTYPE)
+#   chunk 0     CHUNK_HEADER_DTYPE + compressed payload
+#   chunk 1     ...
+#   directory   every chunk header again, plus its file offset (DIRECTORY_DTYPE)
+#   trailer     24 bytes: directory offset, chunk count, ARCHIVE_END
+#
+# Payload: the chunk's columns one after another (COLUMN_DTYPES order), each
+# delta-encoded in its own dtype (wrapping, so decoding is an exact cumsum),
+# compressed as one zlib or lzma stream. Chunk headers carry count and
+# min/max of every column, so range queries skip chunks without decompressing.
+# A file without a trailer (writer killed) is still readable by walking the chunk headers.
+ARCHIVE_MAGIC = b'MXTARC1\x00'
+ARCHIVE_END = b'MXTAEND\x00'
+ARCHIVE_EXTENSION = '.mxarc'
+
+COLUMNS = tuple(COLUMN_DTYPES)
+CODECS = ('zlib', 'lzma')
+
+ARCHIVE_HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('codec', 'u1'),       # Index into CODECS
+    ('columns', 'u1'),     # len(COLUMNS)
+    ('reserved', 'V2'),
+    ('chunk_size', '<u4'),
+])
+CHUNK_HEADER_DTYPE = np.dtype([
+    ('count', '<u4'),
+    ('payload_size', '<u4'),
+    ('min', '<i8', (len(COLUMNS),)),
+    ('max', '<i8', (len(COLUMNS),)),
+])
+DIRECTORY_DTYPE = np.dtype(CHUNK_HEADER_DTYPE.descr + [('offset', '<i8')])   # offset of the payload
+TRAILER_DTYPE = np.dtype([('directory_offset', '<i8'), ('chunks', '<i8'), ('magic', 'S8')])
+
+
+def encode_chunk(columns, codec='zlib'):
+    """Delta-encode + compress equal-length columns; returns (CHUNK_HEADER_DTYPE record, payload)"""
+    count = len(columns['t_ns'])
+    header = np.zeros(1, dtype=CHUNK_HEADER_DTYPE)
+    header['count'] = count
+    parts = []
+    for i, (name, dtype) in enumerate(COLUMN_DTYPES.items()):
+        values = np.asarray(columns[name], dtype=dtype)
+        header['min'][0, i] = values.min()
+        header['max'][0, i] = values.max()
+        deltas = np.empty_like(values)
+        deltas[0] = values[0]
+        np.subtract(values[1:], values[:-1], out=deltas[1:])   # Wraps in the column dtype
+        parts.append(deltas.tobytes())
+    raw = b''.join(parts)
+    payload = zlib.compress(raw, 6) if codec == 'zlib' else lzma.compress(raw, preset=6)
+    header['payload_size'] = len(payload)
+    return header[0], payload
+
+
+def decode_chunk(payload, count, codec='zlib'):
+    """Inverse of encode_chunk(): returns the columns dict"""
+    raw = zlib.decompress(payload) if codec == 'zlib' else lzma.decompress(payload)
+    columns = {}
+    offset = 0
+    for name, dtype in COLUMN_DTYPES.items():
+        size = count * np.dtype(dtype).itemsize
+        deltas = np.frombuffer(raw, dtype=dtype, count=count, offset=offset)
+        columns[name] = np.cumsum(deltas, dtype=dtype)
+        offset += size
+    return columns
+
+
+class TelemetryArchiveWriter:
+    """
+    Streams telemetry columns into a chunked, compressed archive
+
+    - append() takes any number of samples (parse_lines() / frames_to_columns() /
+      TelemetryStore.window() output); full chunks are written as they fill up
+    - close() writes the last partial chunk, the chunk directory and the trailer
+    """
+
+    CHUNK_SIZE = 4096   # Samples per chunk (~1 min at 67Hz)
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE, codec='zlib'):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec} (use one of {CODECS})")
+        self.path = path
+        self.chunk_size = chunk_size
+        self.codec = codec
+        self.count = 0
+        self.directory = []
+        self._pending = {name: [] for name in COLUMNS}
+        self._pending_count = 0
+
+        self._file = open(path, 'wb')
+        header = np.zeros(1, dtype=ARCHIVE_HEADER_DTYPE)
+        header['magic'] = ARCHIVE_MAGIC
+        header['codec'] = CODECS.index(codec)
+        header['columns'] = len(COLUMNS)
+        header['chunk_size'] = chunk_size
+        self._file.write(header.tobytes())
+
+    def append(self, columns):
+        size = len(columns['t_ns'])
+        if size == 0:
+            return
+        for name in COLUMNS:
+            self._pending[name].append(np.asarray(columns[name], dtype=COLUMN_DTYPES[name]))
+        self._pending_count += size
+        self.count += size
+        if self._pending_count >= self.chunk_size:
+            self._write_chunks(final=False)
+
+    def _write_chunks(self, final):
+        merged = {name: np.concatenate(parts) for name, parts in self._pending.items()}
+        total = self._pending_count
+        start = 0
+        while total - start >= self.chunk_size or (final and start < total):
+            end = min(start + self.chunk_size, total)
+            self._write_chunk({name: values[start:end] for name, values in merged.items()})
+            start = end
+        self._pending = {name: [values[start:]] for name, values in merged.items()}
+        self._pending_count = total - start
+
+    def _write_chunk(self, columns):
+        header, payload = encode_chunk(columns, self.codec)
+        self._file.write(header.tobytes())
+        entry = np.zeros(1, dtype=DIRECTORY_DTYPE)
+        for name in CHUNK_HEADER_DTYPE.names:
+            entry[name] = header[name]
+        entry['offset'] = self._file.tell()
+        self._file.write(payload)
+        self.directory.append(entry)
+
+    def close(self):
+        if self._file is None:
+            return
+        if self._pending_count:
+            self._write_chunks(final=True)
+        directory_offset = self._file.tell()
+        if self.directory:
+            self._file.write(np.concatenate(self.directory).tobytes())
+        trailer = np.zeros(1, dtype=TRAILER_DTYPE)
+        trailer['directory_offset'] = directory_offset
+        trailer['chunks'] = len(self.directory)
+        trailer['magic'] = ARCHIVE_END
+        self._file.write(trailer.tobytes())
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TelemetryArchive:
+    """
+    Reader: loads only the chunk directory, decompresses chunks on demand
+
+    query() answers "samples where left_raw > 500 between t1 and t2" by first
+    dropping every chunk whose time range or column min/max cannot match, then
+    filtering the remaining chunks sample by sample. last_query reports how
+    many chunks were read vs skipped.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        header = np.frombuffer(self._file.read(ARCHIVE_HEADER_DTYPE.itemsize), dtype=ARCHIVE_HEADER_DTYPE)[0]
+        if header['magic'] != ARCHIVE_MAGIC.rstrip(b'\x00') or header['columns'] != len(COLUMNS):
+            raise ValueError(f"{path} is not a telemetry archive")
+        self.codec = CODECS[header['codec']]
+        self.chunk_size = int(header['chunk_size'])
+        self.directory = self._read_directory()
+        self.last_query = {'chunks_read': 0, 'chunks_skipped': 0}
+
+    def _read_directory(self):
+        size = os.fstat(self._file.fileno()).st_size
+        if size >= ARCHIVE_HEADER_DTYPE.itemsize + TRAILER_DTYPE.itemsize:
+            self._file.seek(size - TRAILER_DTYPE.itemsize)
+            trailer = np.frombuffer(self._file.read(TRAILER_DTYPE.itemsize), dtype=TRAILER_DTYPE)[0]
+            if trailer['magic'] == ARCHIVE_END.rstrip(b'\x00'):
+                self._file.seek(int(trailer['directory_offset']))
+                return np.fromfile(self._file, dtype=DIRECTORY_DTYPE, count=int(trailer['chunks']))
+
+        # No trailer: walk the chunk headers (payloads are skipped, not read)
+        entries = []
+        offset = ARCHIVE_HEADER_DTYPE.itemsize
+        while offset + CHUNK_HEADER_DTYPE.itemsize <= size:
+            self._file.seek(offset)
+            header = np.frombuffer(self._file.read(CHUNK_HEADER_DTYPE.itemsize), dtype=CHUNK_HEADER_DTYPE)[0]
+            payload_offset = offset + CHUNK_HEADER_DTYPE.itemsize
+            if header['count'] == 0 or payload_offset + int(header['payload_size']) > size:
+                break   # Truncated last chunk
+            entry = np.zeros(1, dtype=DIRECTORY_DTYPE)
+            for name in CHUNK_HEADER_DTYPE.names:
+                entry[name] = header[name]
+            entry['offset'] = payload_offset
+            entries.append(entry)
+            offset = payload_offset + int(header['payload_size'])
+        return np.concatenate(entries) if entries else np.empty(0, dtype=DIRECTORY_DTYPE)
+
+    def __len__(self):
+        return int(self.directory['count'].sum())
+
+    @property
+    def compressed_bytes(self):
+        return int(self.directory['payload_size'].sum())
+
+    def read_chunk(self, i):
+        entry = self.directory[i]
+        self._file.seek(int(entry['offset']))
+        return decode_chunk(self._file.read(int(entry['payload_size'])), int(entry['count']), self.codec)
+
+    def candidate_chunks(self, t_start=None, t_end=None, where=None):
+        """Indices of the chunks that may hold matches (header min/max only)"""
+        keep = np.ones(len(self.directory), dtype=bool)
+        t = COLUMNS.index('t_ns')
+        if t_start is not None:
+            keep &= self.directory['max'][:, t] >= t_start
+        if t_end is not None:
+            keep &= self.directory['min'][:, t] < t_end
+        for name, (low, high) in (where or {}).items():
+            i = COLUMNS.index(name)
+            if low is not None:
+                keep &= self.directory['max'][:, i] >= low
+            if high is not None:
+                keep &= self.directory['min'][:, i] <= high
+        return np.flatnonzero(keep)
+
+    def query(self, t_start=None, t_end=None, where=None):
+        """
+        Samples with t_start <= t_ns < t_end and, for every {column: (low, high)}
+        in `where`, low <= value <= high (None = unbounded)
+
+        e.g. query(t1, t2, where={'left_raw': (501, None)}) = left IR > 500 between t1 and t2
+        """
+        chunks = self.candidate_chunks(t_start, t_end, where)
+        results = []
+        for i in chunks:
+            columns = self.read_chunk(i)
+            mask = np.ones(len(columns['t_ns']), dtype=bool)
+            if t_start is not None:
+                mask &= columns['t_ns'] >= t_start
+            if t_end is not None:
+                mask &= columns['t_ns'] < t_end
+            for name, (low, high) in (where or {}).items():
+                if low is not None:
+                    mask &= columns[name] >= low
+                if high is not None:
+                    mask &= columns[name] <= high
+            results.append({name: values[mask] for name, values in columns.items()})
+        self.last_query = {'chunks_read': len(chunks), 'chunks_skipped': len(self.directory) - len(chunks)}
+        if not results:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+        return {name: np.concatenate([r[name] for r in results]) for name in COLUMNS}
+
+    def read_all(self):
+        return self.query()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def archive_text_log(text_path, archive_path, codec='zlib', block_bytes=1 << 20):
+    """Convert a raw "L:..(W) R:..(B)" text dump (all samples share the file's mtime)"""
+    t_ns = int(os.path.getmtime(text_path) * 1e9)
+    with open(text_path, 'rb') as f, TelemetryArchiveWriter(archive_path, codec=codec) as writer:
+        tail = b''
+        for block in iter(lambda: f.read(block_bytes), b''):
+            block = tail + block
+            cut = block.rfind(b'\n') + 1
+            writer.append(parse_lines(block[:cut], t_ns))
+            tail = block[cut:]
+        writer.append(parse_lines(tail, t_ns))
+    return archive_path
+
+
+def archive_session(session_path, archive_path, codec='zlib'):
+    """Convert the samples of a session log (.mxlog) into an archive"""
+    from SESSION_LOG import SessionLogReader
+    with TelemetryArchiveWriter(archive_path, codec=codec) as writer:
+        writer.append(SessionLogReader(session_path).samples())
+    return archive_path
+
+
+# ===== RACE-DAY SIZE AND QUERY BENCHMARK =====
+if __name__ == '__main__':
+    """
+    One simulated hour of FIRMWARE_SIM telemetry: raw text vs session log vs
+    archive (zlib / lzma), then "left IR > 500 in a 5 minute window" with chunk
+    skipping vs decompressing everything
+    """
+    import sys
+    import time
+    import tempfile
+    from SESSION_REPLAY import record_simulated_session
+
+    SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 3600
+    directory = tempfile.mkdtemp()
+    session = record_simulated_session(os.path.join(directory, 'race.mxlog'), seconds=SECONDS)
+
+    from SESSION_LOG import SessionLogReader
+    columns = SessionLogReader(session).samples()
+    count = len(columns['t_ns'])
+    text_bytes = sum(len(f"L:{l}({'W' if f & 1 else 'B'}) R:{r}({'W' if f & 2 else 'B'}) Loss:- Out:{o}\r\n")
+                     for l, r, f, o in zip(columns['left_raw'].tolist(), columns['right_raw'].tolist(),
+                                           columns['flags'].tolist(), columns['out'].tolist()))
+    print(f"{count:,} samples ({SECONDS / 60:.0f} simulated minutes)")
+    print(f"raw text dump      {text_bytes / 1e6:8.2f} MB")
+    print(f"session log        {os.path.getsize(session) / 1e6:8.2f} MB")
+
+    for codec in CODECS:
+        path = os.path.join(directory, f"race_{codec}{ARCHIVE_EXTENSION}")
+        start = time.perf_counter()
+        archive_session(session, path, codec)
+        write_s = time.perf_counter() - start
+        print(f"archive ({codec:<4})     {os.path.getsize(path) / 1e6:8.2f} MB "
+              f"({text_bytes / os.path.getsize(path):5.1f}x smaller than text, written in {write_s:.2f} s)")
+
+    with TelemetryArchive(os.path.join(directory, f"race_zlib{ARCHIVE_EXTENSION}")) as archive:
+        t0 = int(columns['t_ns'][0])
+        t1, t2 = t0 + 600 * 10**9, t0 + 900 * 10**9
+        start = time.perf_counter()
+        hits = archive.query(t1, t2, where={'left_raw': (501, None)})
+        query_ms = (time.perf_counter() - start) * 1e3
+        stats = archive.last_query
+        start = time.perf_counter()
+        everything = archive.read_all()
+        mask = (everything['t_ns'] >= t1) & (everything['t_ns'] < t2) & (everything['left_raw'] > 500)
+        full_ms = (time.perf_counter() - start) * 1e3
+        assert int(mask.sum()) == len(hits['t_ns'])
+        print(f"query left>500 in 10-15 min: {len(hits['t_ns'])} samples in {query_ms:.2f} ms "
+              f"({stats['chunks_read']} chunks read, {stats['chunks_skipped']} skipped) "
+              f"vs {full_ms:.2f} ms decompressing all {len(archive.directory)}")
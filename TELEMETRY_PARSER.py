@@ -0,0 +1,330 @@
+import re
+import time
+import struct
+from itertools import chain
+from collections import namedtuple
+import numpy as np
+
+
+# ===== TELEMETRY SAMPLE =====
+# One parsed Arduino debug line, e.g. "L:45(W) R:120(B) Loss:L Out:-1"
+# t_ns is the host receive time (time.perf_counter_ns) for latency measurements
+TelemetrySample = namedtuple('TelemetrySample', [
+    't_ns',         # Host receive timestamp (ns)
+    'left_raw',     # Left IR raw ADC value (A6)
+    'right_raw',    # Right IR raw ADC value (A7)
+    'left_white',   # True if left sensor sees white
+    'right_white',  # True if right sensor sees white
+    'loss',         # Line loss direction: "L", "R" or "-"
+    'out',          # Last output direction: -1, 0 or +1
+])
+
+# ===== COLUMN ENCODING =====
+# Compact per-sample encoding shared by the batch parser and every columnar consumer
+FLAG_LEFT_WHITE = 0x01
+FLAG_RIGHT_WHITE = 0x02
+
+LOSS_NONE = 0
+LOSS_LEFT = 1
+LOSS_RIGHT = 2
+LOSS_CHARS = '-LR'   # Index with a loss code to get the Arduino character
+
+COLUMN_DTYPES = {
+    't_ns': np.int64,
+    'left_raw': np.uint16,
+    'right_raw': np.uint16,
+    'flags': np.uint8,
+    'loss': np.int8,
+    'out': np.int8,
+}
+
+# Single precompiled pattern for the whole debug line (matches FINALArduino.ino STEP 5)
+TELEMETRY_PATTERN = re.compile(rb'L:(\d+)\(([WB])\) R:(\d+)\(([WB])\) Loss:([LR\-]) Out:([-+]?\d+)')
+
+
+# ===== BINARY FRAME FORMAT =====
+# Optional fixed-size frame sent by FINALArduino.ino after a "T1" command (sendTelemetryFrame)
+# Offset  Size  Field
+#   0      1    sync (0xA5, never appears in the ASCII text output)
+#   1      1    sequence number (wraps at 256)
+#   2      4    millis()
+#   6      2    left raw
+#   8      2    right raw
+#  10      1    flags (FLAG_LEFT_WHITE | FLAG_RIGHT_WHITE)
+#  11      1    loss code (LOSS_NONE / LOSS_LEFT / LOSS_RIGHT)
+#  12      1    out (signed)
+#  13      1    checksum = sum of bytes 0-12 (mod 256), same rule as the 4-byte protocol
+FORMAT_TEXT = 'text'
+FORMAT_BINARY = 'binary'
+
+FRAME_SYNC = 0xA5
+FRAME_SYNC_BYTE = bytes([FRAME_SYNC])
+FRAME_STRUCT = struct.Struct('<BBIHHBBbB')
+FRAME_SIZE = FRAME_STRUCT.size
+FRAME_DTYPE = np.dtype([
+    ('sync', 'u1'),
+    ('seq', 'u1'),
+    ('millis', '<u4'),
+    ('left_raw', '<u2'),
+    ('right_raw', '<u2'),
+    ('flags', 'u1'),
+    ('loss', 'u1'),
+    ('out', 'i1'),
+    ('checksum', 'u1'),
+])
+
+
+def parse_line(line, t_ns=None):
+    """
+    Parse one Arduino debug line into a TelemetrySample in a single regex pass
+    Accepts bytes (straight from the port) or str
+    Returns None for anything that is not a sensor line (speed echo, banner, errors)
+    """
+    if isinstance(line, str):
+        line = line.encode('utf-8', errors='ignore')
+    match = TELEMETRY_PATTERN.search(line)
+    if match is None:
+        return None
+    left_raw, left_flag, right_raw, right_flag, loss, out = match.groups()
+    return TelemetrySample(
+        t_ns if t_ns is not None else time.perf_counter_ns(),
+        int(left_raw),
+        int(right_raw),
+        left_flag == b'W',
+        right_flag == b'W',
+        loss.decode(),
+        int(out),
+    )
+
+
+def parse_lines(chunk, t_ns=None):
+    """
+    Batch parser: turn a whole chunk of debug output into NumPy columns
+
+    One findall() pass over the chunk, then vectorised conversion.
+    Non-sensor lines inside the chunk are skipped.
+    Returns a dict keyed like COLUMN_DTYPES; every sample in the chunk gets t_ns.
+    """
+    if isinstance(chunk, str):
+        chunk = chunk.encode('utf-8', errors='ignore')
+    rows = TELEMETRY_PATTERN.findall(chunk)
+    count = len(rows)
+    if count == 0:
+        return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+
+    fields = np.array(list(chain.from_iterable(rows)), dtype='S5').reshape(count, 6)
+    flags = ((fields[:, 1] == b'W') * FLAG_LEFT_WHITE) | ((fields[:, 3] == b'W') * FLAG_RIGHT_WHITE)
+    loss = (fields[:, 4] == b'L') * LOSS_LEFT + (fields[:, 4] == b'R') * LOSS_RIGHT
+
+    return {
+        't_ns': np.full(count, t_ns if t_ns is not None else time.perf_counter_ns(), dtype=np.int64),
+        'left_raw': fields[:, 0].astype(np.uint16),
+        'right_raw': fields[:, 2].astype(np.uint16),
+        'flags': flags.astype(np.uint8),
+        'loss': loss.astype(np.int8),
+        'out': fields[:, 5].astype(np.int8),
+    }
+
+
+def encode_frame(seq, millis, left_raw, right_raw, flags, loss, out):
+    """Build one binary frame exactly as sendTelemetryFrame() does (used by simulators and tests)"""
+    body = FRAME_STRUCT.pack(FRAME_SYNC, seq & 0xFF, millis & 0xFFFFFFFF, left_raw, right_raw, flags, loss, out, 0)
+    return body[:-1] + bytes([sum(body[:-1]) & 0xFF])
+
+
+def decode_frame(frame, t_ns=None):
+    """
+    Decode a single FRAME_SIZE-byte frame with struct
+    Returns None if the sync byte or checksum is wrong
+    """
+    sync, seq, millis, left_raw, right_raw, flags, loss, out, checksum = FRAME_STRUCT.unpack_from(frame)
+    if sync != FRAME_SYNC or sum(frame[:FRAME_SIZE - 1]) & 0xFF != checksum:
+        return None
+    return TelemetrySample(
+        t_ns if t_ns is not None else time.perf_counter_ns(),
+        left_raw,
+        right_raw,
+        bool(flags & FLAG_LEFT_WHITE),
+        bool(flags & FLAG_RIGHT_WHITE),
+        LOSS_CHARS[loss] if loss < len(LOSS_CHARS) else '-',
+        out,
+    )
+
+
+def decode_frames(buf, offset=0, end=None):
+    """
+    Bulk-decode back-to-back frames in buf[offset:end] with numpy.frombuffer
+
+    Stops at the first frame with a bad sync byte or checksum.
+    Returns (frames, consumed) where frames is a FRAME_DTYPE array (a view into buf)
+    """
+    end = len(buf) if end is None else end
+    count = (end - offset) // FRAME_SIZE
+    if count <= 0:
+        return np.empty(0, dtype=FRAME_DTYPE), 0
+
+    raw = np.frombuffer(buf, dtype=np.uint8, count=count * FRAME_SIZE, offset=offset).reshape(count, FRAME_SIZE)
+    valid = (raw[:, 0] == FRAME_SYNC) & ((raw[:, :-1].sum(axis=1, dtype=np.uint32) & 0xFF) == raw[:, -1])
+    good = count if valid.all() else int(np.argmin(valid))
+
+    frames = np.frombuffer(buf, dtype=FRAME_DTYPE, count=good, offset=offset)
+    return frames, good * FRAME_SIZE
+
+
+def decode_stream(buf, start=0, end=None):
+    """
+    Split buf[start:end] into binary frames and text lines
+
+    The firmware keeps printing text (speed echo, errors, banner) in binary mode,
+    and text sensor lines are still valid before the T1 command lands.
+    Works in place on a bytes/bytearray buffer (e.g. ByteRingBuffer.buffer).
+    Returns (frames, lines, pos):
+      frames - FRAME_DTYPE array of every valid frame (copied out of buf)
+      lines  - complete text lines as memoryview slices of buf, without line ending
+               (only valid until buf is modified)
+      pos    - index of the first unconsumed byte; buf[pos:end] is a partial record
+    """
+    end = len(buf) if end is None else end
+    view = memoryview(buf)
+    frame_runs = []
+    lines = []
+    pos = start
+    next_sync = -2   # Cached position of the next sync byte (-1 = none left, -2 = not searched yet)
+
+    while pos < end:
+        if buf[pos] == FRAME_SYNC:
+            if end - pos < FRAME_SIZE:
+                break  # Partial frame - wait for more bytes
+            frames, consumed = decode_frames(buf, pos, end)
+            if consumed:
+                frame_runs.append(frames)
+                pos += consumed
+            else:
+                pos += 1  # Corrupt frame - resync on the next byte
+            continue
+
+        if next_sync != -1 and next_sync < pos:
+            next_sync = buf.find(FRAME_SYNC_BYTE, pos, end)
+        newline = buf.find(b'\n', pos, end)
+        if newline != -1 and (next_sync == -1 or newline < next_sync):
+            line_end = newline - 1 if newline > pos and buf[newline - 1] == 0x0D else newline
+            if line_end > pos:
+                lines.append(view[pos:line_end])
+            pos = newline + 1
+        elif next_sync != -1:
+            pos = next_sync  # Garbage before a frame (e.g. reset noise)
+        else:
+            break  # Partial text line
+
+    if not frame_runs:
+        frames = np.empty(0, dtype=FRAME_DTYPE)
+    elif len(frame_runs) == 1:
+        frames = frame_runs[0].copy()
+    else:
+        frames = np.concatenate(frame_runs)
+    return frames, lines, pos
+
+
+def frames_to_samples(frames, t_ns=None):
+    """Convert a FRAME_DTYPE array into TelemetrySample tuples for the Qt fan-out"""
+    t_ns = t_ns if t_ns is not None else time.perf_counter_ns()
+    return [
+        TelemetrySample(t_ns, left_raw, right_raw, bool(flags & FLAG_LEFT_WHITE), bool(flags & FLAG_RIGHT_WHITE),
+                        LOSS_CHARS[loss] if loss < len(LOSS_CHARS) else '-', out)
+        for left_raw, right_raw, flags, loss, out
+        in zip(frames['left_raw'].tolist(), frames['right_raw'].tolist(), frames['flags'].tolist(),
+               frames['loss'].tolist(), frames['out'].tolist())
+    ]
+
+
+def frames_to_columns(frames, t_ns=None):
+    """Convert a FRAME_DTYPE array into the same columns parse_lines() returns"""
+    return {
+        't_ns': np.full(len(frames), t_ns if t_ns is not None else time.perf_counter_ns(), dtype=np.int64),
+        'left_raw': frames['left_raw'].astype(np.uint16),
+        'right_raw': frames['right_raw'].astype(np.uint16),
+        'flags': frames['flags'].astype(np.uint8),
+        'loss': frames['loss'].astype(np.int8),
+        'out': frames['out'].astype(np.int8),
+    }
+
+
+def sample_to_row(sample):
+    """Encode a TelemetrySample with the compact column encoding (flags bitmask, loss code)"""
+    flags = (FLAG_LEFT_WHITE if sample.left_white else 0) | (FLAG_RIGHT_WHITE if sample.right_white else 0)
+    return sample.t_ns, sample.left_raw, sample.right_raw, flags, LOSS_CHARS.index(sample.loss), sample.out
+
+
+# ===== MICRO-BENCHMARK =====
+if __name__ == '__main__':
+    """
+    Lines/sec for the old per-line parsing (IRSensorWidget.poll_sensors) vs
+    parse_line() and the parse_lines() batch entry point
+    """
+    import random
+
+    def legacy_parse(line):
+        # Copy of the parsing that used to run inside IRSensorWidget.poll_sensors
+        result = {}
+        if line and "L:" in line and "R:" in line:
+            left_match = re.search(r'L:(\d+)', line)
+            if left_match:
+                result['left'] = int(left_match.group(1))
+            if "(W)" in line[:line.index("R:")]:
+                result['left_white'] = True
+            elif "(B)" in line[:line.index("R:")]:
+                result['left_white'] = False
+            right_match = re.search(r'R:(\d+)', line)
+            if right_match:
+                result['right'] = int(right_match.group(1))
+            if "(W)" in line[line.index("R:"):]:
+                result['right_white'] = True
+            elif "(B)" in line[line.index("R:"):]:
+                result['right_white'] = False
+            loss_match = re.search(r'Loss:([LR\-])', line)
+            if loss_match:
+                result['loss'] = loss_match.group(1)
+            output_match = re.search(r'Out:([-+]?\d+)', line)
+            if output_match:
+                result['out'] = int(output_match.group(1))
+        return result
+
+    random.seed(1)
+    count = 200000
+    raw_lines = []
+    for _ in range(count):
+        left, right = random.randint(0, 1023), random.randint(0, 1023)
+        raw_lines.append(
+            f"L:{left}({'W' if left <= 30 else 'B'}) R:{right}({'W' if right <= 30 else 'B'}) "
+            f"Loss:{random.choice('LR-')} Out:{random.choice((-1, 0, 1))}\r\n".encode()
+        )
+    chunk = b''.join(raw_lines)
+
+    def bench(label, func):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<42} {count / elapsed:>12,.0f} lines/sec")
+
+    bench("legacy (decode + 4x re.search + index)", lambda: [legacy_parse(l.decode('utf-8', errors='ignore').strip()) for l in raw_lines])
+    bench("parse_line (1 compiled pattern)", lambda: [parse_line(l) for l in raw_lines])
+    bench("parse_lines (batch -> NumPy columns)", lambda: parse_lines(chunk))
+
+    columns = parse_lines(chunk)
+    assert len(columns['left_raw']) == count
+    assert parse_line(raw_lines[0]).left_raw == columns['left_raw'][0]
+
+    # Same samples as binary frames
+    frame_chunk = b''.join(
+        encode_frame(i, i * 15, int(l), int(r), int(f), int(lc), int(o))
+        for i, (l, r, f, lc, o) in enumerate(zip(columns['left_raw'], columns['right_raw'], columns['flags'],
+                                                 columns['loss'], columns['out']))
+    )
+    frame_list = [frame_chunk[i:i + FRAME_SIZE] for i in range(0, len(frame_chunk), FRAME_SIZE)]
+    bench("decode_frame (struct, per frame)", lambda: [decode_frame(f) for f in frame_list])
+    bench("decode_stream (numpy.frombuffer, bulk)", lambda: frames_to_columns(decode_stream(frame_chunk)[0]))
+
+    frames, lines, consumed = decode_stream(frame_chunk)
+    assert len(frames) == count and consumed == len(frame_chunk)
+    assert (frames['left_raw'] == columns['left_raw']).all()
+    print(f"text bytes/sample: {len(chunk) / count:.1f}   binary bytes/sample: {FRAME_SIZE}")
@@ -0,0 +1,157 @@
+import numpy as np
+from TELEMETRY_PARSER import COLUMN_DTYPES, sample_to_row
+
+
+class TelemetryStore:
+    """
+    Preallocated columnar ring buffer for the whole telemetry history
+
+    - One typed NumPy array per column (t_ns, left_raw, right_raw, flags, loss, out),
+      same encoding as parse_lines() / frames_to_columns()
+    - Fixed memory: capacity samples, the oldest are overwritten once full
+    - append() is O(1) (one slot per column), extend() takes a whole parsed chunk
+    - window(n) returns zero-copy, read-only views of the newest n samples
+
+    Every column is stored twice back to back (mirrored), so the newest n samples are
+    always one contiguous slice - no copy and no wrap-around handling in the readers.
+    Costs 2x the memory (1M samples = 30 MB) and a second write per sample.
+
+    The store is filled on the GUI thread (sample_received slot); readers take a
+    window when they paint. `total` only ever grows, so a reader can compare it with
+    the value it saw last time to know whether anything new arrived.
+    """
+
+    DEFAULT_CAPACITY = 1_000_000   # ~4 hours at 67Hz
+    COLUMNS = tuple(COLUMN_DTYPES)
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.columns = {name: np.zeros(2 * capacity, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+        self._arrays = tuple(self.columns[name] for name in self.COLUMNS)
+        self.head = 0    # Next slot to write (0..capacity-1)
+        self.count = 0   # Valid samples (<= capacity)
+        self.total = 0   # Samples appended since creation / clear()
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in self._arrays)
+
+    # ===== WRITES =====
+    def append(self, sample):
+        """Slot for sample_received: store one TelemetrySample"""
+        self.append_row(*sample_to_row(sample))
+
+    def append_row(self, t_ns, left_raw, right_raw, flags, loss, out):
+        """Store one sample already in column encoding"""
+        head = self.head
+        mirror = head + self.capacity
+        for array, value in zip(self._arrays, (t_ns, left_raw, right_raw, flags, loss, out)):
+            array[head] = value
+            array[mirror] = value
+        self.head = head + 1 if head + 1 < self.capacity else 0
+        self.count = min(self.count + 1, self.capacity)
+        self.total += 1
+
+    def extend(self, columns):
+        """Store a whole chunk (dict of equal-length columns, e.g. from parse_lines())"""
+        size = len(columns['t_ns'])
+        if size == 0:
+            return
+        skip = max(0, size - self.capacity)   # Only the newest `capacity` samples can survive
+        capacity = self.capacity
+        head = self.head
+        for name, array in self.columns.items():
+            values = columns[name][skip:]
+            first = min(len(values), capacity - head)
+            array[head:head + first] = values[:first]
+            array[head + capacity:head + capacity + first] = values[:first]
+            if first < len(values):
+                rest = len(values) - first
+                array[:rest] = values[first:]
+                array[capacity:capacity + rest] = values[first:]
+        self.head = (head + size - skip) % capacity
+        self.count = min(self.count + size - skip, capacity)
+        self.total += size
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        self.total = 0
+
+    # ===== READS =====
+    def window(self, n=None, names=COLUMNS):
+        """
+        Newest n samples (all if None), oldest first, as read-only views keyed by column name
+        The views alias the store: copy them if they must outlive the next `capacity` appends
+        """
+        n = self.count if n is None else max(0, min(n, self.count))
+        end = self.head + self.capacity
+        views = {}
+        for name in names:
+            view = self.columns[name][end - n:end]
+            view.flags.writeable = False
+            views[name] = view
+        return views
+
+    def column(self, name, n=None):
+        """Newest n values of one column (read-only view)"""
+        return self.window(n, (name,))[name]
+
+    def since(self, t_ns, names=COLUMNS):
+        """Every stored sample received at or after t_ns (host time is monotonic)"""
+        times = self.column('t_ns')
+        return self.window(len(times) - int(np.searchsorted(times, t_ns, side='left')), names)
+
+
+# ===== MICRO-BENCHMARK =====
+if __name__ == '__main__':
+    """
+    Append rate (per sample and per parsed chunk), window cost and memory,
+    compared with the old pair of 50-element deques in IRSensorWidget
+    """
+    import time
+    from collections import deque
+    from TELEMETRY_PARSER import TelemetrySample, parse_lines
+
+    SAMPLES = 200_000
+
+    samples = [TelemetrySample(i, i % 1024, (i * 7) % 1024, i % 2 == 0, i % 3 == 0, '-LR'[i % 3], i % 3 - 1)
+               for i in range(SAMPLES)]
+
+    left_history = deque([0] * 50, maxlen=50)
+    right_history = deque([0] * 50, maxlen=50)
+    start = time.perf_counter()
+    for sample in samples:
+        left_history.append(sample.left_raw)
+        right_history.append(sample.right_raw)
+    deque_s = time.perf_counter() - start
+
+    store = TelemetryStore()
+    start = time.perf_counter()
+    for sample in samples:
+        store.append(sample)
+    append_s = time.perf_counter() - start
+
+    chunk = b''.join(b"L:%d(W) R:%d(B) Loss:- Out:0\r\n" % (i % 1024, i % 512) for i in range(64))
+    columns = parse_lines(chunk)
+    start = time.perf_counter()
+    for _ in range(SAMPLES // 64):
+        store.extend(columns)
+    extend_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100_000):
+        view = store.window(100_000)
+    window_us = (time.perf_counter() - start) * 10
+
+    print(f"deque x2 (2 columns, 50 deep)  {SAMPLES / deque_s:>12,.0f} samples/s")
+    print(f"store.append (6 columns)       {SAMPLES / append_s:>12,.0f} samples/s")
+    print(f"store.extend (64-line chunks)  {SAMPLES / extend_s:>12,.0f} samples/s")
+    print(f"store.window(100k)             {window_us:>12.2f} us (shares memory: "
+          f"{np.shares_memory(view['left_raw'], store.columns['left_raw'])})")
+    print(f"capacity {store.capacity:,} samples, {store.nbytes / 1e6:.1f} MB, total {store.total:,}")
@@ -1,472 +1,770 @@
-import sys
-import random
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout
-from PyQt5.QtCore import Qt, QTimer, QPoint
-from PyQt5.QtGui import QPainter, QColor, QFont
-
-sys.path.append(r"C:\Users\Administrator\Documents\MXEN PROJECT\SerialIO_Arduino_Driver_4BytePackage")
-from MOTOR_METER import MainWindow as MotorGauge
-from DAC_PIN_VISUALISER import DualDACWidget
-from IR_GRAPH import IRSensorWidget
-from STOPWATCH import StopwatchControlWidget
-from MODE import OperationProfilesWidget, ModeDisplayWidget
-from ASSISTANT import AITerminalWidget  # NEW IMPORT
-
-# ============================================================
-# RESOLUTION CONFIGURATION
-# ============================================================
-# Adjust these values based on your screen resolution
-# Current setup: 1366x768 (your laptop)
-# 
-# To change for a different screen:
-# 1. Check the new resolution (e.g., 1920x1080, 2560x1440)
-# 2. Update SCREEN_WIDTH and SCREEN_HEIGHT below
-# 3. Optionally adjust SCALE_FACTOR for widget sizes
-# ============================================================
-
-SCREEN_WIDTH = 1366   # Change this to match target screen width
-SCREEN_HEIGHT = 768   # Change this to match target screen height
-
-# Scale factor: Adjust if widgets appear too large/small on different screens
-# 1.0 = default size, 0.8 = 80% size, 1.2 = 120% size
-SCALE_FACTOR = 1.0
-
-# Widget sizes (scaled based on SCALE_FACTOR)
-MOTOR_GAUGE_WIDTH = int(350 * SCALE_FACTOR)
-MOTOR_GAUGE_HEIGHT = int(350 * SCALE_FACTOR)
-
-DAC_VISUALIZER_WIDTH = int(350 * SCALE_FACTOR)
-DAC_VISUALIZER_HEIGHT = int(200 * SCALE_FACTOR)
-
-# NEW: Operation Profiles Widget (under DAC)
-PROFILES_WIDGET_WIDTH = int(350 * SCALE_FACTOR)
-PROFILES_WIDGET_HEIGHT = int(150 * SCALE_FACTOR)
-
-# NEW: Mode Display Widget (in middle column)
-MODE_DISPLAY_WIDTH = 610
-MODE_DISPLAY_HEIGHT = int(200 * SCALE_FACTOR)
-
-IR_SENSOR_WIDTH = int(350 * SCALE_FACTOR)
-IR_SENSOR_HEIGHT = int(280 * SCALE_FACTOR)
-
-# Stopwatch widget size
-STOPWATCH_WIDTH = int(350 * SCALE_FACTOR)
-STOPWATCH_HEIGHT = int(400 * SCALE_FACTOR)
-
-# AI Terminal Widget size (replaces PCB placeholder)
-AI_TERMINAL_WIDTH = 610
-AI_TERMINAL_HEIGHT = int(500 * SCALE_FACTOR)
-
-# Spacing between widgets
-WIDGET_SPACING = int(5 * SCALE_FACTOR)
-
-# Position offsets from edges (adjust for different layouts)
-LEFT_MARGIN = int(10 * SCALE_FACTOR)
-TOP_MARGIN = int(10 * SCALE_FACTOR)
-RIGHT_MARGIN = int(10 * SCALE_FACTOR)
-
-# ============================================================
-
-
-class MatrixBackground(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.columns = []
-        self.column_width = 4
-        self.font_size = 10
-        self.animation_speed = 30
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_matrix)
-        self.timer.start(self.animation_speed)
-        
-    def showEvent(self, event):
-        super().showEvent(event)
-        if not self.columns:
-            self.init_columns()
-    
-    def init_columns(self):
-        if self.width() == 0 or self.height() == 0:
-            return
-        self.columns.clear()
-        num_columns = max(1, self.width() // self.column_width)
-        for i in range(num_columns):
-            speed = random.uniform(3.0, 7.0)
-            length = random.randint(12, 25)
-            self.columns.append({
-                'x': i * self.column_width,
-                'y': random.randint(-self.height(), 0),
-                'speed': speed,
-                'length': length,
-                'chars': [str(random.randint(0, 9)) for _ in range(30)]
-            })
-    
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self.init_columns()
-    
-    def update_matrix(self):
-        if not self.columns:
-            self.init_columns()
-        for col in self.columns:
-            col['y'] += col['speed']
-            if col['y'] > self.height() + col['length'] * 20:
-                col['y'] = random.randint(-300, -50)
-                col['speed'] = random.uniform(3.0, 7.0)
-                col['length'] = random.randint(12, 25)
-            if random.random() < 0.05:
-                idx = random.randint(0, len(col['chars']) - 1)
-                col['chars'][idx] = str(random.randint(0, 9))
-        self.update()
-    
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        font = QFont("Consolas", self.font_size, QFont.Bold)
-        painter.setFont(font)
-        for col in self.columns:
-            x = col['x']
-            y = col['y']
-            for i in range(col['length']):
-                char_y = y + i * 18
-                if -20 <= char_y <= self.height() + 20:
-                    fade_factor = max(0, 1.0 - (i / col['length']))
-                    if i < 2:
-                        r, g, b, alpha = 255, int(50 * fade_factor), 0, int(255 * fade_factor)
-                    elif i < 5:
-                        r, g, b, alpha = int(255 * fade_factor), int(40 * fade_factor), 0, int(220 * fade_factor)
-                    else:
-                        r, g, b, alpha = int(200 * fade_factor), int(30 * fade_factor), 0, int(180 * fade_factor)
-                    painter.setPen(QColor(r, g, b, alpha))
-                    char_idx = i % len(col['chars'])
-                    painter.drawText(int(x), int(char_y), col['chars'][char_idx])
-        painter.end()
-
-
-class MechatronicsConsole(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Mechatronics Lab Control Console")
-        
-        # ============================================================
-        # WINDOW SETUP - RESOLUTION AWARE
-        # ============================================================
-        # Set window to match screen resolution
-        self.setGeometry(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
-        
-        # Maximize window on startup (fixes the "slightly offset" issue)
-        self.showMaximized()
-        
-        # Store references to child windows for cleanup
-        self.child_windows = []
-        
-        self.setup_ui()
-        self.apply_styles()
-        
-    def setup_ui(self):
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        # Matrix background
-        self.matrix_bg = MatrixBackground(central_widget)
-        self.matrix_bg.setGeometry(0, 0, self.width(), self.height())
-        self.matrix_bg.lower()
-        
-        self.main_layout = QVBoxLayout(central_widget)
-        self.main_layout.setContentsMargins(LEFT_MARGIN, TOP_MARGIN, LEFT_MARGIN, 10)
-        self.main_layout.setSpacing(10)
-        
-        # ============================================================
-        # WIDGET LAYOUT STRUCTURE
-        # Layout: [Motor+DAC+Profiles] [Mode Display + AI Terminal] [IR Sensor + Stopwatch]
-        # ============================================================
-        
-        widgets_container = QHBoxLayout()
-        widgets_container.setSpacing(WIDGET_SPACING)
-        widgets_container.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        
-        # ===== LEFT COLUMN: Motor Gauge + DAC Visualizer + Profiles =====
-        left_column = QVBoxLayout()
-        left_column.setSpacing(WIDGET_SPACING)
-        left_column.setAlignment(Qt.AlignTop)
-        
-        # Motor Gauge
-        self.motor_gauge = MotorGauge()
-        self.motor_gauge.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.motor_gauge.setAttribute(Qt.WA_TranslucentBackground)
-        self.motor_gauge.setFixedSize(MOTOR_GAUGE_WIDTH, MOTOR_GAUGE_HEIGHT)
-        self.gauge_placeholder = QWidget()
-        self.gauge_placeholder.setFixedSize(MOTOR_GAUGE_WIDTH, MOTOR_GAUGE_HEIGHT)
-        left_column.addWidget(self.gauge_placeholder, alignment=Qt.AlignTop)
-        
-        # DAC Visualizer (below motor gauge)
-        self.dac_visualizer = DualDACWidget()
-        self.dac_visualizer.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.dac_visualizer.setAttribute(Qt.WA_TranslucentBackground)
-        self.dac_visualizer.setFixedSize(DAC_VISUALIZER_WIDTH, DAC_VISUALIZER_HEIGHT)
-        self.dac_placeholder = QWidget()
-        self.dac_placeholder.setFixedSize(DAC_VISUALIZER_WIDTH, DAC_VISUALIZER_HEIGHT)
-        left_column.addWidget(self.dac_placeholder, alignment=Qt.AlignTop)
-        
-        # Operation Profiles Widget (below DAC)
-        self.profiles_widget = OperationProfilesWidget(serial_manager=None, motor_gauge=None)
-        self.profiles_widget.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.profiles_widget.setAttribute(Qt.WA_TranslucentBackground)
-        self.profiles_widget.setFixedSize(PROFILES_WIDGET_WIDTH, PROFILES_WIDGET_HEIGHT)
-        self.profiles_placeholder = QWidget()
-        self.profiles_placeholder.setFixedSize(PROFILES_WIDGET_WIDTH, PROFILES_WIDGET_HEIGHT)
-        left_column.addWidget(self.profiles_placeholder, alignment=Qt.AlignTop)
-        
-        widgets_container.addLayout(left_column)
-        
-        # ===== MIDDLE COLUMN: Mode Display + AI Terminal =====
-        middle_column = QVBoxLayout()
-        middle_column.setSpacing(WIDGET_SPACING)
-        middle_column.setAlignment(Qt.AlignTop)
-        
-        # Mode Display Widget (top)
-        self.mode_display = ModeDisplayWidget()
-        self.mode_display.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.mode_display.setAttribute(Qt.WA_TranslucentBackground)
-        self.mode_display.setFixedSize(MODE_DISPLAY_WIDTH, MODE_DISPLAY_HEIGHT)
-        self.mode_display_placeholder = QWidget()
-        self.mode_display_placeholder.setFixedSize(MODE_DISPLAY_WIDTH, MODE_DISPLAY_HEIGHT)
-        middle_column.addWidget(self.mode_display_placeholder, alignment=Qt.AlignTop)
-        
-        # ===== AI TERMINAL WIDGET (NEW - replaces PCB placeholder) =====
-        self.ai_terminal = AITerminalWidget()
-        self.ai_terminal.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.ai_terminal.setAttribute(Qt.WA_TranslucentBackground)
-        self.ai_terminal.setFixedSize(AI_TERMINAL_WIDTH, AI_TERMINAL_HEIGHT)
-        self.ai_terminal_placeholder = QWidget()
-        self.ai_terminal_placeholder.setFixedSize(AI_TERMINAL_WIDTH, AI_TERMINAL_HEIGHT)
-        middle_column.addWidget(self.ai_terminal_placeholder, alignment=Qt.AlignTop)
-        
-        widgets_container.addLayout(middle_column)
-        
-        # ===== RIGHT COLUMN: IR Sensor Widget + Stopwatch =====
-        right_column = QVBoxLayout()
-        right_column.setSpacing(WIDGET_SPACING)
-        right_column.setAlignment(Qt.AlignTop)
-        
-        # IR Sensor Widget (top-right position)
-        self.ir_sensor = IRSensorWidget(serial_manager=None)
-        self.ir_sensor.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.ir_sensor.setAttribute(Qt.WA_TranslucentBackground)
-        self.ir_sensor.setFixedSize(IR_SENSOR_WIDTH, IR_SENSOR_HEIGHT)
-        self.ir_placeholder = QWidget()
-        self.ir_placeholder.setFixedSize(IR_SENSOR_WIDTH, IR_SENSOR_HEIGHT)
-        right_column.addWidget(self.ir_placeholder, alignment=Qt.AlignTop)
-        
-        # Stopwatch Widget (below IR sensor)
-        self.stopwatch = StopwatchControlWidget(serial_manager=None, motor_gauge=None)
-        self.stopwatch.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.stopwatch.setAttribute(Qt.WA_TranslucentBackground)
-        self.stopwatch.setFixedSize(STOPWATCH_WIDTH, STOPWATCH_HEIGHT)
-        self.stopwatch_placeholder = QWidget()
-        self.stopwatch_placeholder.setFixedSize(STOPWATCH_WIDTH, STOPWATCH_HEIGHT)
-        right_column.addWidget(self.stopwatch_placeholder, alignment=Qt.AlignTop)
-        
-        widgets_container.addLayout(right_column)
-        widgets_container.addStretch()  # Push all widgets to left/top
-        
-        self.main_layout.addLayout(widgets_container)
-        self.main_layout.addStretch()  # Push everything to top
-        
-        # ============================================================
-        # SERIAL MANAGER SHARING & CONNECTIONS
-        # ============================================================
-        # Share the motor gauge's serial manager with all widgets
-        self.ir_sensor.set_serial_manager(self.motor_gauge.serial_manager)
-        self.stopwatch.set_serial_manager(self.motor_gauge.serial_manager)
-        self.stopwatch.set_motor_gauge(self.motor_gauge)
-        
-        # Connect profiles widget to serial manager and motor gauge
-        self.profiles_widget.set_serial_manager(self.motor_gauge.serial_manager)
-        self.profiles_widget.set_motor_gauge(self.motor_gauge)
-        
-        # Connect profiles widget signal to mode display
-        self.profiles_widget.mode_changed.connect(self.mode_display.update_mode_display)
-        
-        # ============================================================
-        # DATA FLOW CONNECTIONS
-        # ============================================================
-        # One-way sync: Motor Gauge -> DAC Visualizer
-        self.motor_gauge.slider_a6.valueChanged.connect(lambda v: self.update_dac_from_gauge(v, 'a6'))
-        self.motor_gauge.slider_a7.valueChanged.connect(lambda v: self.update_dac_from_gauge(v, 'a7'))
-        
-        # ============================================================
-        # SERIAL DEBUG MONITOR TIMER
-        # ============================================================
-        # Monitor Arduino's Serial.print debug output
-        self.serial_monitor_timer = QTimer(self)
-        self.serial_monitor_timer.timeout.connect(self.read_arduino_debug)
-        self.serial_monitor_timer.start(100)  # Check every 100ms
-        
-        # ============================================================
-        # WINDOW POSITIONING TIMER
-        # ============================================================
-        # Timer to keep frameless widgets positioned correctly over placeholders
-        self.move_timer = QTimer(self)
-        self.move_timer.timeout.connect(self.update_widget_positions)
-        self.move_timer.start(50)  # Update every 50ms
-        
-        # Store child window references for cleanup
-        self.child_windows = [
-            self.motor_gauge, 
-            self.dac_visualizer, 
-            self.profiles_widget, 
-            self.mode_display,
-            self.ai_terminal,  # NEW: AI Terminal added
-            self.ir_sensor, 
-            self.stopwatch
-        ]
-        
-        # Show all child windows
-        self.motor_gauge.show()
-        self.dac_visualizer.show()
-        self.profiles_widget.show()
-        self.mode_display.show()
-        self.ai_terminal.show()  # NEW: Show AI Terminal
-        self.ir_sensor.show()
-        self.stopwatch.show()
-
-    def update_dac_from_gauge(self, percentage, motor):
-        """
-        Update DAC visualizer based on motor gauge percentage
-        Uses exact same formula as Arduino (2.55 * percentage)
-        """
-        byte_value = int(round(2.55 * percentage))
-        if byte_value > 255:
-            byte_value = 255
-        if byte_value < 0:
-            byte_value = 0
-        
-        self.dac_visualizer.update_pins(byte_value, motor)
-
-    def read_arduino_debug(self):
-        """
-        Read Arduino's Serial.print() debug output
-        Parses line follower status messages
-        """
-        if not hasattr(self.motor_gauge, 'serial_manager'):
-            return
-        
-        serial_mgr = self.motor_gauge.serial_manager
-        if not serial_mgr.is_connected or not serial_mgr.serial_port:
-            return
-        
-        try:
-            port = serial_mgr.serial_port
-            
-            if port.in_waiting > 0:
-                line = port.readline().decode('utf-8', errors='ignore').strip()
-                
-                if line:
-                    print(f"[Arduino Debug] {line}")
-                    
-                    if "L:" in line and "R:" in line:
-                        try:
-                            left_start = line.index("L:") + 2
-                            left_end = line.index("(", left_start)
-                            left_val = int(line[left_start:left_end])
-                            
-                            right_start = line.index("R:") + 2
-                            right_end = line.index("(", right_start)
-                            right_val = int(line[right_start:right_end])
-                            
-                        except (ValueError, IndexError):
-                            pass
-                            
-        except Exception as e:
-            pass
-
-    def update_widget_positions(self):
-        """
-        Update positions of all frameless child windows to match their placeholders
-        """
-        if not hasattr(self, 'gauge_placeholder'):
-            return
-        
-        # Motor Gauge position
-        gauge_pos = self.gauge_placeholder.mapToGlobal(QPoint(0, 0))
-        self.motor_gauge.move(gauge_pos)
-        
-        # DAC Visualizer position
-        dac_pos = self.dac_placeholder.mapToGlobal(QPoint(0, 0))
-        self.dac_visualizer.move(dac_pos)
-        
-        # Profiles Widget position
-        profiles_pos = self.profiles_placeholder.mapToGlobal(QPoint(0, 0))
-        self.profiles_widget.move(profiles_pos)
-        
-        # Mode Display position
-        mode_display_pos = self.mode_display_placeholder.mapToGlobal(QPoint(0, 0))
-        self.mode_display.move(mode_display_pos)
-        
-        # AI Terminal position (NEW)
-        ai_terminal_pos = self.ai_terminal_placeholder.mapToGlobal(QPoint(0, 0))
-        self.ai_terminal.move(ai_terminal_pos)
-        
-        # IR Sensor position
-        ir_pos = self.ir_placeholder.mapToGlobal(QPoint(0, 0))
-        self.ir_sensor.move(ir_pos)
-        
-        # Stopwatch position
-        stopwatch_pos = self.stopwatch_placeholder.mapToGlobal(QPoint(0, 0))
-        self.stopwatch.move(stopwatch_pos)
-
-    def resizeEvent(self, event):
-        """Handle window resize events"""
-        super().resizeEvent(event)
-        
-        if hasattr(self, 'matrix_bg'):
-            self.matrix_bg.setGeometry(0, 0, self.width(), self.height())
-        
-        self.update_widget_positions()
-
-    def closeEvent(self, event):
-        """
-        Close all child windows when main window closes
-        """
-        print("Closing main window and all child widgets...")
-        
-        for child_window in self.child_windows:
-            if child_window and child_window.isVisible():
-                child_window.close()
-        
-        if hasattr(self, 'move_timer'):
-            self.move_timer.stop()
-        if hasattr(self, 'serial_monitor_timer'):
-            self.serial_monitor_timer.stop()
-        if hasattr(self, 'matrix_bg') and hasattr(self.matrix_bg, 'timer'):
-            self.matrix_bg.timer.stop()
-        
-        if hasattr(self.motor_gauge, 'serial_manager'):
-            if self.motor_gauge.serial_manager.is_connected:
-                self.motor_gauge.serial_manager.disconnect()
-                print("Serial connection closed.")
-        
-        event.accept()
-        print("All windows closed successfully.")
-
-    def apply_styles(self):
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #08080F;
-            }
-            QWidget {
-                color: #FFFFFF;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 11pt;
-                background-color: transparent;
-            }
-        """)
-
-
-if __name__ == "__main__":
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    app = QApplication(sys.argv)
-    window = MechatronicsConsole()
-    window.show()
+import sys
+import numpy as np
+from PyQt5 import sip
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout
+from PyQt5.QtCore import Qt, QTimer, QPoint, QRect
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics, QPixmap, QRegion
+
+sys.path.append(r"C:\Users\Administrator\Documents\MXEN PROJECT\SerialIO_Arduino_Driver_4BytePackage")
+from MOTOR_METER import MainWindow as MotorGauge
+from DAC_PIN_VISUALISER import DualDACWidget
+from IR_GRAPH import IRSensorWidget
+from STOPWATCH import StopwatchControlWidget
+from MODE import OperationProfilesWidget, ModeDisplayWidget, OPERATION_MODES
+from ASSISTANT import AITerminalWidget  # NEW IMPORT
+from SERIAL_READER import SerialReaderThread
+from QT_SERIAL_MANAGER import QtSerialManager
+from ASYNC_SERIAL import AsyncSerialBridge
+from COMMAND_SCHEDULER import SpeedCommandScheduler
+from COMMAND_LATENCY import CommandLatencyWidget
+from TELEMETRY_STORE import TelemetryStore
+from SESSION_LOG import SessionRecorder
+from SESSION_REPLAY import SessionReplay
+from EVENT_DETECTOR import EventDetector
+from RENDER_SCHEDULER import RenderScheduler
+
+# ============================================================
+# RESOLUTION CONFIGURATION
+# ============================================================
+# Adjust these values based on your screen resolution
+# Current setup: 1366x768 (your laptop)
+# 
+# To change for a different screen:
+# 1. Check the new resolution (e.g., 1920x1080, 2560x1440)
+# 2. Update SCREEN_WIDTH and SCREEN_HEIGHT below
+# 3. Optionally adjust SCALE_FACTOR for widget sizes
+# ============================================================
+
+SCREEN_WIDTH = 1366   # Change this to match target screen width
+SCREEN_HEIGHT = 768   # Change this to match target screen height
+
+# Scale factor: Adjust if widgets appear too large/small on different screens
+# 1.0 = default size, 0.8 = 80% size, 1.2 = 120% size
+SCALE_FACTOR = 1.0
+
+# Widget sizes (scaled based on SCALE_FACTOR)
+MOTOR_GAUGE_WIDTH = int(350 * SCALE_FACTOR)
+MOTOR_GAUGE_HEIGHT = int(350 * SCALE_FACTOR)
+
+DAC_VISUALIZER_WIDTH = int(350 * SCALE_FACTOR)
+DAC_VISUALIZER_HEIGHT = int(200 * SCALE_FACTOR)
+
+# NEW: Operation Profiles Widget (under DAC)
+PROFILES_WIDGET_WIDTH = int(350 * SCALE_FACTOR)
+PROFILES_WIDGET_HEIGHT = int(150 * SCALE_FACTOR)
+
+# NEW: Mode Display Widget (in middle column)
+MODE_DISPLAY_WIDTH = 610
+MODE_DISPLAY_HEIGHT = int(200 * SCALE_FACTOR)
+
+IR_SENSOR_WIDTH = int(350 * SCALE_FACTOR)
+IR_SENSOR_HEIGHT = int(280 * SCALE_FACTOR)
+
+# Stopwatch widget size
+STOPWATCH_WIDTH = int(350 * SCALE_FACTOR)
+STOPWATCH_HEIGHT = int(400 * SCALE_FACTOR)
+
+# AI Terminal Widget size (replaces PCB placeholder)
+AI_TERMINAL_WIDTH = 610
+AI_TERMINAL_HEIGHT = int(380 * SCALE_FACTOR)
+
+# Command round-trip histogram (below AI terminal)
+COMMAND_LATENCY_WIDTH = 610
+COMMAND_LATENCY_HEIGHT = int(115 * SCALE_FACTOR)
+
+# Spacing between widgets
+WIDGET_SPACING = int(5 * SCALE_FACTOR)
+
+# Position offsets from edges (adjust for different layouts)
+LEFT_MARGIN = int(10 * SCALE_FACTOR)
+TOP_MARGIN = int(10 * SCALE_FACTOR)
+RIGHT_MARGIN = int(10 * SCALE_FACTOR)
+
+# ============================================================
+# SERIAL CONFIGURATION
+# ============================================================
+# Telemetry format requested from FINALArduino.ino
+# 'text'   = "L:45(W) R:120(B) Loss:L Out:-1" debug lines (default)
+# 'binary' = 14-byte frames, fits 67Hz telemetry inside 9600 baud
+# Can also be switched at runtime: self.telemetry_source.set_telemetry_format('binary')
+TELEMETRY_FORMAT = 'text'
+
+# Serial ingestion backend
+# 'thread'  = MOTOR_METER's pyserial manager + SerialReaderThread (default)
+# 'qt'      = QtSerialManager: QSerialPort.readyRead, no polling, lowest latency
+# 'asyncio' = AsyncSerialBridge: asyncio loop thread with auto-reconnect (Linux/macOS)
+SERIAL_BACKEND = 'thread'
+
+# Link speed requested from the firmware after connecting at 9600 (U<baud> + ping,
+# falls back to 9600 automatically). None = stay at 9600. Every backend negotiates.
+SERIAL_BAUD_RATE = 115200
+
+# Outgoing speed commands: coalesced per motor, at most one write per interval
+SPEED_COMMAND_INTERVAL_MS = 50
+
+# Write the command round-trip samples to <SESSION_LOG_DIR>/command_rtt_<timestamp>.csv
+# on exit (the EXPORT CSV button writes there too)
+EXPORT_COMMAND_RTT_ON_CLOSE = False
+
+# Samples kept in the shared columnar telemetry history (15 bytes x 2 per sample,
+# 1M = 30 MB, ~4 hours at 67Hz). Every widget and analysis reads from this one store.
+TELEMETRY_STORE_CAPACITY = 1_000_000
+
+# Learning mode records every sample, command and mode change to
+# <dir>/session_<timestamp>.mxlog (memory-mapped, 24 bytes per record)
+SESSION_LOG_DIR = 'sessions'
+
+# Replay a recorded session through the widgets (same slots as live telemetry):
+#   python layout.py --replay sessions/session_<timestamp>.mxlog [--speed 10]
+# Speed 1 = real time, 0 = as fast as possible (prints samples/s at the end)
+REPLAY_SPEED = 1.0
+
+# Telemetry slots only mark labels/graphs dirty; they are redrawn at most this
+# many times a second (30 or 60; 0 = redraw on every sample)
+RENDER_FPS = 30
+
+# ============================================================
+
+
+class MatrixBackground(QWidget):
+    """
+    Falling red digit rain behind the panels
+    
+    - Column state (y, speed, trail length, digits) lives in NumPy arrays and is
+      advanced for every column in one vectorized step
+    - Each digit is pre-rendered at FADE_LEVELS brightness steps of the three trail
+      colours into one glyph atlas; a frame is a single drawPixmapFragments call
+    - set_occluders(): rectangles covered by the panels are neither repainted nor
+      drawn into, so only the visible strips of the window are updated each tick
+    """
+    
+    TRAIL_CHARS = 30        # Digits remembered per column
+    CHAR_SPACING = 18       # Pixels between digits in a trail
+    MAX_LENGTH = 25         # Longest trail (digits)
+    FADE_LEVELS = 16        # Brightness steps per trail colour in the atlas
+    TRAIL_BANDS = 3         # Head (first 2 digits), neck (next 3), tail
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.column_width = 4
+        self.font_size = 10
+        self.animation_speed = 30
+        self.glyph_font = QFont("Consolas", self.font_size, QFont.Bold)
+        self.cell_w, self.cell_h, self.baseline = self.glyph_cell()
+        self.rng = np.random.default_rng()
+        self.column_count = 0
+        self.atlas = None
+        self.atlas_key = None
+        self.occluders = []
+        self.hidden = None      # hidden[column, glyph top + pad]: glyph cell entirely under a panel
+        self.visible_region = QRegion()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_matrix)
+        self.timer.start(self.animation_speed)
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.column_count:
+            self.init_columns()
+    
+    def init_columns(self):
+        if self.width() == 0 or self.height() == 0:
+            return
+        n = max(1, self.width() // self.column_width)
+        self.column_count = n
+        self.xs = np.arange(n) * self.column_width
+        self.ys = self.rng.integers(-self.height(), 0, n, endpoint=True).astype(np.float64)
+        self.speeds = self.rng.uniform(3.0, 7.0, n)
+        self.lengths = self.rng.integers(12, self.MAX_LENGTH, n, endpoint=True)
+        self.chars = self.rng.integers(0, 10, (n, self.TRAIL_CHARS), dtype=np.int8)
+        self.update_visibility()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.init_columns()
+    
+    def set_occluders(self, rects):
+        """Panel rectangles in this widget's coordinates (layout.py, on every reposition)"""
+        rects = [QRect(rect) for rect in rects]
+        if rects != self.occluders:
+            self.occluders = rects
+            self.update_visibility()
+    
+    def update_visibility(self):
+        """Rebuild the repaint region and the per-column hidden mask, then repaint all"""
+        region = QRegion(self.rect())
+        for rect in self.occluders:
+            region = region.subtracted(QRegion(rect))
+        self.visible_region = region
+        
+        if self.column_count:
+            pad = self.CHAR_SPACING * self.MAX_LENGTH
+            self.hidden = np.zeros((self.column_count, self.height() + 2 * pad), dtype=bool)
+            cell_lefts = self.xs - 1
+            for rect in self.occluders:
+                # Cells (left, top) that lie entirely inside rect
+                inside = (cell_lefts >= rect.left()) & (cell_lefts + self.cell_w - 1 <= rect.right())
+                first_row = max(0, rect.top() + pad)
+                last_row = min(self.hidden.shape[1] - 1, rect.bottom() - self.cell_h + 1 + pad)
+                if first_row <= last_row:
+                    self.hidden[inside, first_row:last_row + 1] = True
+        self.update()
+    
+    def glyph_cell(self):
+        """(cell width, cell height, baseline) of one atlas cell, 1px margin for antialiasing"""
+        metrics = QFontMetrics(self.glyph_font)
+        return (max(metrics.horizontalAdvance(str(digit)) for digit in range(10)) + 2,
+                metrics.height() + 2, metrics.ascent() + 1)
+    
+    @staticmethod
+    def trail_color(band, fade):
+        """Colour of a trail digit: bright head, then neck and tail fading out"""
+        if band == 0:
+            return QColor(255, int(50 * fade), 0, int(255 * fade))
+        if band == 1:
+            return QColor(int(255 * fade), int(40 * fade), 0, int(220 * fade))
+        return QColor(int(200 * fade), int(30 * fade), 0, int(180 * fade))
+    
+    def glyph_atlas(self):
+        """
+        Digits 0-9 across, one row per (trail colour, fade level) down,
+        rendered once per device pixel ratio
+        """
+        dpr = self.devicePixelRatioF()
+        if self.atlas is not None and self.atlas_key == dpr:
+            return self.atlas
+        cell_w, cell_h = self.cell_w, self.cell_h
+        atlas = QPixmap(round(10 * cell_w * dpr), round(self.TRAIL_BANDS * self.FADE_LEVELS * cell_h * dpr))
+        atlas.setDevicePixelRatio(dpr)
+        atlas.fill(Qt.transparent)
+        painter = QPainter(atlas)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.glyph_font)
+        for band in range(self.TRAIL_BANDS):
+            for level in range(self.FADE_LEVELS):
+                painter.setPen(self.trail_color(band, level / (self.FADE_LEVELS - 1)))
+                top = (band * self.FADE_LEVELS + level) * cell_h
+                for digit in range(10):
+                    painter.drawText(digit * cell_w + 1, top + self.baseline, str(digit))
+        painter.end()
+        self.atlas = atlas
+        self.atlas_key = dpr
+        return atlas
+    
+    def update_matrix(self):
+        if not self.column_count:
+            self.init_columns()
+            if not self.column_count:
+                return
+        n = self.column_count
+        self.ys += self.speeds
+        done = self.ys > self.height() + self.lengths * 20
+        restarted = int(done.sum())
+        if restarted:
+            self.ys[done] = self.rng.integers(-300, -50, restarted, endpoint=True)
+            self.speeds[done] = self.rng.uniform(3.0, 7.0, restarted)
+            self.lengths[done] = self.rng.integers(12, self.MAX_LENGTH, restarted, endpoint=True)
+        flips = np.flatnonzero(self.rng.random(n) < 0.05)
+        self.chars[flips, self.rng.integers(0, self.TRAIL_CHARS, len(flips))] = self.rng.integers(0, 10, len(flips))
+        if self.isVisible() and not self.visible_region.isEmpty():
+            self.update(self.visible_region)
+    
+    def paintEvent(self, event):
+        if not self.column_count:
+            return
+        cell_w, cell_h, baseline = self.cell_w, self.cell_h, self.baseline
+        atlas = self.glyph_atlas()
+        dpr = atlas.devicePixelRatio()
+        
+        # Every trail position of every column, then keep the visible ones
+        index = np.arange(self.MAX_LENGTH)
+        char_ys = (self.ys[:, None] + index * self.CHAR_SPACING).astype(np.int64)
+        lengths = self.lengths[:, None]
+        fades = np.maximum(0.0, 1.0 - index / lengths)
+        levels = np.rint(fades * (self.FADE_LEVELS - 1)).astype(np.int64)
+        keep = (index < lengths) & (char_ys >= -20) & (char_ys <= self.height() + 20) & (levels > 0)
+        if self.hidden is not None:
+            pad = self.CHAR_SPACING * self.MAX_LENGTH
+            rows = np.clip(char_ys - baseline + pad, 0, self.hidden.shape[1] - 1)
+            keep &= ~self.hidden[np.arange(self.column_count)[:, None], rows]
+        columns, slots = np.nonzero(keep)
+        if len(columns) == 0:
+            return
+        bands = np.where(slots < 2, 0, np.where(slots < 5, 1, 2))
+        digits = self.chars[columns, slots % self.TRAIL_CHARS]
+        
+        # QPainter.PixmapFragment: x, y (target centre), sourceLeft, sourceTop,
+        # width, height (source, atlas pixels), scaleX, scaleY, rotation, opacity
+        fragments = sip.array(QPainter.PixmapFragment, len(columns))
+        fields = np.frombuffer(memoryview(fragments), dtype=np.float64).reshape(len(columns), 10)
+        fields[:, 0] = self.xs[columns] - 1 + cell_w / 2
+        fields[:, 1] = char_ys[columns, slots] - baseline + cell_h / 2
+        fields[:, 2] = digits * cell_w * dpr
+        fields[:, 3] = (bands * self.FADE_LEVELS + levels[columns, slots]) * cell_h * dpr
+        fields[:, 4] = cell_w * dpr
+        fields[:, 5] = cell_h * dpr
+        fields[:, 6:8] = 1 / dpr
+        fields[:, 8] = 0.0
+        fields[:, 9] = 1.0
+        
+        painter = QPainter(self)
+        painter.drawPixmapFragments(fragments, atlas)
+        painter.end()
+
+
+class MechatronicsConsole(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Mechatronics Lab Control Console")
+        
+        # ============================================================
+        # WINDOW SETUP - RESOLUTION AWARE
+        # ============================================================
+        # Set window to match screen resolution
+        self.setGeometry(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        
+        # Maximize window on startup (fixes the "slightly offset" issue)
+        self.showMaximized()
+        
+        # Store references to child windows for cleanup
+        self.child_windows = []
+        
+        self.setup_ui()
+        self.apply_styles()
+        
+    def setup_ui(self):
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Matrix background
+        self.matrix_bg = MatrixBackground(central_widget)
+        self.matrix_bg.setGeometry(0, 0, self.width(), self.height())
+        self.matrix_bg.lower()
+        
+        self.main_layout = QVBoxLayout(central_widget)
+        self.main_layout.setContentsMargins(LEFT_MARGIN, TOP_MARGIN, LEFT_MARGIN, 10)
+        self.main_layout.setSpacing(10)
+        
+        # ============================================================
+        # WIDGET LAYOUT STRUCTURE
+        # Layout: [Motor+DAC+Profiles] [Mode Display + AI Terminal + Command RTT] [IR Sensor + Stopwatch]
+        # ============================================================
+        
+        widgets_container = QHBoxLayout()
+        widgets_container.setSpacing(WIDGET_SPACING)
+        widgets_container.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        
+        # ===== LEFT COLUMN: Motor Gauge + DAC Visualizer + Profiles =====
+        left_column = QVBoxLayout()
+        left_column.setSpacing(WIDGET_SPACING)
+        left_column.setAlignment(Qt.AlignTop)
+        
+        # Motor Gauge
+        self.motor_gauge = MotorGauge()
+        self.motor_gauge.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.motor_gauge.setAttribute(Qt.WA_TranslucentBackground)
+        self.motor_gauge.setFixedSize(MOTOR_GAUGE_WIDTH, MOTOR_GAUGE_HEIGHT)
+        self.gauge_placeholder = QWidget()
+        self.gauge_placeholder.setFixedSize(MOTOR_GAUGE_WIDTH, MOTOR_GAUGE_HEIGHT)
+        left_column.addWidget(self.gauge_placeholder, alignment=Qt.AlignTop)
+        
+        # DAC Visualizer (below motor gauge)
+        self.dac_visualizer = DualDACWidget()
+        self.dac_visualizer.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.dac_visualizer.setAttribute(Qt.WA_TranslucentBackground)
+        self.dac_visualizer.setFixedSize(DAC_VISUALIZER_WIDTH, DAC_VISUALIZER_HEIGHT)
+        self.dac_placeholder = QWidget()
+        self.dac_placeholder.setFixedSize(DAC_VISUALIZER_WIDTH, DAC_VISUALIZER_HEIGHT)
+        left_column.addWidget(self.dac_placeholder, alignment=Qt.AlignTop)
+        
+        # Operation Profiles Widget (below DAC)
+        self.profiles_widget = OperationProfilesWidget(serial_manager=None, motor_gauge=None)
+        self.profiles_widget.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.profiles_widget.setAttribute(Qt.WA_TranslucentBackground)
+        self.profiles_widget.setFixedSize(PROFILES_WIDGET_WIDTH, PROFILES_WIDGET_HEIGHT)
+        self.profiles_placeholder = QWidget()
+        self.profiles_placeholder.setFixedSize(PROFILES_WIDGET_WIDTH, PROFILES_WIDGET_HEIGHT)
+        left_column.addWidget(self.profiles_placeholder, alignment=Qt.AlignTop)
+        
+        widgets_container.addLayout(left_column)
+        
+        # ===== MIDDLE COLUMN: Mode Display + AI Terminal + Command RTT =====
+        middle_column = QVBoxLayout()
+        middle_column.setSpacing(WIDGET_SPACING)
+        middle_column.setAlignment(Qt.AlignTop)
+        
+        # Mode Display Widget (top)
+        self.mode_display = ModeDisplayWidget()
+        self.mode_display.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.mode_display.setAttribute(Qt.WA_TranslucentBackground)
+        self.mode_display.setFixedSize(MODE_DISPLAY_WIDTH, MODE_DISPLAY_HEIGHT)
+        self.mode_display_placeholder = QWidget()
+        self.mode_display_placeholder.setFixedSize(MODE_DISPLAY_WIDTH, MODE_DISPLAY_HEIGHT)
+        middle_column.addWidget(self.mode_display_placeholder, alignment=Qt.AlignTop)
+        
+        # ===== AI TERMINAL WIDGET (NEW - replaces PCB placeholder) =====
+        self.ai_terminal = AITerminalWidget()
+        self.ai_terminal.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.ai_terminal.setAttribute(Qt.WA_TranslucentBackground)
+        self.ai_terminal.setFixedSize(AI_TERMINAL_WIDTH, AI_TERMINAL_HEIGHT)
+        self.ai_terminal_placeholder = QWidget()
+        self.ai_terminal_placeholder.setFixedSize(AI_TERMINAL_WIDTH, AI_TERMINAL_HEIGHT)
+        middle_column.addWidget(self.ai_terminal_placeholder, alignment=Qt.AlignTop)
+        
+        # Command round-trip histogram (below AI terminal)
+        self.command_latency = CommandLatencyWidget()
+        self.command_latency.export_dir = SESSION_LOG_DIR
+        self.command_latency.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.command_latency.setAttribute(Qt.WA_TranslucentBackground)
+        self.command_latency.setFixedSize(COMMAND_LATENCY_WIDTH, COMMAND_LATENCY_HEIGHT)
+        self.command_latency_placeholder = QWidget()
+        self.command_latency_placeholder.setFixedSize(COMMAND_LATENCY_WIDTH, COMMAND_LATENCY_HEIGHT)
+        middle_column.addWidget(self.command_latency_placeholder, alignment=Qt.AlignTop)
+        
+        widgets_container.addLayout(middle_column)
+        
+        # ===== RIGHT COLUMN: IR Sensor Widget + Stopwatch =====
+        right_column = QVBoxLayout()
+        right_column.setSpacing(WIDGET_SPACING)
+        right_column.setAlignment(Qt.AlignTop)
+        
+        # IR Sensor Widget (top-right position)
+        self.ir_sensor = IRSensorWidget(serial_manager=None)
+        self.ir_sensor.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.ir_sensor.setAttribute(Qt.WA_TranslucentBackground)
+        self.ir_sensor.setFixedSize(IR_SENSOR_WIDTH, IR_SENSOR_HEIGHT)
+        self.ir_placeholder = QWidget()
+        self.ir_placeholder.setFixedSize(IR_SENSOR_WIDTH, IR_SENSOR_HEIGHT)
+        right_column.addWidget(self.ir_placeholder, alignment=Qt.AlignTop)
+        
+        # Stopwatch Widget (below IR sensor)
+        self.stopwatch = StopwatchControlWidget(serial_manager=None, motor_gauge=None)
+        self.stopwatch.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.stopwatch.setAttribute(Qt.WA_TranslucentBackground)
+        self.stopwatch.setFixedSize(STOPWATCH_WIDTH, STOPWATCH_HEIGHT)
+        self.stopwatch_placeholder = QWidget()
+        self.stopwatch_placeholder.setFixedSize(STOPWATCH_WIDTH, STOPWATCH_HEIGHT)
+        right_column.addWidget(self.stopwatch_placeholder, alignment=Qt.AlignTop)
+        
+        widgets_container.addLayout(right_column)
+        widgets_container.addStretch()  # Push all widgets to left/top
+        
+        self.main_layout.addLayout(widgets_container)
+        self.main_layout.addStretch()  # Push everything to top
+        
+        # ============================================================
+        # SERIAL MANAGER SHARING & CONNECTIONS
+        # ============================================================
+        # Optional event-driven backend (same interface as the motor gauge's manager)
+        if SERIAL_BACKEND == 'qt':
+            self.motor_gauge.serial_manager = QtSerialManager(self, telemetry_format=TELEMETRY_FORMAT,
+                                                              target_baud=SERIAL_BAUD_RATE)
+        elif SERIAL_BACKEND == 'asyncio':
+            self.motor_gauge.serial_manager = AsyncSerialBridge(self, telemetry_format=TELEMETRY_FORMAT,
+                                                                target_baud=SERIAL_BAUD_RATE)
+        
+        # Every sendSpeedCommand() (sliders, modes, stopwatch) goes through one scheduler
+        self.command_scheduler = SpeedCommandScheduler(self.motor_gauge.serial_manager, self,
+                                                       min_interval_ms=SPEED_COMMAND_INTERVAL_MS)
+        
+        # Share the motor gauge's serial manager with all widgets
+        self.ir_sensor.set_serial_manager(self.motor_gauge.serial_manager)
+        self.stopwatch.set_serial_manager(self.motor_gauge.serial_manager)
+        self.stopwatch.set_motor_gauge(self.motor_gauge)
+        
+        # Connect profiles widget to serial manager and motor gauge
+        self.profiles_widget.set_serial_manager(self.motor_gauge.serial_manager)
+        self.profiles_widget.set_motor_gauge(self.motor_gauge)
+        
+        # Connect profiles widget signal to mode display
+        self.profiles_widget.mode_changed.connect(self.mode_display.update_mode_display)
+        
+        # ============================================================
+        # DATA FLOW CONNECTIONS
+        # ============================================================
+        # One-way sync: Motor Gauge -> DAC Visualizer
+        self.motor_gauge.slider_a6.valueChanged.connect(lambda v: self.update_dac_from_gauge(v, 'a6'))
+        self.motor_gauge.slider_a7.valueChanged.connect(lambda v: self.update_dac_from_gauge(v, 'a7'))
+        
+        # ============================================================
+        # TELEMETRY SOURCE (SERIAL READER THREAD OR QSERIALPORT)
+        # ============================================================
+        # Exactly one object owns all reads from the shared port and fans
+        # parsed samples out to every widget (no more competing readline() calls)
+        if isinstance(self.motor_gauge.serial_manager, (QtSerialManager, AsyncSerialBridge)):
+            # readyRead / the asyncio loop already parse on arrival - no reader thread needed
+            self.serial_reader = None
+            self.telemetry_source = self.motor_gauge.serial_manager
+        else:
+            self.serial_reader = SerialReaderThread(self.motor_gauge.serial_manager, self,
+                                                    telemetry_format=TELEMETRY_FORMAT,
+                                                    target_baud=SERIAL_BAUD_RATE)
+            self.serial_reader.negotiating.connect(self.command_scheduler.hold)   # Port writes wait for the handshake
+            self.serial_reader.start()
+            self.telemetry_source = self.serial_reader
+        
+        self.telemetry_source.line_received.connect(self.on_arduino_line)
+        
+        # Shared telemetry history: filled first, so every slot below sees the new sample
+        self.telemetry_store = TelemetryStore(TELEMETRY_STORE_CAPACITY)
+        self.telemetry_source.sample_received.connect(self.telemetry_store.append)
+        self.ir_sensor.set_telemetry_store(self.telemetry_store)
+        self.render_scheduler = RenderScheduler(RENDER_FPS, self)
+        self.ir_sensor.set_render_scheduler(self.render_scheduler)
+        self.telemetry_source.sample_received.connect(self.ir_sensor.on_telemetry_sample)
+        self.telemetry_source.line_received.connect(self.ir_sensor.calibrator.on_line)
+        
+        # Command round trip: scheduler write -> calculateSpeeds() echo
+        # (the reader thread does the actual write for the pyserial backend: stamp it there)
+        sent = self.serial_reader.command_written if self.serial_reader else self.command_scheduler.command_sent
+        sent.connect(self.command_latency.tracker.on_command_sent)
+        self.telemetry_source.message_received.connect(self.command_latency.tracker.on_line)   # Stamped on arrival
+        
+        # Session recording while learning mode is active
+        self.session_recorder = SessionRecorder(SESSION_LOG_DIR, self)
+        self.profiles_widget.mode_changed.connect(self.session_recorder.on_mode_changed)
+        self.telemetry_source.sample_received.connect(self.session_recorder.on_sample)
+        self.command_scheduler.command_sent.connect(self.session_recorder.on_command_sent)
+        
+        # Robot events (line lost/reacquired, search flips, stuck sensors) derived once
+        # from the telemetry; subscribers react to events instead of raw lines
+        self.event_detector = EventDetector(self)
+        self.telemetry_source.sample_received.connect(self.event_detector.on_sample)
+        self.event_detector.event_detected.connect(self.ir_sensor.on_robot_event)
+        self.event_detector.event_detected.connect(self.session_recorder.on_event)
+        if hasattr(self.stopwatch, 'on_robot_event'):
+            self.event_detector.event_detected.connect(self.stopwatch.on_robot_event)
+        self.live_telemetry = True   # Detached while a session replay runs (set_live_telemetry)
+        
+        # ============================================================
+        # WINDOW POSITIONING TIMER
+        # ============================================================
+        # Timer to keep frameless widgets positioned correctly over placeholders
+        self.move_timer = QTimer(self)
+        self.move_timer.timeout.connect(self.update_widget_positions)
+        self.move_timer.start(50)  # Update every 50ms
+        
+        # Store child window references for cleanup
+        self.child_windows = [
+            self.motor_gauge, 
+            self.dac_visualizer, 
+            self.profiles_widget, 
+            self.mode_display,
+            self.ai_terminal,  # NEW: AI Terminal added
+            self.command_latency,
+            self.ir_sensor, 
+            self.stopwatch
+        ]
+        
+        # Show all child windows
+        self.motor_gauge.show()
+        self.dac_visualizer.show()
+        self.profiles_widget.show()
+        self.mode_display.show()
+        self.ai_terminal.show()  # NEW: Show AI Terminal
+        self.command_latency.show()
+        self.ir_sensor.show()
+        self.stopwatch.show()
+
+    def update_dac_from_gauge(self, percentage, motor):
+        """
+        Update DAC visualizer based on motor gauge percentage
+        Uses exact same formula as Arduino (2.55 * percentage)
+        """
+        byte_value = int(round(2.55 * percentage))
+        if byte_value > 255:
+            byte_value = 255
+        if byte_value < 0:
+            byte_value = 0
+        
+        self.dac_visualizer.update_pins(byte_value, motor)
+
+    def start_replay(self, path, speed=REPLAY_SPEED):
+        """
+        Animate the widgets from a recorded session (see SESSION_REPLAY.py)
+        
+        Live samples are detached until the replay finishes so the two streams never
+        interleave, and the session recorder is stopped (replayed events are not live ones)
+        """
+        if getattr(self, 'session_replay', None):
+            # Replaced: its finished can no longer fire, so drop it entirely
+            self.session_replay.close()
+            self.session_replay.deleteLater()
+        self.set_live_telemetry(False)
+        self.ir_sensor.set_latency_measurement(False)   # Replayed stamps are not receive times
+        self.session_replay = SessionReplay(path, speed=speed, mode_keys=OPERATION_MODES, parent=self)
+        self.session_replay.sample_received.connect(self.telemetry_store.append)
+        self.session_replay.sample_received.connect(self.ir_sensor.on_telemetry_sample)
+        self.event_detector.reset()
+        self.session_replay.sample_received.connect(self.event_detector.on_sample)
+        self.session_replay.command_replayed.connect(self.on_replayed_command)
+        self.session_replay.mode_replayed.connect(self.mode_display.update_mode_display)
+        self.session_replay.finished.connect(self.on_replay_finished)
+        self.session_replay.play()
+    
+    def on_replay_finished(self, stats):
+        """Back to live telemetry"""
+        self.event_detector.reset()
+        self.ir_sensor.set_latency_measurement(True)
+        self.set_live_telemetry(True)
+    
+    def set_live_telemetry(self, enabled):
+        """
+        Attach/detach the live source's samples (store first, as in __init__) and the
+        session recorder's inputs; detaching also closes the current recording
+        """
+        if enabled == self.live_telemetry:
+            return
+        self.live_telemetry = enabled
+        connections = (
+            (self.telemetry_source.sample_received, self.telemetry_store.append),
+            (self.telemetry_source.sample_received, self.ir_sensor.on_telemetry_sample),
+            (self.telemetry_source.sample_received, self.session_recorder.on_sample),
+            (self.telemetry_source.sample_received, self.event_detector.on_sample),
+            (self.event_detector.event_detected, self.session_recorder.on_event),
+            (self.profiles_widget.mode_changed, self.session_recorder.on_mode_changed),
+        )
+        for signal, slot in connections:
+            if enabled:
+                signal.connect(slot)
+            else:
+                signal.disconnect(slot)
+        if not enabled:
+            self.session_recorder.stop()
+        print(f"[Replay] Live telemetry {'attached' if enabled else 'detached'}")
+    
+    def on_replayed_command(self, command):
+        """Show a recorded S/L/R/M command on the DAC visualizer"""
+        speeds = self.command_latency.tracker.expected_speeds(command)
+        if speeds is None:
+            return
+        if speeds[0] is not None:
+            self.update_dac_from_gauge(speeds[0], 'a6')
+        if speeds[1] is not None:
+            self.update_dac_from_gauge(speeds[1], 'a7')
+    
+    def on_arduino_line(self, line):
+        """
+        Slot for SerialReaderThread.line_received
+        Echoes Arduino's Serial.print() debug output to the console
+        """
+        print(f"[Arduino Debug] {line}")
+
+    def update_widget_positions(self):
+        """
+        Update positions of all frameless child windows to match their placeholders
+        """
+        if not hasattr(self, 'gauge_placeholder'):
+            return
+        
+        # Motor Gauge position
+        gauge_pos = self.gauge_placeholder.mapToGlobal(QPoint(0, 0))
+        self.motor_gauge.move(gauge_pos)
+        
+        # DAC Visualizer position
+        dac_pos = self.dac_placeholder.mapToGlobal(QPoint(0, 0))
+        self.dac_visualizer.move(dac_pos)
+        
+        # Profiles Widget position
+        profiles_pos = self.profiles_placeholder.mapToGlobal(QPoint(0, 0))
+        self.profiles_widget.move(profiles_pos)
+        
+        # Mode Display position
+        mode_display_pos = self.mode_display_placeholder.mapToGlobal(QPoint(0, 0))
+        self.mode_display.move(mode_display_pos)
+        
+        # AI Terminal position (NEW)
+        ai_terminal_pos = self.ai_terminal_placeholder.mapToGlobal(QPoint(0, 0))
+        self.ai_terminal.move(ai_terminal_pos)
+        
+        # Command round-trip histogram position
+        command_latency_pos = self.command_latency_placeholder.mapToGlobal(QPoint(0, 0))
+        self.command_latency.move(command_latency_pos)
+        
+        # IR Sensor position
+        ir_pos = self.ir_placeholder.mapToGlobal(QPoint(0, 0))
+        self.ir_sensor.move(ir_pos)
+        
+        # Stopwatch position
+        stopwatch_pos = self.stopwatch_placeholder.mapToGlobal(QPoint(0, 0))
+        self.stopwatch.move(stopwatch_pos)
+        
+        # Matrix rain only animates where no panel covers it
+        panels = ((self.motor_gauge, self.gauge_placeholder), (self.dac_visualizer, self.dac_placeholder),
+                  (self.profiles_widget, self.profiles_placeholder),
+                  (self.mode_display, self.mode_display_placeholder),
+                  (self.ai_terminal, self.ai_terminal_placeholder),
+                  (self.command_latency, self.command_latency_placeholder),
+                  (self.ir_sensor, self.ir_placeholder), (self.stopwatch, self.stopwatch_placeholder))
+        self.matrix_bg.set_occluders(
+            [QRect(self.matrix_bg.mapFromGlobal(placeholder.mapToGlobal(QPoint(0, 0))), placeholder.size())
+             for panel, placeholder in panels if panel.isVisible()])
+
+    def resizeEvent(self, event):
+        """Handle window resize events"""
+        super().resizeEvent(event)
+        
+        if hasattr(self, 'matrix_bg'):
+            self.matrix_bg.setGeometry(0, 0, self.width(), self.height())
+        
+        self.update_widget_positions()
+
+    def closeEvent(self, event):
+        """
+        Close all child windows when main window closes
+        """
+        print("Closing main window and all child widgets...")
+        
+        for child_window in self.child_windows:
+            if child_window and child_window.isVisible():
+                child_window.close()
+        
+        if hasattr(self, 'move_timer'):
+            self.move_timer.stop()
+        if hasattr(self, 'command_scheduler'):
+            self.command_scheduler.flush()  # Last slider value still goes out (queued for the reader)
+        if getattr(self, 'serial_reader', None):
+            self.serial_reader.stop()   # Writes the queue before the thread exits
+        if hasattr(self, 'matrix_bg') and hasattr(self.matrix_bg, 'timer'):
+            self.matrix_bg.timer.stop()
+        
+        if getattr(self, 'session_replay', None):
+            self.session_replay.pause()
+        if hasattr(self, 'session_recorder'):
+            self.session_recorder.stop()
+        
+        if EXPORT_COMMAND_RTT_ON_CLOSE and hasattr(self, 'command_latency'):
+            self.command_latency.export()
+        
+        if hasattr(self.motor_gauge, 'serial_manager'):
+            if self.motor_gauge.serial_manager.is_connected:
+                self.motor_gauge.serial_manager.disconnect()
+                print("Serial connection closed.")
+        
+        event.accept()
+        print("All windows closed successfully.")
+
+    def apply_styles(self):
+        self.setStyleSheet("""
+            QMainWindow {
+                background-color: #08080F;
+            }
+            QWidget {
+                color: #FFFFFF;
+                font-family: 'Segoe UI', Arial, sans-serif;
+                font-size: 11pt;
+                background-color: transparent;
+            }
+        """)
+
+
+if __name__ == "__main__":
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    app = QApplication(sys.argv)
+    window = MechatronicsConsole()
+    window.show()
+    if '--replay' in sys.argv:
+        speed = float(sys.argv[sys.argv.index('--speed') + 1]) if '--speed' in sys.argv else REPLAY_SPEED
+        window.start_replay(sys.argv[sys.argv.index('--replay') + 1], speed)
     sys.exit(app.exec_())
\ No newline at end of file